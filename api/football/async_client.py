@@ -0,0 +1,128 @@
+"""
+Asyncio front-end for the Football API client.
+
+Requests are dispatched to a bounded thread pool that runs the regular
+FootballAPIClient._make_request, so Allure step logging and every layer
+configured on the synchronous client apply unchanged.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Optional
+
+import requests
+
+from api.football.client import FootballAPIClient
+from config.api_config import APIConfig
+from config.constants import ENDPOINTS
+
+
+class AsyncFootballAPIClient:
+    """
+    Async Football API client with a configurable concurrency limit.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        client: Optional[FootballAPIClient] = None,
+    ):
+        if max_concurrency is None:
+            max_concurrency = APIConfig.MAX_CONCURRENCY
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+        self.max_concurrency = max_concurrency
+
+        # A client passed in by the caller is used as configured and left open
+        self._owns_client = client is None
+        self.client = client or FootballAPIClient()
+
+        if self._owns_client:
+            # Size the connection pool to the concurrency limit so parallel
+            # requests reuse connections instead of discarding them
+            self.client.resize_pool(self.max_concurrency)
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="football-api"
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """
+        Shut down the worker pool without blocking the event loop, and close
+        the session of a client this instance created.
+        """
+        await asyncio.to_thread(self._executor.shutdown, wait=True)
+        if self._owns_client:
+            self.client.session.close()
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        data: Optional[Dict] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """Run the synchronous request on the bounded worker pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            lambda: self.client._make_request(
+                method, endpoint, params=params, data=data, **kwargs
+            ),
+        )
+
+    async def get_competitions(self) -> requests.Response:
+        return await self._make_request("GET", ENDPOINTS["competitions"])
+
+    async def get_competition_details(self, competition_id: int) -> requests.Response:
+        return await self._make_request(
+            "GET", ENDPOINTS["competition_details"].format(id=competition_id)
+        )
+
+    async def get_teams(self, competition_id: int) -> requests.Response:
+        return await self._make_request(
+            "GET", ENDPOINTS["teams"].format(competition_id=competition_id)
+        )
+
+    async def get_standings(self, competition_id: int) -> requests.Response:
+        return await self._make_request(
+            "GET", ENDPOINTS["standings"].format(competition_id=competition_id)
+        )
+
+    async def get_competition_scorers(self, competition_id: int) -> requests.Response:
+        return await self._make_request(
+            "GET", ENDPOINTS["competition_scorers"].format(id=competition_id)
+        )
+
+    async def gather_many(
+        self,
+        endpoint: str,
+        ids: Iterable[Any],
+        method: str = "GET",
+        return_exceptions: bool = False,
+    ) -> Dict[Any, Any]:
+        """
+        Fetch one ENDPOINTS path for many IDs concurrently.
+
+        Args:
+            endpoint: Key in ENDPOINTS with a single placeholder, e.g. "standings"
+            ids: Values substituted into the endpoint placeholder
+            method: HTTP method to use
+            return_exceptions: Return request errors in the result instead of raising
+
+        Returns:
+            Dictionary mapping each ID to its response (or exception)
+        """
+        paths = {item_id: APIConfig.endpoint_path(endpoint, item_id) for item_id in ids}
+        responses = await asyncio.gather(
+            *(self._make_request(method, path) for path in paths.values()),
+            return_exceptions=return_exceptions,
+        )
+        return dict(zip(paths, responses))
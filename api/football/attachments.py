@@ -0,0 +1,132 @@
+"""
+Allure attachment pipeline for Football API responses.
+
+Response bodies are attached as the raw bytes already held by the
+response, so the body is never parsed or re-serialized just for the
+report. Identical bodies are attached once per test (by content hash),
+and in "on_failure" mode bodies are buffered and only written when the
+test fails.
+
+Modes:
+    off        - no response attachments
+    headers    - status code and response headers only
+    truncated  - body capped at ATTACHMENT_MAX_BYTES
+    full       - complete body
+    on_failure - complete body, attached only for failing tests
+"""
+
+import hashlib
+import json
+import threading
+from typing import List, Optional, Set, Tuple
+
+import allure
+import requests
+
+from config.api_config import APIConfig
+
+ATTACHMENT_MODES = ("off", "headers", "truncated", "full", "on_failure")
+
+# Per-test state, reset by end_test() from the pytest report hook
+_lock = threading.Lock()
+_attached_hashes: Set[str] = set()
+_pending: List[Tuple[str, bytes, str]] = []
+
+
+def _body_attachment_type(body: bytes, content_type: str):
+    """
+    Pick JSON or TEXT without parsing the body.
+
+    Some endpoints send "{comp1,comp2}" strings with a JSON content type,
+    so the first characters are checked as well.
+    """
+    head = body[:64].lstrip()
+    looks_like_json = head.startswith((b'{"', b"[", b"{}"))
+    if "json" in content_type and looks_like_json:
+        return allure.attachment_type.JSON
+    return allure.attachment_type.TEXT
+
+
+def _attach_body(name: str, body: bytes, content_type: str) -> None:
+    digest = hashlib.sha1(body).hexdigest()
+    with _lock:
+        duplicate = digest in _attached_hashes
+        _attached_hashes.add(digest)
+
+    if duplicate:
+        allure.attach(
+            f"Identical to an earlier response body in this test (sha1 {digest})",
+            name=name,
+            attachment_type=allure.attachment_type.TEXT,
+        )
+        return
+
+    allure.attach(
+        body, name=name, attachment_type=_body_attachment_type(body, content_type)
+    )
+
+
+def flush_pending() -> None:
+    """Attach every buffered body (called when a test fails)"""
+    with _lock:
+        pending = list(_pending)
+        _pending.clear()
+    for name, body, content_type in pending:
+        _attach_body(name, body, content_type)
+
+
+def end_test(failed: bool) -> None:
+    """Flush buffered bodies for failed tests and reset per-test state"""
+    if failed:
+        flush_pending()
+    with _lock:
+        _pending.clear()
+        _attached_hashes.clear()
+
+
+class ResponseAttacher:
+    """
+    Attaches API responses to the Allure report according to a mode.
+    """
+
+    def __init__(self, mode: Optional[str] = None, max_bytes: Optional[int] = None):
+        self.mode = mode or APIConfig.ATTACHMENT_MODE
+        self.max_bytes = (
+            max_bytes if max_bytes is not None else APIConfig.ATTACHMENT_MAX_BYTES
+        )
+        if self.mode not in ATTACHMENT_MODES:
+            raise ValueError(f"Invalid attachment mode: {self.mode}")
+
+    def attach(self, response: requests.Response) -> None:
+        if self.mode == "off":
+            return
+
+        if self.mode == "headers":
+            allure.attach(
+                json.dumps(dict(response.headers), indent=2),
+                name="Response Headers",
+                attachment_type=allure.attachment_type.JSON,
+            )
+            return
+
+        body = response.content
+        if not body:
+            return
+
+        content_type = response.headers.get("Content-Type", "")
+
+        if self.mode == "on_failure":
+            with _lock:
+                _pending.append(("Response Body", body, content_type))
+            return
+
+        if self.mode == "truncated" and len(body) > self.max_bytes:
+            allure.attach(
+                body[: self.max_bytes]
+                + f"\n... truncated ({len(body)} bytes total)".encode(),
+                name="Response Body (truncated)",
+                attachment_type=allure.attachment_type.TEXT,
+            )
+            return
+
+        _attach_body("Response Body", body, content_type)
@@ -0,0 +1,242 @@
+"""
+Persistent on-disk HTTP response cache for the Football API client.
+
+Each entry is a single zlib-compressed file holding a small JSON header
+(status, headers, timestamps) followed by the raw response body. Entries
+expire per endpoint TTL, are revalidated with ETag/Last-Modified when
+possible and are evicted least-recently-used once the size cap is hit.
+"""
+
+import hashlib
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from config.api_config import APIConfig
+
+_HEADER_SIZE = struct.Struct(">I")
+_ENTRY_SUFFIX = ".entry"
+
+# Describe the wire encoding, not the decoded body that gets stored
+_TRANSPORT_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+def storable_headers(headers) -> Dict[str, str]:
+    """Response headers without the ones describing the wire encoding"""
+    return {
+        name: value
+        for name, value in headers.items()
+        if name.lower() not in _TRANSPORT_HEADERS
+    }
+
+
+class CacheEntry:
+    """A cached response together with its freshness metadata"""
+
+    __slots__ = ("status_code", "headers", "url", "body", "stored_at", "ttl")
+
+    def __init__(self, status_code, headers, url, body, stored_at, ttl):
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers)
+        self.url = url
+        self.body = body
+        self.stored_at = stored_at
+        self.ttl = ttl
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() - self.stored_at < self.ttl
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidating this entry"""
+        validators = {}
+        if "ETag" in self.headers:
+            validators["If-None-Match"] = self.headers["ETag"]
+        if "Last-Modified" in self.headers:
+            validators["If-Modified-Since"] = self.headers["Last-Modified"]
+        return validators
+
+    def to_response(self) -> requests.Response:
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.url = self.url
+        response._content = self.body
+        response._content_consumed = True
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.from_cache = True
+        return response
+
+    def encode(self) -> bytes:
+        header = json.dumps(
+            {
+                "status_code": self.status_code,
+                "headers": dict(self.headers),
+                "url": self.url,
+                "stored_at": self.stored_at,
+                "ttl": self.ttl,
+            },
+            separators=(",", ":"),
+        ).encode()
+        return zlib.compress(_HEADER_SIZE.pack(len(header)) + header + self.body)
+
+    @classmethod
+    def decode(cls, blob: bytes) -> "CacheEntry":
+        raw = zlib.decompress(blob)
+        (header_len,) = _HEADER_SIZE.unpack_from(raw)
+        start = _HEADER_SIZE.size
+        header = json.loads(raw[start : start + header_len])
+        return cls(body=raw[start + header_len :], **header)
+
+
+class ResponseCache:
+    """
+    Size-capped, LRU-evicting response cache stored under a directory.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        max_bytes: Optional[int] = None,
+        ttls: Optional[Dict[str, int]] = None,
+        default_ttl: Optional[int] = None,
+    ):
+        self.directory = Path(directory or APIConfig.CACHE_DIR)
+        self.max_bytes = (
+            max_bytes if max_bytes is not None else APIConfig.CACHE_MAX_BYTES
+        )
+        self.ttls = ttls if ttls is not None else APIConfig.CACHE_TTLS
+        self.default_ttl = (
+            default_ttl if default_ttl is not None else APIConfig.CACHE_DEFAULT_TTL
+        )
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # Running total of entry sizes; the directory is only rescanned to evict
+        self._size = sum(size for _, size, _ in self._scan())
+
+    @staticmethod
+    def make_key(method: str, url: str, params: Optional[Dict] = None) -> str:
+        """Build the cache key from method, URL and sorted query parameters"""
+        canonical = json.dumps(
+            [method.upper(), url, sorted((params or {}).items())],
+            default=str,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def ttl_for(self, endpoint: str) -> int:
+        """Return the TTL in seconds for a request path"""
+        key = APIConfig.resolve_endpoint(endpoint)
+        return self.ttls.get(key, self.default_ttl)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{_ENTRY_SUFFIX}"
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Return the entry for key (fresh or stale), marking it recently used"""
+        path = self._path(key)
+        try:
+            entry = CacheEntry.decode(path.read_bytes())
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (zlib.error, struct.error, ValueError):
+            path.unlink(missing_ok=True)
+            return None
+        return entry
+
+    def put(self, key: str, response: requests.Response, ttl: int) -> None:
+        """Store a response and evict old entries if over the size cap"""
+        entry = CacheEntry(
+            status_code=response.status_code,
+            headers=storable_headers(response.headers),
+            url=response.url,
+            body=response.content,
+            stored_at=time.time(),
+            ttl=ttl,
+        )
+        self._write(key, entry)
+
+    def touch(
+        self,
+        key: str,
+        entry: CacheEntry,
+        response: Optional[requests.Response] = None,
+    ) -> None:
+        """
+        Mark a revalidated entry as fresh again, taking over the headers
+        (Date, ETag, Cache-Control, ...) sent with the 304 response
+        """
+        if response is not None:
+            entry.headers.update(storable_headers(response.headers))
+        entry.stored_at = time.time()
+        self._write(key, entry)
+
+    def _write(self, key: str, entry: CacheEntry) -> None:
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}")
+        blob = entry.encode()
+        tmp_path.write_bytes(blob)
+        with self._lock:
+            try:
+                replaced = path.stat().st_size
+            except FileNotFoundError:
+                replaced = 0
+            os.replace(tmp_path, path)
+            self._size += len(blob) - replaced
+            over = self._size > self.max_bytes
+        if over:
+            self._evict()
+
+    def _scan(self):
+        """(mtime, size, path) of every entry file"""
+        entries = []
+        for item in os.scandir(self.directory):
+            if not item.name.endswith(_ENTRY_SUFFIX):
+                continue
+            try:
+                stat = item.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, item.path))
+        return entries
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until under max_bytes"""
+        with self._lock:
+            # Rescan: other workers may share the directory
+            entries = sorted(self._scan())
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+            self._size = total
+
+    def clear(self) -> None:
+        """Remove every cached entry"""
+        for item in os.scandir(self.directory):
+            if item.name.endswith(_ENTRY_SUFFIX):
+                os.remove(item.path)
+        with self._lock:
+            self._size = 0
+
+    def lookup(
+        self, method: str, url: str, params: Optional[Dict] = None
+    ) -> Tuple[str, Optional[CacheEntry]]:
+        """Return the cache key and any stored entry for a request"""
+        key = self.make_key(method, url, params)
+        return key, self.get(key)
@@ -0,0 +1,244 @@
+"""
+Record/replay cassettes for the Football API client.
+
+A cassette is a JSON file of recorded request/response interactions.
+In "record" mode every real response is appended to the cassette; in
+"replay" mode requests are answered from the cassette without touching
+the network. Request headers are never recorded, so API keys stay out
+of the file.
+
+Recording appends each interaction to a per-process journal
+(<cassette>.<pid>.jsonl). flush(), called at interpreter exit, merges
+the journal into the cassette under a file lock, so xdist workers
+recording in parallel all keep their interactions.
+"""
+
+import atexit
+import base64
+import json
+import os
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from api.football.cache import storable_headers
+from config.api_config import APIConfig
+
+try:
+    import fcntl
+except ImportError:  # Windows: merges are serialized within the process only
+    fcntl = None
+
+MODES = ("record", "replay")
+MATCH_MODES = ("exact", "fuzzy")
+
+
+class CassetteMissError(requests.exceptions.RequestException):
+    """Raised in strict replay mode when a request was never recorded"""
+
+
+class Cassette:
+    """
+    Stores and replays API interactions from a JSON file.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        mode: Optional[str] = None,
+        match: Optional[str] = None,
+        strict: Optional[bool] = None,
+    ):
+        self.path = Path(path or APIConfig.CASSETTE_PATH)
+        self.mode = mode or APIConfig.CASSETTE_MODE
+        self.match = match or APIConfig.CASSETTE_MATCH
+        self.strict = strict if strict is not None else APIConfig.CASSETTE_STRICT
+
+        if self.mode not in MODES:
+            raise ValueError(f"Invalid cassette mode: {self.mode}")
+        if self.match not in MATCH_MODES:
+            raise ValueError(f"Invalid cassette match mode: {self.match}")
+
+        self._lock = threading.Lock()
+        self._interactions: List[Dict] = []
+        self._index: Dict[tuple, List[Dict]] = defaultdict(list)
+        self._play_counts: Dict[tuple, int] = defaultdict(int)
+        self._journal_path = self.path.with_name(
+            f"{self.path.name}.{os.getpid()}.jsonl"
+        )
+        self._journal = None
+
+        if self.path.exists():
+            for interaction in self._read_interactions():
+                self._add(interaction)
+        elif self.mode == "replay" and self.strict:
+            raise FileNotFoundError(f"Cassette not found: {self.path}")
+
+    @property
+    def is_recording(self) -> bool:
+        return self.mode == "record"
+
+    @property
+    def is_replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def __len__(self):
+        return len(self._interactions)
+
+    def _match_key(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict] = None,
+        data: Optional[Dict] = None,
+    ) -> tuple:
+        """
+        Build the lookup key for a request.
+
+        Exact matching compares method, URL, query parameters and body.
+        Fuzzy matching only compares method and path, ignoring host,
+        query string and body.
+        """
+        parts = urlsplit(url)
+        if self.match == "fuzzy":
+            return method.upper(), parts.path.rstrip("/")
+
+        query = parse_qsl(parts.query) + [
+            (str(k), str(v)) for k, v in (params or {}).items()
+        ]
+        body = json.dumps(data, sort_keys=True) if data is not None else None
+        return (
+            method.upper(),
+            f"{parts.scheme}://{parts.netloc}{parts.path}",
+            tuple(sorted(query)),
+            body,
+        )
+
+    def _add(self, interaction: Dict) -> None:
+        request = interaction["request"]
+        key = self._match_key(
+            request["method"], request["url"], request["params"], request["data"]
+        )
+        self._interactions.append(interaction)
+        self._index[key].append(interaction)
+
+    def play(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict] = None,
+        data: Optional[Dict] = None,
+    ) -> Optional[requests.Response]:
+        """
+        Return the recorded response for a request.
+
+        Repeated identical requests replay their recordings in order and
+        then keep returning the last one.
+
+        Raises:
+            CassetteMissError in strict mode if nothing was recorded
+        """
+        key = self._match_key(method, url, params, data)
+        with self._lock:
+            recordings = self._index.get(key)
+            if not recordings:
+                if self.strict:
+                    raise CassetteMissError(
+                        f"No recorded interaction for {method} {url} "
+                        f"(params={params}) in {self.path}"
+                    )
+                return None
+            position = min(self._play_counts[key], len(recordings) - 1)
+            self._play_counts[key] += 1
+
+        return self._to_response(recordings[position]["response"])
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict],
+        data: Optional[Dict],
+        response: requests.Response,
+    ) -> None:
+        """Append an interaction to this process's journal"""
+        content = response.content
+        try:
+            body, encoding = content.decode("utf-8"), "utf-8"
+        except UnicodeDecodeError:
+            body, encoding = base64.b64encode(content).decode("ascii"), "base64"
+
+        interaction = {
+            "request": {
+                "method": method.upper(),
+                "url": url,
+                "params": params,
+                "data": data,
+            },
+            "response": {
+                "status_code": response.status_code,
+                "url": response.url,
+                "headers": storable_headers(response.headers),
+                "body": body,
+                "encoding": encoding,
+            },
+        }
+        with self._lock:
+            self._add(interaction)
+            if self._journal is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._journal = open(self._journal_path, "a")
+                atexit.register(self.flush)
+            self._journal.write(json.dumps(interaction) + "\n")
+            self._journal.flush()
+
+    def flush(self) -> None:
+        """
+        Merge the journal into the cassette file. The cassette is re-read
+        under an exclusive lock, so interactions merged by other processes
+        since this one started are kept.
+        """
+        with self._lock:
+            if self._journal is None:
+                return
+            self._journal.close()
+            self._journal = None
+            with open(self._journal_path) as f:
+                recorded = [json.loads(line) for line in f if line.strip()]
+
+            with open(self.path.with_name(f"{self.path.name}.lock"), "a") as lock:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_EX)
+                interactions = self._read_interactions() + recorded
+                tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+                with open(tmp_path, "w") as f:
+                    json.dump({"interactions": interactions}, f, indent=2)
+                os.replace(tmp_path, self.path)
+            self._journal_path.unlink()
+
+    def _read_interactions(self) -> List[Dict]:
+        try:
+            with open(self.path) as f:
+                return json.load(f)["interactions"]
+        except FileNotFoundError:
+            return []
+
+    @staticmethod
+    def _to_response(recorded: Dict) -> requests.Response:
+        response = requests.Response()
+        response.status_code = recorded["status_code"]
+        response.url = recorded["url"]
+        response.headers = CaseInsensitiveDict(recorded["headers"])
+        if recorded["encoding"] == "base64":
+            response._content = base64.b64decode(recorded["body"])
+        else:
+            response._content = recorded["body"].encode("utf-8")
+        response._content_consumed = True
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.from_cassette = True
+        return response
@@ -1,18 +1,286 @@
 import requests
 import allure
-from typing import Dict, Optional
+from typing import Any, Dict, Iterable, Optional
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from api.football.attachments import ResponseAttacher
+from api.football.cache import ResponseCache
+from api.football.cassette import Cassette
+from api.football.metrics import (
+    LatencyRecorder,
+    TimedHTTPAdapter,
+    latency_recorder,
+    pop_connect_time,
+    reset_connect_time,
+)
+from api.football.rate_limit import RetryPolicy, TokenBucket
+from api.football.single_flight import SingleFlight
 from config.api_config import APIConfig
 from config.constants import ENDPOINTS
 
 
+def copy_response(response: requests.Response) -> requests.Response:
+    """
+    Independent copy of a fully read response, so callers sharing one
+    round trip can each modify (or wrap methods of) their own object.
+    """
+    copy = requests.Response()
+    copy.__setstate__(response.__getstate__())
+    copy.headers = response.headers.copy()
+    copy.history = list(response.history)
+    return copy
+
+
 class FootballAPIClient:
-    def __init__(self):
+    def __init__(
+        self,
+        cache: Optional[ResponseCache] = None,
+        cassette: Optional[Cassette] = None,
+        attacher: Optional[ResponseAttacher] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        metrics: Optional[LatencyRecorder] = None,
+    ):
+        if cassette is None and APIConfig.CASSETTE_MODE != "off":
+            cassette = Cassette()
+        self.cassette = cassette
         self.base_url = APIConfig.FOOTBALL_API_BASE_URL
-        self.headers = APIConfig.HEADERS
+        self.headers = self._auth_headers()
         self.timeout = APIConfig.TIMEOUT
         self.session = requests.Session()
         self.session.headers.update(self.headers)
+        if cache is None and APIConfig.CACHE_ENABLED:
+            cache = ResponseCache()
+        self.cache = cache
+        self.attacher = attacher or ResponseAttacher()
+        if rate_limiter is None and APIConfig.RATE_LIMIT_PER_SECOND > 0:
+            rate_limiter = TokenBucket(state_file=APIConfig.RATE_LIMIT_STATE_FILE)
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy()
+        self._in_flight = SingleFlight()
+        self.metrics = metrics if metrics is not None else latency_recorder
+
+        # Allow one pooled connection per concurrent batch worker
+        self.resize_pool(APIConfig.MAX_CONCURRENCY)
+
+    def _auth_headers(self) -> Dict[str, str]:
+        """
+        RapidAPI headers. Replaying a cassette needs no credentials, so a
+        missing RAPIDAPI_KEY only raises outside replay mode.
+        """
+        try:
+            return dict(APIConfig.HEADERS)
+        except ValueError:
+            if self.cassette is None or not self.cassette.is_replaying:
+                raise
+            return {"X-RapidAPI-Host": APIConfig.RAPIDAPI_HOST}
+
+    def resize_pool(self, size: int) -> None:
+        """Mount a timed connection pool holding up to size connections"""
+        adapter = TimedHTTPAdapter(pool_connections=size, pool_maxsize=size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _coalesced_send(
+        self,
+        method: str,
+        endpoint: str,
+        url: str,
+        params: Optional[Dict] = None,
+        data: Optional[Dict] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """Share one in-flight GET between concurrent identical callers"""
+
+        if method.upper() != "GET" or data is not None or kwargs:
+            return self._send(method, endpoint, url, params=params, data=data, **kwargs)
+
+        key = (url, tuple(sorted((str(k), str(v)) for k, v in (params or {}).items())))
+        response, shared = self._in_flight.do(
+            key, lambda: self._send(method, endpoint, url, params=params)
+        )
+        if shared:
+            response = copy_response(response)
+            allure.attach(
+                "Response shared with an identical in-flight request",
+                name="Coalesced Request",
+                attachment_type=allure.attachment_type.TEXT,
+            )
+        return response
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        url: str,
+        params: Optional[Dict] = None,
+        data: Optional[Dict] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """Send the request, replaying or recording it when a cassette is set"""
+
+        if self.cassette is not None and self.cassette.is_replaying:
+            response = self.cassette.play(method, url, params, data)
+            if response is not None:
+                return response
+
+        response = self._fetch(
+            method, endpoint, url, params=params, data=data, **kwargs
+        )
+
+        if self.cassette is not None and self.cassette.is_recording:
+            self.cassette.record(method, url, params, data, response)
+
+        return response
+
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        url: str,
+        params: Optional[Dict] = None,
+        data: Optional[Dict] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """Perform the HTTP request, throttled and retried on 429/5xx"""
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+
+            try:
+                response = self._attempt(
+                    method, endpoint, url, params=params, data=data, **kwargs
+                )
+            except (
+                requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout,
+            ) as e:
+                if not self.retry_policy.can_retry(attempt, method):
+                    raise
+                delay = self.retry_policy.delay(attempt)
+                self._log_retry(f"{type(e).__name__}: {e}", attempt, delay)
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            if self.rate_limiter is not None:
+                self.rate_limiter.update_from_headers(response.headers)
+
+            if not self.retry_policy.should_retry(attempt, response, method):
+                return response
+
+            delay = self.retry_policy.delay(attempt, response)
+            self._log_retry(f"HTTP {response.status_code}", attempt, delay)
+            if (
+                response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+                and self.rate_limiter is not None
+            ):
+                # Hold back every request sharing the bucket, not just this one
+                self.rate_limiter.block_for(delay)
+            else:
+                time.sleep(delay)
+            attempt += 1
+
+    def _attempt(
+        self,
+        method: str,
+        endpoint: str,
+        url: str,
+        params: Optional[Dict] = None,
+        data: Optional[Dict] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Send the request once over the network: no throttling, retries,
+        cache or cassette. Used directly by latency sampling and load runs.
+        """
+        reset_connect_time()
+        start = time.perf_counter()
+        response = self.session.request(
+            method=method,
+            url=url,
+            params=params,
+            json=data,
+            timeout=self.timeout,
+            **kwargs,
+        )
+        self._record_transfer(endpoint, response, time.perf_counter() - start)
+        return response
+
+    def _record_transfer(
+        self, endpoint: str, response: requests.Response, elapsed: float
+    ) -> None:
+        """Split one network round trip into connect/ttfb/download phases"""
+        connect = pop_connect_time()
+        headers_received = response.elapsed.total_seconds()
+        self.metrics.record(endpoint, "connect", connect)
+        self.metrics.record(endpoint, "ttfb", max(0.0, headers_received - connect))
+        self.metrics.record(endpoint, "download", max(0.0, elapsed - headers_received))
+
+    def _timed_json(self, endpoint: str, response: requests.Response):
+        """Make response.json() record its decoding time as the parse phase"""
+        if getattr(response, "_parse_timed", False):
+            return
+        parse = response.json
+
+        def timed_json(**kwargs):
+            start = time.perf_counter()
+            try:
+                return parse(**kwargs)
+            finally:
+                self.metrics.record(endpoint, "parse", time.perf_counter() - start)
+
+        response.json = timed_json
+        response._parse_timed = True
+
+    @staticmethod
+    def _log_retry(reason: str, attempt: int, delay: float) -> None:
+        allure.attach(
+            f"{reason}; retry {attempt + 1} in {delay:.2f}s",
+            name="Retry",
+            attachment_type=allure.attachment_type.TEXT,
+        )
+
+    def _fetch(
+        self,
+        method: str,
+        endpoint: str,
+        url: str,
+        params: Optional[Dict] = None,
+        data: Optional[Dict] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """Send the request, serving GETs from the response cache when enabled"""
+
+        if self.cache is None or method.upper() != "GET" or data is not None:
+            return self._request(
+                method, endpoint, url, params=params, data=data, **kwargs
+            )
+
+        key, entry = self.cache.lookup(method, url, params)
+        if entry is not None and entry.is_fresh:
+            return entry.to_response()
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        if entry is not None:
+            headers.update(entry.validators)
+
+        response = self._request(
+            method, endpoint, url, params=params, headers=headers, **kwargs
+        )
+
+        if response.status_code == HTTPStatus.NOT_MODIFIED and entry is not None:
+            self.cache.touch(key, entry, response)
+            return entry.to_response()
+
+        cache_control = response.headers.get("Cache-Control", "")
+        if response.status_code == HTTPStatus.OK and "no-store" not in cache_control:
+            self.cache.put(key, response, self.cache.ttl_for(endpoint))
+
+        return response
 
     def _make_request(
         self,
@@ -35,28 +303,14 @@ class FootballAPIClient:
             )
 
             try:
-                response = self.session.request(
-                    method=method,
-                    url=url,
-                    params=params,
-                    json=data,
-                    timeout=self.timeout,
-                    **kwargs,
+                start = time.perf_counter()
+                response = self._coalesced_send(
+                    method, endpoint, url, params=params, data=data, **kwargs
                 )
+                self.metrics.record(endpoint, "total", time.perf_counter() - start)
+                self._timed_json(endpoint, response)
 
-                if response.content:
-                    try:
-                        allure.attach(
-                            json.dumps(response.json(), indent=2),
-                            name="Response Body",
-                            attachment_type=allure.attachment_type.JSON,
-                        )
-                    except json.JSONDecodeError:
-                        allure.attach(
-                            response.text,
-                            name="Response Body",
-                            attachment_type=allure.attachment_type.TEXT,
-                        )
+                self.attacher.attach(response)
 
                 allure.attach(
                     str(response.status_code),
@@ -76,3 +330,67 @@ class FootballAPIClient:
 
     def get_competitions(self) -> requests.Response:
         return self._make_request("GET", ENDPOINTS["competitions"])
+
+    def get_competition_details(self, competition_id: int) -> requests.Response:
+        return self._make_request(
+            "GET", ENDPOINTS["competition_details"].format(id=competition_id)
+        )
+
+    def get_teams(self, competition_id: int) -> requests.Response:
+        return self._make_request(
+            "GET", ENDPOINTS["teams"].format(competition_id=competition_id)
+        )
+
+    def get_standings(self, competition_id: int) -> requests.Response:
+        return self._make_request(
+            "GET", ENDPOINTS["standings"].format(competition_id=competition_id)
+        )
+
+    def get_competition_scorers(self, competition_id: int) -> requests.Response:
+        return self._make_request(
+            "GET", ENDPOINTS["competition_scorers"].format(id=competition_id)
+        )
+
+    def get_many(
+        self,
+        endpoint: str,
+        ids: Iterable[Any],
+        max_workers: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> Dict[Any, Any]:
+        """
+        Fetch one ENDPOINTS path for many IDs concurrently.
+
+        Duplicate IDs are requested once, and identical requests already
+        in flight from other threads are shared.
+
+        Args:
+            endpoint: Key in ENDPOINTS with a single placeholder, e.g. "standings"
+            ids: Values substituted into the endpoint placeholder
+            max_workers: Concurrent requests (defaults to APIConfig.MAX_CONCURRENCY)
+            return_exceptions: Return request errors in the result instead of raising
+
+        Returns:
+            Dictionary mapping each ID to its response (or exception)
+        """
+        paths = {item_id: APIConfig.endpoint_path(endpoint, item_id) for item_id in ids}
+        if not paths:
+            return {}
+
+        workers = min(max_workers or APIConfig.MAX_CONCURRENCY, len(paths))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="football-api"
+        ) as executor:
+            futures = {
+                item_id: executor.submit(self._make_request, "GET", path)
+                for item_id, path in paths.items()
+            }
+            results = {}
+            for item_id, future in futures.items():
+                try:
+                    results[item_id] = future.result()
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    results[item_id] = e
+            return results
@@ -0,0 +1,353 @@
+"""
+Alias and fuzzy matching over the competitions catalog.
+
+CompetitionIndex normalizes competition names once. Alias patterns are
+compiled into an Aho–Corasick automaton, so every pattern is located
+in a single pass over the names, however many aliases there are.
+Fuzzy lookups go through a trigram inverted index (TrigramIndex) that
+scores candidates with the Dice coefficient and can be cached on disk
+next to the catalog it was built from.
+
+Usage:
+    index = CompetitionIndex(parse_competitions_string(response.text))
+    found, missing = index.resolve({"la_liga": ["laliga", "primeradivision"]})
+    index.fuzzy("fifa world cup", k=3)  # [("FIFA World Cup", 1.0), ...]
+"""
+
+import hashlib
+import json
+import os
+import zlib
+from collections import deque
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from config.constants import TEST_COMPETITIONS
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase and drop spaces, hyphens and underscores"""
+    return name.lower().replace("_", "").replace(" ", "").replace("-", "")
+
+
+class AhoCorasick:
+    """
+    Multi-pattern substring automaton.
+
+    Nodes are stored as parallel lists: goto transitions, failure links
+    and the IDs of the patterns ending at each node (failure outputs
+    merged in).
+    """
+
+    def __init__(self, patterns: Sequence[str]):
+        self.patterns = list(patterns)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[int, ...]] = [()]
+
+        outputs: List[List[int]] = [[]]
+        for pattern_id, pattern in enumerate(self.patterns):
+            node = 0
+            for char in pattern:
+                child = self._goto[node].get(char)
+                if child is None:
+                    child = self._goto[node][char] = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append([])
+                node = child
+            outputs[node].append(pattern_id)
+
+        # Breadth-first failure links; each node inherits its fallback's outputs
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                outputs[child].extend(outputs[self._fail[child]])
+                queue.append(child)
+        self._output = [tuple(ids) for ids in outputs]
+
+    def search(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Yield (end position, pattern ID) for every occurrence in text"""
+        goto, fail, output = self._goto, self._fail, self._output
+        node = 0
+        for position, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for pattern_id in output[node]:
+                yield position, pattern_id
+
+
+@lru_cache(maxsize=64)
+def _compile(patterns: Tuple[str, ...]) -> AhoCorasick:
+    return AhoCorasick(patterns)
+
+
+def trigrams(text: str) -> List[str]:
+    """Distinct trigrams of a normalized string padded with word boundaries"""
+    padded = f"$${text}$"
+    return list(dict.fromkeys(padded[i : i + 3] for i in range(len(padded) - 2)))
+
+
+class TrigramIndex:
+    """
+    Inverted index from trigram to the IDs of the strings containing it.
+
+    Candidates are scored with the Dice coefficient of their trigram
+    sets, 2 * shared / (query grams + candidate grams), computed for all
+    candidates at once with NumPy.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, strings: Sequence[str]):
+        self.strings = list(strings)
+        postings: Dict[str, List[int]] = {}
+        sizes = []
+        for string_id, text in enumerate(self.strings):
+            grams = trigrams(text)
+            sizes.append(len(grams))
+            for gram in grams:
+                postings.setdefault(gram, []).append(string_id)
+        self._set_postings(postings, sizes)
+
+    def _set_postings(self, postings: Dict[str, List[int]], sizes: List[int]):
+        self._postings = {
+            gram: np.asarray(ids, dtype=np.int32) for gram, ids in postings.items()
+        }
+        self._sizes = np.asarray(sizes, dtype=np.int32)
+
+    @staticmethod
+    def fingerprint(strings: Sequence[str]) -> str:
+        """SHA-1 of the indexed strings, used to detect a stale cache"""
+        return hashlib.sha1("\n".join(strings).encode("utf-8")).hexdigest()
+
+    def search(
+        self, query: str, k: int = 5, min_score: float = 0.0
+    ) -> List[Tuple[int, float]]:
+        """
+        Top-k most similar strings.
+
+        Args:
+            query: Normalized query text
+            k: Number of candidates to return
+            min_score: Drop candidates scoring below this (0..1)
+
+        Returns:
+            List of (string ID, score) pairs, best first
+        """
+        query_grams = trigrams(query)
+        grams = [gram for gram in query_grams if gram in self._postings]
+        if not grams or not self.strings:
+            return []
+
+        shared = np.bincount(
+            np.concatenate([self._postings[gram] for gram in grams]),
+            minlength=len(self.strings),
+        )
+        scores = 2 * shared / (len(query_grams) + self._sizes)
+
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [
+            (int(string_id), float(scores[string_id]))
+            for string_id in top
+            if scores[string_id] > 0 and scores[string_id] >= min_score
+        ]
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """Write the index and the strings it covers as compressed JSON"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "version": self.FORMAT_VERSION,
+            "fingerprint": self.fingerprint(self.strings),
+            "strings": self.strings,
+            "sizes": self._sizes.tolist(),
+            "postings": {gram: ids.tolist() for gram, ids in self._postings.items()},
+        }
+        tmp_path = path.with_suffix(f"{path.suffix}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(zlib.compress(json.dumps(payload).encode("utf-8")))
+        os.replace(tmp_path, path)
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> Optional["TrigramIndex"]:
+        """Read a saved index, None if it is missing or unreadable"""
+        try:
+            payload = json.loads(zlib.decompress(Path(path).read_bytes()))
+        except (OSError, ValueError, zlib.error):
+            return None
+        if payload.get("version") != cls.FORMAT_VERSION:
+            return None
+
+        index = cls.__new__(cls)
+        index.strings = payload["strings"]
+        index._set_postings(payload["postings"], payload["sizes"])
+        return index
+
+    @classmethod
+    def cached(cls, strings: Sequence[str], path: Union[str, Path]) -> "TrigramIndex":
+        """Load the index saved at path if it covers the same strings, else rebuild it"""
+        strings = list(strings)
+        index = cls.load(path)
+        if index is not None and index.strings == strings:
+            return index
+        index = cls(strings)
+        index.save(path)
+        return index
+
+
+class CompetitionIndex:
+    """
+    Normalized competition names with multi-pattern alias lookup and
+    trigram fuzzy search.
+
+    Names that normalize to the same form are stored once, keeping the
+    position of the first and the spelling of the last occurrence.
+
+    Args:
+        names: Competition names in catalog order
+        cache_dir: Directory to cache the trigram index in (built in memory if None);
+            indexes of other catalogs cached there are removed
+    """
+
+    CACHE_PATTERN = "competitions-*.trigrams"
+
+    def __init__(self, names: Iterable[str], cache_dir: Optional[Path] = None):
+        self._names: Dict[str, str] = {}
+        for name in names:
+            self._names[normalize_name(name)] = name
+        self.normalized = list(self._names)
+        self.cache_dir = cache_dir
+        self._trigrams: Optional[TrigramIndex] = None
+
+    @property
+    def trigram_index(self) -> TrigramIndex:
+        """Built (or loaded from cache_dir) on first use"""
+        if self._trigrams is None:
+            if self.cache_dir is None:
+                self._trigrams = TrigramIndex(self.normalized)
+            else:
+                fingerprint = TrigramIndex.fingerprint(self.normalized)[:16]
+                path = Path(self.cache_dir) / self.CACHE_PATTERN.replace(
+                    "*", fingerprint
+                )
+                self._trigrams = TrigramIndex.cached(self.normalized, path)
+                # Only the current catalog's index is worth keeping
+                for stale in path.parent.glob(self.CACHE_PATTERN):
+                    if stale != path:
+                        stale.unlink(missing_ok=True)
+        return self._trigrams
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def original(self, normalized: str) -> Optional[str]:
+        return self._names.get(normalized)
+
+    def find(self, patterns: Iterable[str]) -> Dict[str, str]:
+        """
+        First competition (in catalog order) containing each pattern.
+
+        Args:
+            patterns: Normalized substrings, e.g. "premierleague"
+
+        Returns:
+            Dictionary mapping each matched pattern to the original name
+        """
+        unique = tuple(dict.fromkeys(normalize_name(p) for p in patterns))
+        if not unique:
+            return {}
+        automaton = _compile(unique)
+
+        first: Dict[int, str] = {}
+        for normalized in self.normalized:
+            for _, pattern_id in automaton.search(normalized):
+                if pattern_id not in first:
+                    first[pattern_id] = self._names[normalized]
+            if len(first) == len(unique):
+                break
+        return {unique[pattern_id]: name for pattern_id, name in first.items()}
+
+    def resolve(
+        self, aliases: Dict[str, Sequence[str]]
+    ) -> Tuple[Dict[str, Dict], List[str]]:
+        """
+        Resolve alias lists to competitions. For each key the first alias
+        (in list order) that matches any name wins.
+
+        Args:
+            aliases: e.g. {"la_liga": ["laliga", "primeradivision"]}
+
+        Returns:
+            Tuple of (found, missing) where found maps each key to its
+            "id" (from TEST_COMPETITIONS), "actual_name" and "matched_pattern"
+        """
+        matches = self.find(p for patterns in aliases.values() for p in patterns)
+
+        found, missing = {}, []
+        for key, patterns in aliases.items():
+            pattern = next(
+                (p for p in map(normalize_name, patterns) if p in matches), None
+            )
+            if pattern is None:
+                missing.append(key)
+                continue
+            found[key] = {
+                "id": TEST_COMPETITIONS.get(key),
+                "actual_name": matches[pattern],
+                "matched_pattern": pattern,
+            }
+        return found, missing
+
+    def fuzzy(
+        self, query: str, k: int = 5, min_score: float = 0.0
+    ) -> List[Tuple[str, float]]:
+        """
+        Top-k competitions most similar to a query.
+
+        Returns:
+            List of (original name, score between 0 and 1), best first
+        """
+        return [
+            (self._names[self.normalized[string_id]], score)
+            for string_id, score in self.trigram_index.search(
+                normalize_name(query), k, min_score
+            )
+        ]
+
+    def resolve_fuzzy(
+        self, queries: Dict[str, str], min_score: float = 0.5
+    ) -> Dict[str, Dict]:
+        """
+        Best fuzzy match per key, for keys no alias pattern matched.
+
+        Args:
+            queries: e.g. {"world_cup": "FIFA World Cup"}
+            min_score: Minimum similarity to accept a match
+
+        Returns:
+            Mapping of key to "id", "actual_name" and "score" for accepted matches
+        """
+        found = {}
+        for key, query in queries.items():
+            candidates = self.fuzzy(query, k=1, min_score=min_score)
+            if candidates:
+                name, score = candidates[0]
+                found[key] = {
+                    "id": TEST_COMPETITIONS.get(key),
+                    "actual_name": name,
+                    "score": score,
+                }
+        return found
@@ -0,0 +1,204 @@
+"""
+Vectorized consistency checks for standings tables.
+
+Checks run on the columns of one or many StandingsTable instances at
+once (every league concatenated into a single set of arrays):
+
+    goal_difference - goalDifference == goalsFor - goalsAgainst
+    points          - points == 3 * won + draw
+    played_games    - playedGames == won + draw + lost
+    non_negative    - counters are never negative
+    positions       - positions run 1..n within each table, in row order
+    sort_order      - points never increase down a table
+
+Usage:
+    report = check_standings({2021: StandingsTable.from_payload(response.json())})
+    assert report.valid, report.summary()
+"""
+
+from typing import Dict, Hashable, List, Mapping, Optional, Union
+
+import numpy as np
+
+from api.football.model import StandingsTable
+
+INVARIANTS = (
+    "goal_difference",
+    "points",
+    "played_games",
+    "non_negative",
+    "positions",
+    "sort_order",
+)
+
+_COUNTERS = ("played_games", "won", "draw", "lost", "goals_for", "goals_against")
+
+
+class InvariantViolation:
+    """One failing row"""
+
+    __slots__ = ("invariant", "source", "row", "team", "group_index", "message")
+
+    def __init__(self, invariant, source, row, team, group_index, message):
+        self.invariant = invariant
+        self.source = source
+        self.row = row
+        self.team = team
+        self.group_index = group_index
+        self.message = message
+
+    def __repr__(self) -> str:
+        return (
+            f"[{self.source}] table {self.group_index} row {self.row} "
+            f"({self.team}) {self.invariant}: {self.message}"
+        )
+
+
+class InvariantReport:
+    """
+    Violations found across all checked tables.
+    """
+
+    def __init__(self, rows: int, violations: List[InvariantViolation]):
+        self.rows = rows
+        self.violations = violations
+
+    @property
+    def valid(self) -> bool:
+        return not self.violations
+
+    def by_source(self) -> Dict[Hashable, List[InvariantViolation]]:
+        grouped: Dict[Hashable, List[InvariantViolation]] = {}
+        for violation in self.violations:
+            grouped.setdefault(violation.source, []).append(violation)
+        return grouped
+
+    def summary(self, limit: int = 20) -> str:
+        lines = [f"Rows checked: {self.rows}, violations: {len(self.violations)}"]
+        lines += [repr(violation) for violation in self.violations[:limit]]
+        if len(self.violations) > limit:
+            lines.append(f"... {len(self.violations) - limit} more")
+        return "\n".join(lines)
+
+
+def _concatenate(tables: Mapping[Hashable, StandingsTable]):
+    """Join the tables' columns, giving every standings block a global id"""
+    sources = list(tables)
+    columns = {
+        name: np.concatenate([getattr(tables[s], name) for s in sources])
+        for name in ("position", "points", "goal_difference", *_COUNTERS)
+    }
+    block, offset = [], 0
+    for source in sources:
+        group_index = tables[source].group_index.astype(np.int64)
+        block.append(group_index + offset)
+        offset += int(group_index.max()) + 1 if len(group_index) else 0
+    columns["block"] = np.concatenate(block)
+    origin = np.concatenate(
+        [np.full(len(tables[s]), i, dtype=np.int64) for i, s in enumerate(sources)]
+    )
+    local_row = np.concatenate([np.arange(len(tables[s])) for s in sources])
+    return sources, columns, origin, local_row
+
+
+def _failures(columns: Dict[str, np.ndarray]) -> Dict[str, tuple]:
+    """Boolean mask of failing rows plus expected values per invariant"""
+    c = columns
+    gd = c["goals_for"].astype(np.int32) - c["goals_against"]
+    points = 3 * c["won"].astype(np.int32) + c["draw"]
+    played = c["won"].astype(np.int32) + c["draw"] + c["lost"]
+    negative = np.zeros(len(c["block"]), dtype=bool)
+    for name in _COUNTERS:
+        negative |= c[name] < 0
+
+    # Position expected from the row's offset within its block
+    size = len(c["block"])
+    starts = np.flatnonzero(np.r_[True, c["block"][1:] != c["block"][:-1]])
+    block_start = np.repeat(starts, np.diff(np.r_[starts, size]))
+    expected_position = np.arange(size) - block_start + 1
+
+    # A row is out of order when it has more points than the row above it
+    same_block = np.r_[False, c["block"][1:] == c["block"][:-1]]
+    rising = np.r_[False, c["points"][1:] > c["points"][:-1]] & same_block
+    points_above = np.r_[0, c["points"][:-1]]
+
+    return {
+        "goal_difference": (c["goal_difference"] != gd, gd),
+        "points": (c["points"] != points, points),
+        "played_games": (c["played_games"] != played, played),
+        "non_negative": (negative, None),
+        "positions": (c["position"] != expected_position, expected_position),
+        "sort_order": (rising, points_above),
+    }
+
+
+_ACTUAL = {
+    "goal_difference": "goal_difference",
+    "points": "points",
+    "played_games": "played_games",
+    "positions": "position",
+    "sort_order": "points",
+}
+
+
+def check_standings(
+    tables: Union[StandingsTable, Mapping[Hashable, StandingsTable]],
+    invariants: Optional[List[str]] = None,
+) -> InvariantReport:
+    """
+    Check standings invariants for one or many tables in a single pass.
+
+    Args:
+        tables: A StandingsTable, or a mapping of source (e.g. competition ID)
+            to StandingsTable to check all of them at once
+        invariants: Subset of INVARIANTS to run (all by default)
+
+    Returns:
+        InvariantReport listing every failing row
+    """
+    if isinstance(tables, StandingsTable):
+        tables = {None: tables}
+    invariants = list(invariants or INVARIANTS)
+    unknown = [name for name in invariants if name not in INVARIANTS]
+    if unknown:
+        raise ValueError(f"Unknown invariants: {unknown}")
+
+    if not any(len(table) for table in tables.values()):
+        return InvariantReport(0, [])
+
+    sources, columns, origin, local_row = _concatenate(tables)
+    failures = _failures(columns)
+
+    violations = []
+    for name in invariants:
+        mask, expected = failures[name]
+        for index in np.flatnonzero(mask):
+            table = tables[sources[origin[index]]]
+            row = table[int(local_row[index])]
+            if name == "non_negative":
+                message = "negative counter: " + ", ".join(
+                    f"{counter}={getattr(row, counter)}"
+                    for counter in _COUNTERS
+                    if getattr(row, counter) < 0
+                )
+            elif name == "sort_order":
+                message = (
+                    f"{row.points} points is more than {int(expected[index])} "
+                    "in the row above"
+                )
+            else:
+                message = (
+                    f"{_ACTUAL[name]} is {int(columns[_ACTUAL[name]][index])}, "
+                    f"expected {int(expected[index])}"
+                )
+            violations.append(
+                InvariantViolation(
+                    name,
+                    sources[origin[index]],
+                    int(local_row[index]),
+                    row.team,
+                    row.group_index,
+                    message,
+                )
+            )
+    return InvariantReport(len(origin), violations)
@@ -0,0 +1,190 @@
+"""
+Latency sampling for endpoint response-time budgets.
+
+sample_endpoint() fires warm-up requests, then a fixed number of timed
+samples at the requested concurrency. Each sample is a single attempt
+straight to the network (no throttling, retries, cache, cassette or
+request coalescing), so neither client-side pacing nor retry backoff
+counts against the budget. Failed warm-ups count towards the error rate.
+Extreme high outliers are discarded with a Tukey fence before the
+percentiles are computed.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Dict, List, Optional, Tuple
+
+from api.football.client import FootballAPIClient
+from config.constants import ENDPOINTS, LATENCY_OUTLIER_K, LATENCY_WARMUP
+from utils.stats import percentile
+
+
+def discard_outliers(
+    values: List[float], k: float = LATENCY_OUTLIER_K
+) -> Tuple[List[float], List[float]]:
+    """
+    Split values into (kept, outliers) using the upper Tukey fence
+    Q3 + k * IQR. Fast outliers are never discarded.
+    """
+    if len(values) < 4 or k is None:
+        return list(values), []
+    q1 = percentile(values, 25)
+    q3 = percentile(values, 75)
+    fence = q3 + k * (q3 - q1)
+    kept = [value for value in values if value <= fence]
+    outliers = [value for value in values if value > fence]
+    return kept, outliers
+
+
+class LatencySampleResult:
+    """
+    Sampled latencies (milliseconds) for one endpoint.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        path: str,
+        durations_ms,
+        errors,
+        outlier_k,
+        warmup: int = 0,
+        warmup_errors=(),
+    ):
+        self.endpoint = endpoint
+        self.path = path
+        self.errors = errors
+        self.warmup = warmup
+        self.warmup_errors = list(warmup_errors)
+        self.kept, self.outliers = discard_outliers(durations_ms, outlier_k)
+
+    @property
+    def sample_count(self) -> int:
+        return len(self.kept) + len(self.outliers) + len(self.errors)
+
+    @property
+    def error_rate(self) -> float:
+        """Failed requests, warm-ups included, over all requests sent"""
+        sent = self.sample_count + self.warmup
+        failed = len(self.errors) + len(self.warmup_errors)
+        return failed / sent if sent else 0.0
+
+    def percentile(self, percent: float) -> Optional[float]:
+        return percentile(self.kept, percent)
+
+    def violations(
+        self, budgets: Dict[str, float], max_error_rate: float = 0.0
+    ) -> List[str]:
+        """
+        Check budgets such as {"p95_ms": 800, "max_ms": 2000}.
+
+        Returns:
+            List of human readable budget violations (empty if all pass)
+        """
+        problems = []
+        if self.error_rate > max_error_rate:
+            problems.append(
+                f"error rate {self.error_rate:.1%} > {max_error_rate:.1%}: "
+                + "; ".join((self.warmup_errors + self.errors)[:5])
+            )
+        if not self.kept:
+            problems.append("no successful samples")
+            return problems
+
+        for name, budget in budgets.items():
+            if name == "max_ms":
+                actual = max(self.kept)
+            else:
+                actual = self.percentile(float(name[1:].split("_")[0]))
+            if actual > budget:
+                problems.append(f"{name}: {actual:.1f} ms > budget {budget} ms")
+        return problems
+
+    def summary(self) -> str:
+        lines = [
+            f"Endpoint: {self.endpoint} ({self.path})",
+            f"Samples: {self.sample_count} "
+            f"(kept {len(self.kept)}, outliers {len(self.outliers)}, "
+            f"errors {len(self.errors)})",
+            f"Warm-up: {self.warmup} (errors {len(self.warmup_errors)})",
+        ]
+        if self.kept:
+            lines += [
+                f"min: {min(self.kept):.1f} ms",
+                f"p50: {self.percentile(50):.1f} ms",
+                f"p95: {self.percentile(95):.1f} ms",
+                f"p99: {self.percentile(99):.1f} ms",
+                f"max: {max(self.kept):.1f} ms",
+            ]
+        if self.outliers:
+            lines.append(
+                "Discarded outliers: "
+                + ", ".join(f"{value:.1f} ms" for value in sorted(self.outliers))
+            )
+        return "\n".join(lines)
+
+
+def sample_endpoint(
+    endpoint: str,
+    samples: int = 20,
+    concurrency: int = 1,
+    warmup: int = LATENCY_WARMUP,
+    outlier_k: float = LATENCY_OUTLIER_K,
+    client: Optional[FootballAPIClient] = None,
+    params: Optional[Dict] = None,
+    **path_params,
+) -> LatencySampleResult:
+    """
+    Sample the network latency of one endpoint.
+
+    Args:
+        endpoint: Key in ENDPOINTS, e.g. "competitions"
+        samples: Number of timed requests
+        concurrency: Number of requests in flight at once
+        warmup: Untimed requests sent first to open connections
+        outlier_k: Tukey fence multiplier (None keeps every sample)
+        client: Client to sample through (a new one by default)
+        params: Query parameters
+        **path_params: Values for the endpoint placeholders, e.g. competition_id=2021
+    """
+    if endpoint not in ENDPOINTS:
+        raise ValueError(f"Unknown endpoint: {endpoint}")
+    if samples < 1 or concurrency < 1:
+        raise ValueError(
+            f"samples and concurrency must be >= 1, got {samples}, {concurrency}"
+        )
+
+    client = client or FootballAPIClient()
+    path = ENDPOINTS[endpoint].format(**path_params)
+    url = f"{client.base_url}{path}"
+
+    def timed_request() -> Tuple[Optional[float], Optional[str]]:
+        try:
+            start = time.perf_counter()
+            response = client._attempt("GET", path, url, params=params)
+            elapsed = time.perf_counter() - start
+        except Exception as e:
+            return None, f"{type(e).__name__}: {e}"
+        if response.status_code != HTTPStatus.OK:
+            return None, f"HTTP {response.status_code}"
+        return elapsed * 1000, None
+
+    warmup_errors = [
+        error for _, error in (timed_request() for _ in range(warmup)) if error
+    ]
+
+    with ThreadPoolExecutor(
+        max_workers=concurrency, thread_name_prefix="latency-sample"
+    ) as executor:
+        results = list(executor.map(lambda _: timed_request(), range(samples)))
+
+    return LatencySampleResult(
+        endpoint,
+        path,
+        durations_ms=[duration for duration, error in results if error is None],
+        errors=[error for _, error in results if error is not None],
+        outlier_k=outlier_k,
+        warmup=warmup,
+        warmup_errors=warmup_errors,
+    )
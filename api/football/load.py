@@ -0,0 +1,384 @@
+"""
+Open-loop load generation for the Football API endpoints.
+
+Requests are scheduled at a fixed arrival rate (constant or Poisson
+spacing) independent of how fast responses come back. Latency is
+measured from each request's scheduled start, so when the API or the
+client falls behind, the queueing delay shows up in the percentiles
+instead of silently lowering the offered load.
+
+Usage:
+    python -m api.football.load --rate 20 --duration 30 \\
+        --mix competitions=70 --mix standings=30
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from api.football.client import FootballAPIClient
+from api.football.metrics import PERCENTILES, LatencyHistogram
+from config.api_config import APIConfig
+from config.constants import ENDPOINTS, TEST_COMPETITIONS
+
+ARRIVALS = ("constant", "poisson")
+
+
+class Scenario:
+    """
+    Weighted mix of endpoints, e.g. {"competitions": 70, "standings": 30}.
+
+    Path placeholders are filled from path_params (a list of values per
+    placeholder name), defaulting to the TEST_COMPETITIONS IDs.
+    """
+
+    def __init__(
+        self,
+        mix: Dict[str, float],
+        path_params: Optional[Dict[str, Sequence]] = None,
+    ):
+        unknown = [endpoint for endpoint in mix if endpoint not in ENDPOINTS]
+        if unknown:
+            raise ValueError(f"Unknown endpoints in scenario: {unknown}")
+        if not mix or any(weight <= 0 for weight in mix.values()):
+            raise ValueError(f"Scenario weights must be positive: {mix}")
+
+        competition_ids = list(TEST_COMPETITIONS.values())
+        self.path_params = {"id": competition_ids, "competition_id": competition_ids}
+        self.path_params.update(path_params or {})
+
+        self.endpoints = list(mix)
+        self.weights = [mix[endpoint] for endpoint in self.endpoints]
+        self._fields = {
+            endpoint: APIConfig.endpoint_fields(endpoint) for endpoint in self.endpoints
+        }
+
+    def next_request(self, rng: random.Random) -> Tuple[str, str]:
+        """Pick the next (endpoint key, request path)"""
+        endpoint = rng.choices(self.endpoints, weights=self.weights)[0]
+        values = {
+            name: rng.choice(self.path_params[name]) for name in self._fields[endpoint]
+        }
+        return endpoint, ENDPOINTS[endpoint].format(**values)
+
+
+class _Window:
+    __slots__ = ("completed", "errors", "latency")
+
+    def __init__(self):
+        self.completed = 0
+        self.errors = 0
+        self.latency = LatencyHistogram()
+
+
+class LoadReport:
+    """
+    Throughput, error rate and latency percentiles, overall and per window.
+    """
+
+    def __init__(self, rate: float, duration: float, interval: float):
+        self.rate = rate
+        self.duration = duration
+        self.interval = interval
+        self.sent = 0
+        self.elapsed = 0.0
+        self.latency = LatencyHistogram()
+        self.service = LatencyHistogram()
+        self.errors: Dict[str, int] = {}
+        self.endpoints: Dict[str, _Window] = {}
+        self.windows: Dict[int, _Window] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        endpoint: str,
+        completed_at: float,
+        latency: float,
+        service: float,
+        error: Optional[str],
+    ) -> None:
+        with self._lock:
+            window = self.windows.get(int(completed_at // self.interval))
+            if window is None:
+                window = self.windows[int(completed_at // self.interval)] = _Window()
+            per_endpoint = self.endpoints.setdefault(endpoint, _Window())
+
+            for stats in (window, per_endpoint):
+                stats.completed += 1
+                stats.latency.record(latency)
+                if error is not None:
+                    stats.errors += 1
+            self.latency.record(latency)
+            self.service.record(service)
+            if error is not None:
+                self.errors[error] = self.errors.get(error, 0) + 1
+
+    def record_lost(self, error: str) -> None:
+        """Count a request whose outcome could not be recorded as an error"""
+        with self._lock:
+            self.errors[error] = self.errors.get(error, 0) + 1
+
+    @property
+    def completed(self) -> int:
+        return self.latency.count
+
+    @property
+    def error_rate(self) -> float:
+        return sum(self.errors.values()) / self.completed if self.completed else 0.0
+
+    @property
+    def throughput(self) -> float:
+        return self.completed / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def steady_throughput(self) -> float:
+        """Mean throughput excluding the ramp-up and drain windows"""
+        windows = [self.windows[index] for index in sorted(self.windows)][1:-1]
+        if not windows:
+            return self.throughput
+        return sum(w.completed for w in windows) / (len(windows) * self.interval)
+
+    @staticmethod
+    def _percentiles(histogram: LatencyHistogram) -> Dict[str, Optional[float]]:
+        return {f"p{p}_ms": histogram.percentile(p) for p in PERCENTILES}
+
+    def to_dict(self) -> Dict:
+        return {
+            "offered_rate_rps": self.rate,
+            "duration_s": self.duration,
+            "sent": self.sent,
+            "completed": self.completed,
+            "throughput_rps": self.throughput,
+            "steady_throughput_rps": self.steady_throughput,
+            "error_rate": self.error_rate,
+            "errors": dict(self.errors),
+            "latency_ms": self._percentiles(self.latency),
+            "service_time_ms": self._percentiles(self.service),
+            "endpoints": {
+                endpoint: {
+                    "completed": stats.completed,
+                    "error_rate": stats.errors / stats.completed,
+                    **self._percentiles(stats.latency),
+                }
+                for endpoint, stats in sorted(self.endpoints.items())
+            },
+            "timeline": [
+                {
+                    "t_s": index * self.interval,
+                    "throughput_rps": stats.completed / self.interval,
+                    "error_rate": stats.errors / stats.completed,
+                    **self._percentiles(stats.latency),
+                }
+                for index, stats in sorted(self.windows.items())
+            ],
+        }
+
+    def export_json(self, path: Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        return path
+
+    def format_table(self) -> str:
+        """Plain-text timeline followed by the totals"""
+        header = f"{'t (s)':>7}{'req/s':>9}{'errors':>9}" + "".join(
+            f"{f'p{p} ms':>11}" for p in PERCENTILES
+        )
+        lines = [header, "-" * len(header)]
+        for row in self.to_dict()["timeline"]:
+            lines.append(
+                f"{row['t_s']:>7.0f}{row['throughput_rps']:>9.1f}"
+                f"{row['error_rate']:>9.1%}"
+                + "".join(f"{row[f'p{p}_ms']:>11.1f}" for p in PERCENTILES)
+            )
+        lines.append("-" * len(header))
+        lines.append(
+            f"offered {self.rate:.1f} req/s, "
+            f"achieved {self.steady_throughput:.1f} req/s (steady state), "
+            f"errors {self.error_rate:.1%}, "
+            + ", ".join(
+                f"p{p} {self.latency.percentile(p) or 0:.1f} ms" for p in PERCENTILES
+            )
+        )
+        return "\n".join(lines)
+
+
+class OpenLoopRunner:
+    """
+    Drives a scenario at a fixed arrival rate for a given duration.
+
+    Every request is a single attempt straight to the network through
+    FootballAPIClient._attempt: no throttling, retries, cache, cassette or
+    request coalescing, so each recorded latency is one round trip and a
+    throttled or failed request shows up as an error.
+    """
+
+    def __init__(
+        self,
+        scenario: Scenario,
+        rate: float,
+        duration: float,
+        client: Optional[FootballAPIClient] = None,
+        arrivals: str = "constant",
+        max_in_flight: int = 256,
+        interval: float = 1.0,
+        seed: Optional[int] = None,
+    ):
+        if rate <= 0 or duration <= 0:
+            raise ValueError(f"rate and duration must be > 0, got {rate}, {duration}")
+        if arrivals not in ARRIVALS:
+            raise ValueError(f"Invalid arrival process: {arrivals}")
+
+        self.scenario = scenario
+        self.rate = rate
+        self.duration = duration
+        self.arrivals = arrivals
+        self.max_in_flight = max_in_flight
+        self.interval = interval
+        self._rng = random.Random(seed)
+
+        # A client passed in by the caller is used with its own pool, unchanged
+        self.client = client or FootballAPIClient()
+        if client is None:
+            self.client.resize_pool(max_in_flight)
+
+    def _schedule(self) -> List[float]:
+        """Offsets (seconds from start) of every request arrival"""
+        if self.arrivals == "constant":
+            return [i / self.rate for i in range(int(self.rate * self.duration))]
+
+        offsets, t = [], self._rng.expovariate(self.rate)
+        while t < self.duration:
+            offsets.append(t)
+            t += self._rng.expovariate(self.rate)
+        return offsets
+
+    def _execute(
+        self, report: LoadReport, start: float, intended: float, endpoint, path
+    ):
+        begin = time.perf_counter()
+        error = None
+        try:
+            response = self.client._attempt(
+                "GET", path, f"{self.client.base_url}{path}"
+            )
+            if response.status_code >= 400:
+                error = f"HTTP {response.status_code}"
+        except Exception as e:  # anything a request raises is a failed request
+            error = type(e).__name__
+        end = time.perf_counter()
+        report.record(endpoint, end - start, end - intended, end - begin, error)
+
+    def run(self) -> LoadReport:
+        report = LoadReport(self.rate, self.duration, self.interval)
+        offsets = self._schedule()
+        requests_to_send = [self.scenario.next_request(self._rng) for _ in offsets]
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_in_flight, thread_name_prefix="load"
+        ) as executor:
+            futures = []
+            start = time.perf_counter()
+            for offset, (endpoint, path) in zip(offsets, requests_to_send):
+                intended = start + offset
+                delay = intended - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                futures.append(
+                    executor.submit(
+                        self._execute, report, start, intended, endpoint, path
+                    )
+                )
+                report.sent += 1
+
+        # A failure outside the request itself (e.g. while recording) must
+        # not leave a request silently unaccounted for
+        for future in futures:
+            if future.exception() is not None:
+                report.record_lost(type(future.exception()).__name__)
+
+        report.elapsed = time.perf_counter() - start
+        return report
+
+
+def find_saturation(
+    scenario: Scenario,
+    rates: Sequence[float],
+    stage_duration: float,
+    p99_budget_ms: Optional[float] = None,
+    min_efficiency: float = 0.95,
+    max_error_rate: float = 0.01,
+    **runner_kwargs,
+) -> Tuple[Optional[float], List[LoadReport]]:
+    """
+    Run increasing arrival rates until the system stops keeping up.
+
+    A stage is saturated when steady-state throughput falls below
+    min_efficiency of the offered rate, the error rate exceeds
+    max_error_rate, or p99 exceeds p99_budget_ms.
+
+    Returns:
+        Tuple of (first saturated rate or None, reports for every stage run)
+    """
+    reports = []
+    for rate in rates:
+        report = OpenLoopRunner(scenario, rate, stage_duration, **runner_kwargs).run()
+        reports.append(report)
+
+        p99 = report.latency.percentile(99) or 0
+        if (
+            report.steady_throughput < min_efficiency * rate
+            or report.error_rate > max_error_rate
+            or (p99_budget_ms is not None and p99 > p99_budget_ms)
+        ):
+            return rate, reports
+    return None, reports
+
+
+def _parse_mix(values: List[str]) -> Dict[str, float]:
+    mix = {}
+    for value in values:
+        endpoint, _, weight = value.partition("=")
+        mix[endpoint] = float(weight or 1)
+    return mix
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rate", type=float, required=True, help="Requests/second")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds")
+    parser.add_argument(
+        "--mix",
+        action="append",
+        default=[],
+        help="endpoint=weight, repeatable (default: competitions=1)",
+    )
+    parser.add_argument("--arrivals", choices=ARRIVALS, default="constant")
+    parser.add_argument("--max-in-flight", type=int, default=256)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--output", type=Path, help="Write the JSON report here")
+    args = parser.parse_args(argv)
+
+    scenario = Scenario(_parse_mix(args.mix) or {"competitions": 1})
+    report = OpenLoopRunner(
+        scenario,
+        args.rate,
+        args.duration,
+        arrivals=args.arrivals,
+        max_in_flight=args.max_in_flight,
+        seed=args.seed,
+    ).run()
+
+    print(report.format_table())
+    if args.output:
+        report.export_json(args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+"""
+Per-endpoint latency instrumentation for the Football API client.
+
+Every request is split into phases and recorded per ENDPOINTS key:
+
+    connect  - DNS lookup, TCP connect and TLS handshake (0 on reused connections)
+    ttfb     - request sent until response headers received
+    download - response body download
+    parse    - response.json() decoding
+    total    - whole _make_request call, including cache/cassette hits
+
+Values go into log-linear (HDR-style) histograms, so recording is O(1)
+and percentiles stay within 1% of the true value at any scale. The JSON
+export keeps the bucket counts, so per-worker files can be merged into
+exact run-wide percentiles with LatencyRecorder.load_json().
+"""
+
+import json
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from config.api_config import APIConfig
+from utils.stats import nearest_rank
+
+PHASES = ("connect", "ttfb", "download", "parse", "total")
+PERCENTILES = (50, 95, 99)
+
+_connect_timing = threading.local()
+
+
+def reset_connect_time() -> None:
+    _connect_timing.seconds = 0.0
+
+
+def pop_connect_time() -> float:
+    """Connection setup time spent by this thread since the last reset"""
+    seconds = getattr(_connect_timing, "seconds", 0.0)
+    _connect_timing.seconds = 0.0
+    return seconds
+
+
+class _TimedConnectMixin:
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            _connect_timing.seconds = (
+                getattr(_connect_timing, "seconds", 0.0) + time.perf_counter() - start
+            )
+
+
+class _TimedHTTPConnection(_TimedConnectMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectMixin, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections report their setup time"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
+class LatencyHistogram:
+    """
+    Log-linear histogram of durations in microseconds.
+
+    Values below 2^sub_bucket_bits are counted exactly; above that each
+    power of two is split into 2^(sub_bucket_bits - 1) equal buckets.
+    """
+
+    def __init__(self, sub_bucket_bits: int = 8):
+        self.sub_bucket_bits = sub_bucket_bits
+        self._linear_limit = 1 << sub_bucket_bits
+        self._half = 1 << (sub_bucket_bits - 1)
+        self._counts: Dict[int, int] = defaultdict(int)
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def _index(self, value: int) -> int:
+        if value < self._linear_limit:
+            return value
+        exponent = value.bit_length() - self.sub_bucket_bits
+        mantissa = value >> exponent
+        return self._linear_limit + (exponent - 1) * self._half + mantissa - self._half
+
+    def _upper_bound(self, index: int) -> int:
+        if index < self._linear_limit:
+            return index
+        exponent, offset = divmod(index - self._linear_limit, self._half)
+        exponent += 1
+        mantissa = offset + self._half
+        return ((mantissa + 1) << exponent) - 1
+
+    def record(self, seconds: float) -> None:
+        value = max(0, int(seconds * 1_000_000))
+        self._counts[self._index(value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        if other.sub_bucket_bits != self.sub_bucket_bits:
+            raise ValueError(
+                "Cannot merge histograms with different precision: "
+                f"{self.sub_bucket_bits} and {other.sub_bucket_bits} sub-bucket bits"
+            )
+        for index, count in other._counts.items():
+            self._counts[index] += count
+        self.count += other.count
+        self.total += other.total
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+
+    def to_dict(self) -> Dict:
+        """Bucket counts and totals in microseconds, as read by from_dict()"""
+        return {
+            "sub_bucket_bits": self.sub_bucket_bits,
+            "count": self.count,
+            "total": self.total,
+            "min": self.min,
+            "max": self.max,
+            "counts": {
+                str(index): self._counts[index] for index in sorted(self._counts)
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "LatencyHistogram":
+        histogram = cls(data["sub_bucket_bits"])
+        for index, count in data["counts"].items():
+            histogram._counts[int(index)] = count
+        histogram.count = data["count"]
+        histogram.total = data["total"]
+        histogram.min = data["min"]
+        histogram.max = data["max"]
+        return histogram
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """Value in milliseconds at the given percentile"""
+        if not self.count:
+            return None
+        target = nearest_rank(percentile, self.count)
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= target:
+                return min(self._upper_bound(index), self.max) / 1000
+        return self.max / 1000
+
+    def summary(self) -> Dict[str, float]:
+        stats = {
+            "count": self.count,
+            "min_ms": (self.min or 0) / 1000,
+            "mean_ms": self.total / self.count / 1000 if self.count else 0,
+            "max_ms": (self.max or 0) / 1000,
+        }
+        for percentile in PERCENTILES:
+            stats[f"p{percentile}_ms"] = self.percentile(percentile)
+        return stats
+
+
+def metric_key(endpoint: str) -> str:
+    """Group request paths by their ENDPOINTS key, falling back to the path"""
+    return APIConfig.resolve_endpoint(endpoint) or endpoint.split("?", 1)[0]
+
+
+class LatencyRecorder:
+    """
+    Thread-safe collection of histograms keyed by endpoint and phase.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, Dict[str, LatencyHistogram]] = defaultdict(dict)
+
+    def record(self, endpoint: str, phase: str, seconds: float) -> None:
+        if phase not in PHASES:
+            raise ValueError(f"Unknown latency phase: {phase}")
+        key = metric_key(endpoint)
+        with self._lock:
+            histogram = self._histograms[key].get(phase)
+            if histogram is None:
+                histogram = self._histograms[key][phase] = LatencyHistogram()
+            histogram.record(seconds)
+
+    def histogram(self, endpoint: str, phase: str = "total") -> LatencyHistogram:
+        """Copy of the histogram for an endpoint key or request path"""
+        copy = LatencyHistogram()
+        with self._lock:
+            histogram = self._histograms.get(metric_key(endpoint), {}).get(phase)
+            if histogram is not None:
+                copy.merge(histogram)
+        return copy
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+    def merge(self, other: "LatencyRecorder") -> None:
+        """Add every histogram of other (e.g. another worker's) to this one"""
+        with other._lock:
+            incoming = [
+                (endpoint, phase, histogram.to_dict())
+                for endpoint, phases in other._histograms.items()
+                for phase, histogram in phases.items()
+            ]
+        self._merge_dicts(incoming)
+
+    def _merge_dicts(self, histograms) -> None:
+        with self._lock:
+            for endpoint, phase, data in histograms:
+                incoming = LatencyHistogram.from_dict(data)
+                histogram = self._histograms[endpoint].get(phase)
+                if histogram is None:
+                    self._histograms[endpoint][phase] = incoming
+                else:
+                    histogram.merge(incoming)
+
+    def summary(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        with self._lock:
+            return {
+                endpoint: {
+                    phase: phases[phase].summary()
+                    for phase in PHASES
+                    if phase in phases
+                }
+                for endpoint, phases in sorted(self._histograms.items())
+            }
+
+    def export_json(self, path: Path) -> Path:
+        """
+        Write each endpoint/phase as its summary plus the histogram buckets:
+            {endpoint: {phase: {"summary": {...}, "histogram": {...}}}}
+        """
+        with self._lock:
+            data = {
+                endpoint: {
+                    phase: {
+                        "summary": phases[phase].summary(),
+                        "histogram": phases[phase].to_dict(),
+                    }
+                    for phase in PHASES
+                    if phase in phases
+                }
+                for endpoint, phases in sorted(self._histograms.items())
+            }
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+        return path
+
+    @classmethod
+    def load_json(cls, paths: Iterable[Path]) -> "LatencyRecorder":
+        """Recorder holding the merged histograms of exported files"""
+        recorder = cls()
+        for path in paths:
+            with open(path) as f:
+                data = json.load(f)
+            recorder._merge_dicts(
+                (endpoint, phase, entry["histogram"])
+                for endpoint, phases in data.items()
+                for phase, entry in phases.items()
+            )
+        return recorder
+
+    def format_table(self) -> str:
+        """Plain-text p50/p95/p99 table for the Allure summary"""
+        header = f"{'endpoint':<22}{'phase':<10}{'count':>7}" + "".join(
+            f"{f'p{p} ms':>11}" for p in PERCENTILES
+        )
+        lines = [header, "-" * len(header)]
+        for endpoint, phases in self.summary().items():
+            for phase, stats in phases.items():
+                lines.append(
+                    f"{endpoint:<22}{phase:<10}{stats['count']:>7}"
+                    + "".join(f"{stats[f'p{p}_ms']:>11.1f}" for p in PERCENTILES)
+                )
+        return "\n".join(lines)
+
+
+# Shared by every client in the process, exported at session end
+latency_recorder = LatencyRecorder()
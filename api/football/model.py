@@ -0,0 +1,338 @@
+"""
+Columnar in-memory representation of matches and standings.
+
+Each table keeps one NumPy array per field and stores strings (team
+names, statuses, stages) as int32 codes into a shared StringTable, so
+a record costs a few dozen bytes instead of a pydantic object with
+nested dicts. Rows are read through lightweight __slots__ views that
+decode values on access.
+
+Missing integers (e.g. the score of a scheduled match) are stored as -1
+and read back as None.
+
+Usage:
+    strings = StringTable()
+    matches = MatchTable.from_payload(response.json(), strings)
+    standings = StandingsTable.from_payload(other_response.json(), strings)
+    finished = matches.filter(matches.status == matches.code_of("FINISHED"))
+"""
+
+from typing import Dict, Iterator, List, Optional, Union
+
+import numpy as np
+from pydantic import BaseModel
+
+MISSING = -1
+
+
+class StringTable:
+    """
+    Interned strings addressed by int32 codes. Share one table between
+    several MatchTable/StandingsTable instances to store each name once.
+    """
+
+    __slots__ = ("_codes", "_values")
+
+    def __init__(self):
+        self._codes: Dict[str, int] = {}
+        self._values: List[str] = []
+
+    def code(self, value: Optional[str]) -> int:
+        """Code for a string, adding it if new (None maps to MISSING)"""
+        if value is None:
+            return MISSING
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self._values)
+            self._values.append(value)
+        return code
+
+    def lookup(self, value: str) -> int:
+        """Code for an existing string, MISSING if it was never stored"""
+        return self._codes.get(value, MISSING)
+
+    def value(self, code: int) -> Optional[str]:
+        return None if code == MISSING else self._values[code]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate size of the stored text"""
+        return sum(len(value) for value in self._values)
+
+
+class _Field:
+    """Row view attribute reading one column of the parent table"""
+
+    __slots__ = ("column", "kind")
+
+    def __init__(self, column: str, kind: str = "int"):
+        self.column = column
+        self.kind = kind
+
+    def __get__(self, row, owner=None):
+        if row is None:
+            return self
+        value = getattr(row._table, self.column)[row._index]
+        if self.kind == "str":
+            return row._table.strings.value(int(value))
+        value = int(value)
+        if self.kind == "optional" and value == MISSING:
+            return None
+        return value
+
+
+class _ColumnarTable:
+    """Shared container logic: column storage, filtering, row access"""
+
+    COLUMNS: Dict[str, str] = {}
+    ROW: type = None
+
+    def __init__(self, columns: Dict[str, np.ndarray], strings: StringTable):
+        self.strings = strings
+        for name, dtype in self.COLUMNS.items():
+            setattr(self, name, np.asarray(columns[name], dtype=dtype))
+
+    @classmethod
+    def _from_rows(cls, rows: List[tuple], strings: StringTable):
+        names = list(cls.COLUMNS)
+        if not rows:
+            return cls({name: [] for name in names}, strings)
+        return cls(dict(zip(names, zip(*rows))), strings)
+
+    def __len__(self) -> int:
+        return len(getattr(self, next(iter(self.COLUMNS))))
+
+    def __getitem__(self, index: int):
+        if not -len(self) <= index < len(self):
+            raise IndexError(f"Row {index} out of range for {len(self)} rows")
+        return self.ROW(self, index % len(self))
+
+    def __iter__(self) -> Iterator:
+        return (self.ROW(self, index) for index in range(len(self)))
+
+    def filter(self, mask: np.ndarray):
+        """New table holding the rows selected by a boolean mask or index array"""
+        return type(self)(
+            {name: getattr(self, name)[mask] for name in self.COLUMNS}, self.strings
+        )
+
+    def code_of(self, value: str) -> int:
+        """Code to compare a string column against, e.g. in filter masks"""
+        return self.strings.lookup(value)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the column arrays (strings are shared and excluded)"""
+        return sum(getattr(self, name).nbytes for name in self.COLUMNS)
+
+
+def _as_dict(payload: Union[Dict, BaseModel]) -> Dict:
+    return payload.model_dump() if isinstance(payload, BaseModel) else payload
+
+
+def _optional(value: Optional[int]) -> int:
+    return MISSING if value is None else value
+
+
+class MatchRow:
+    """Read-only view of one row of a MatchTable"""
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: "MatchTable", index: int):
+        self._table = table
+        self._index = index
+
+    id = _Field("id")
+    competition_id = _Field("competition_id", "optional")
+    matchday = _Field("matchday", "optional")
+    status = _Field("status", "str")
+    stage = _Field("stage", "str")
+    home_team_id = _Field("home_team_id")
+    home_team = _Field("home_team", "str")
+    away_team_id = _Field("away_team_id")
+    away_team = _Field("away_team", "str")
+    home_goals = _Field("home_goals", "optional")
+    away_goals = _Field("away_goals", "optional")
+    winner = _Field("winner", "str")
+
+    @property
+    def utc_date(self) -> np.datetime64:
+        return self._table.utc_date[self._index]
+
+    def __repr__(self) -> str:
+        return (
+            f"MatchRow(id={self.id}, {self.home_team} {self.home_goals}-"
+            f"{self.away_goals} {self.away_team}, status={self.status})"
+        )
+
+
+class MatchTable(_ColumnarTable):
+    """
+    Matches stored column by column.
+    """
+
+    COLUMNS = {
+        "id": np.int64,
+        "competition_id": np.int32,
+        "utc_date": "datetime64[s]",
+        "matchday": np.int16,
+        "status": np.int32,
+        "stage": np.int32,
+        "home_team_id": np.int32,
+        "home_team": np.int32,
+        "away_team_id": np.int32,
+        "away_team": np.int32,
+        "home_goals": np.int16,
+        "away_goals": np.int16,
+        "winner": np.int32,
+    }
+    ROW = MatchRow
+
+    @classmethod
+    def from_payload(
+        cls,
+        payload: Union[Dict, BaseModel],
+        strings: Optional[StringTable] = None,
+    ) -> "MatchTable":
+        """
+        Build from a MatchesResponse payload (parsed JSON or model instance).
+
+        Args:
+            payload: Object with a "matches" list
+            strings: String table to intern names into (a new one by default)
+        """
+        strings = strings if strings is not None else StringTable()
+        code = strings.code
+        rows = []
+        for match in _as_dict(payload)["matches"]:
+            score = match.get("score") or {}
+            full_time = score.get("fullTime") or {}
+            home, away = match["homeTeam"], match["awayTeam"]
+            rows.append(
+                (
+                    match["id"],
+                    _optional((match.get("competition") or {}).get("id")),
+                    np.datetime64(match["utcDate"].rstrip("Z")),
+                    _optional(match.get("matchday")),
+                    code(match["status"]),
+                    code(match.get("stage")),
+                    home["id"],
+                    code(home.get("name")),
+                    away["id"],
+                    code(away.get("name")),
+                    _optional(full_time.get("home")),
+                    _optional(full_time.get("away")),
+                    code(score.get("winner")),
+                )
+            )
+        return cls._from_rows(rows, strings)
+
+
+class StandingRow:
+    """Read-only view of one row of a StandingsTable"""
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: "StandingsTable", index: int):
+        self._table = table
+        self._index = index
+
+    group_index = _Field("group_index")
+    stage = _Field("stage", "str")
+    type = _Field("type", "str")
+    group = _Field("group", "str")
+    position = _Field("position")
+    team_id = _Field("team_id")
+    team = _Field("team", "str")
+    played_games = _Field("played_games")
+    won = _Field("won")
+    draw = _Field("draw")
+    lost = _Field("lost")
+    points = _Field("points")
+    goals_for = _Field("goals_for")
+    goals_against = _Field("goals_against")
+    goal_difference = _Field("goal_difference")
+
+    def __repr__(self) -> str:
+        return (
+            f"StandingRow({self.position}. {self.team}, "
+            f"P{self.played_games} Pts{self.points})"
+        )
+
+
+class StandingsTable(_ColumnarTable):
+    """
+    Standings tables of a competition stored column by column. Rows of
+    every standings block (TOTAL/HOME/AWAY, groups) are concatenated and
+    told apart by group_index.
+    """
+
+    COLUMNS = {
+        "group_index": np.int16,
+        "stage": np.int32,
+        "type": np.int32,
+        "group": np.int32,
+        "position": np.int16,
+        "team_id": np.int32,
+        "team": np.int32,
+        "played_games": np.int16,
+        "won": np.int16,
+        "draw": np.int16,
+        "lost": np.int16,
+        "points": np.int16,
+        "goals_for": np.int16,
+        "goals_against": np.int16,
+        "goal_difference": np.int16,
+    }
+    ROW = StandingRow
+
+    @classmethod
+    def from_payload(
+        cls,
+        payload: Union[Dict, BaseModel],
+        strings: Optional[StringTable] = None,
+    ) -> "StandingsTable":
+        """
+        Build from a StandingsResponse payload (parsed JSON or model instance).
+
+        Args:
+            payload: Object with a "standings" list of tables
+            strings: String table to intern names into (a new one by default)
+        """
+        strings = strings if strings is not None else StringTable()
+        code = strings.code
+        rows = []
+        for group_index, standing in enumerate(_as_dict(payload)["standings"]):
+            block = (
+                group_index,
+                code(standing["stage"]),
+                code(standing["type"]),
+                code(standing.get("group")),
+            )
+            for entry in standing["table"]:
+                team = entry["team"]
+                rows.append(
+                    block
+                    + (
+                        entry["position"],
+                        team["id"],
+                        code(team.get("name")),
+                        entry["playedGames"],
+                        entry["won"],
+                        entry["draw"],
+                        entry["lost"],
+                        entry["points"],
+                        entry["goalsFor"],
+                        entry["goalsAgainst"],
+                        entry["goalDifference"],
+                    )
+                )
+        return cls._from_rows(rows, strings)
+
+    def block(self, group_index: int = 0) -> "StandingsTable":
+        """Rows of one standings block, e.g. 0 for the first TOTAL table"""
+        return self.filter(self.group_index == group_index)
@@ -0,0 +1,255 @@
+"""
+Client-side throttling and retries for the RapidAPI football endpoints.
+
+TokenBucket paces requests and adapts its refill rate to the quota
+reported in X-RateLimit-* response headers. When given a state file the
+bucket is shared by every process using that file (e.g. pytest-xdist
+workers), guarded by an exclusive file lock. The shared state belongs
+to one test run: state left in the file by an earlier run (a lowered
+rate, a 429 block) is discarded.
+
+RetryPolicy computes jittered exponential backoff and honors Retry-After,
+and only retries idempotent methods.
+"""
+
+import json
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+import requests
+
+from config.api_config import APIConfig
+
+try:
+    import fcntl
+except ImportError:  # Windows: bucket is shared between threads only
+    fcntl = None
+
+# RapidAPI sends the "Requests" variant, other gateways the generic one
+_REMAINING_HEADERS = ("X-RateLimit-Requests-Remaining", "X-RateLimit-Remaining")
+_RESET_HEADERS = ("X-RateLimit-Requests-Reset", "X-RateLimit-Reset")
+
+
+def _header_number(headers, names) -> Optional[float]:
+    for name in names:
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return float(value)
+        except ValueError:
+            continue
+    return None
+
+
+class TokenBucket:
+    """
+    Thread- and process-safe token bucket.
+
+    Args:
+        rate: Tokens added per second (the sustained request rate)
+        capacity: Maximum burst size
+        state_file: Optional file used to share the bucket between processes
+        run_id: Processes with the same run_id share state through the file;
+            defaults to the xdist run ID, or this process when not under xdist
+        clock: Wall-clock source shared with other processes (time.time)
+        sleep: Called to wait for a token (time.sleep)
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        capacity: Optional[float] = None,
+        state_file: Optional[Path] = None,
+        run_id: Optional[str] = None,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.max_rate = rate if rate is not None else APIConfig.RATE_LIMIT_PER_SECOND
+        self.capacity = capacity if capacity is not None else APIConfig.RATE_LIMIT_BURST
+        if self.max_rate <= 0 or self.capacity < 1:
+            raise ValueError(
+                f"Invalid token bucket: rate={self.max_rate}, capacity={self.capacity}"
+            )
+
+        self._clock = clock
+        self._sleep = sleep
+        self.run_id = run_id or os.getenv(
+            "PYTEST_XDIST_TESTRUNUID", f"pid-{os.getpid()}"
+        )
+        self.state_file = Path(state_file) if state_file else None
+        if self.state_file:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._state = self._initial_state()
+
+    def _initial_state(self) -> Dict:
+        return {
+            "tokens": self.capacity,
+            "rate": self.max_rate,
+            "updated": self._clock(),
+            "blocked_until": 0.0,
+            "run": self.run_id,
+        }
+
+    @contextmanager
+    def _locked_state(self):
+        """Yield the bucket state under the thread lock (and file lock)"""
+        with self._lock:
+            if self.state_file is None or fcntl is None:
+                yield self._state
+                return
+
+            with open(self.state_file, "a+") as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                f.seek(0)
+                raw = f.read()
+                try:
+                    state = json.loads(raw) if raw else None
+                except ValueError:
+                    state = None
+                if state is None or state.get("run") != self.run_id:
+                    # Missing, corrupt or left over from an earlier run
+                    state = self._initial_state()
+                yield state
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(state))
+
+    def _refill(self, state: Dict, now: float) -> None:
+        elapsed = max(0.0, now - state["updated"])
+        state["tokens"] = min(self.capacity, state["tokens"] + elapsed * state["rate"])
+        state["updated"] = now
+
+    def acquire(self) -> float:
+        """
+        Block until a token is available and take it.
+
+        Returns:
+            Total seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._locked_state() as state:
+                now = self._clock()
+                self._refill(state, now)
+                if now >= state["blocked_until"] and state["tokens"] >= 1:
+                    state["tokens"] -= 1
+                    return waited
+                wait = max(
+                    state["blocked_until"] - now,
+                    (1 - state["tokens"]) / state["rate"],
+                )
+            self._sleep(wait)
+            waited += wait
+
+    def update_from_headers(self, headers) -> None:
+        """
+        Adapt the refill rate to the remaining quota.
+
+        The rate is lowered to spread the remaining requests evenly until
+        the quota resets, and all requests pause once the quota is used up.
+        """
+        remaining = _header_number(headers, _REMAINING_HEADERS)
+        reset = _header_number(headers, _RESET_HEADERS)
+        if remaining is None or reset is None:
+            return
+
+        # Some gateways send an epoch timestamp rather than seconds left
+        now = self._clock()
+        reset_in = reset - now if reset > now else reset
+
+        with self._locked_state() as state:
+            if remaining <= 0:
+                state["blocked_until"] = now + reset_in
+                state["tokens"] = 0
+            elif reset_in > 0:
+                sustainable = remaining / reset_in
+                state["rate"] = max(
+                    APIConfig.RATE_LIMIT_MIN_PER_SECOND,
+                    min(self.max_rate, sustainable),
+                )
+
+    def block_for(self, seconds: float) -> None:
+        """Pause all requests sharing this bucket (e.g. after a 429)"""
+        with self._locked_state() as state:
+            state["blocked_until"] = max(
+                state["blocked_until"], self._clock() + seconds
+            )
+
+
+class RetryPolicy:
+    """
+    Retry decisions with jittered exponential backoff.
+    """
+
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    # Repeating these has the same effect as sending them once (RFC 9110)
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+    def __init__(
+        self,
+        max_retries: Optional[int] = None,
+        backoff_base: Optional[float] = None,
+        backoff_max: Optional[float] = None,
+    ):
+        self.max_retries = (
+            max_retries if max_retries is not None else APIConfig.MAX_RETRIES
+        )
+        self.backoff_base = (
+            backoff_base if backoff_base is not None else APIConfig.BACKOFF_BASE
+        )
+        self.backoff_max = (
+            backoff_max if backoff_max is not None else APIConfig.BACKOFF_MAX
+        )
+
+    def can_retry(self, attempt: int, method: str = "GET") -> bool:
+        """Whether another attempt is allowed for the method"""
+        return attempt < self.max_retries and method.upper() in self.IDEMPOTENT_METHODS
+
+    def should_retry(
+        self, attempt: int, response: requests.Response, method: str = "GET"
+    ) -> bool:
+        return (
+            self.can_retry(attempt, method)
+            and response.status_code in self.RETRY_STATUSES
+        )
+
+    def delay(
+        self, attempt: int, response: Optional[requests.Response] = None
+    ) -> float:
+        """
+        Seconds to wait before the next attempt.
+
+        Retry-After wins when present, otherwise "full jitter" backoff:
+        a random delay between 0 and base * 2^attempt, capped at backoff_max.
+        """
+        if response is not None:
+            retry_after = self.retry_after(response)
+            if retry_after is not None:
+                return min(retry_after, self.backoff_max)
+
+        ceiling = min(self.backoff_max, self.backoff_base * (2**attempt))
+        return random.uniform(0, ceiling)
+
+    @staticmethod
+    def retry_after(response: requests.Response) -> Optional[float]:
+        """Parse Retry-After given as seconds or as an HTTP date"""
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
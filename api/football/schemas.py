@@ -5,14 +5,167 @@ Note: Some endpoints return strings instead of JSON objects.
 This file handles both formats.
 """
 
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, field_validator, ConfigDict
+import codecs
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Sequence, Tuple, Union
+from pydantic import (
+    BaseModel,
+    field_validator,
+    ConfigDict,
+    TypeAdapter,
+    ValidationError,
+)
 from datetime import datetime
 
 
 # ============================================
 # Helper Functions for String Responses
 # ============================================
+class CompetitionsTokenizer:
+    """
+    Incremental single-pass parser for the "{comp1,comp2,comp3}" format.
+
+    Feed it text or bytes chunks (e.g. from response.iter_content()).
+    Names may be double-quoted ("Copa, Liga") or contain backslash-escaped
+    characters (Copa\\, Liga). Whitespace around names is stripped, empty
+    names are skipped and text outside the braces is ignored. Names are
+    interned and every occurrence is counted in counts.
+
+    Args:
+        dedupe: Emit each name only on its first occurrence
+    """
+
+    _UNQUOTED = re.compile(r'[}"\\]')
+    _QUOTED = re.compile(r'["\\]')
+
+    def __init__(self, dedupe: bool = False):
+        self.dedupe = dedupe
+        self.counts: Dict[str, int] = {}
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._state = "before"
+        self._escape = False
+        self._parts: List[Tuple[str, bool]] = []
+
+    @property
+    def duplicates(self) -> Dict[str, int]:
+        """Names seen more than once, with their number of occurrences"""
+        return {name: count for name, count in self.counts.items() if count > 1}
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def _add(self, name: str, names: List[str]) -> None:
+        if not name:
+            return
+        name = sys.intern(name)
+        seen = self.counts.get(name, 0)
+        self.counts[name] = seen + 1
+        if not (seen and self.dedupe):
+            names.append(name)
+
+    def _emit(self, names: List[str]) -> None:
+        parts, self._parts = self._parts, []
+        # Only unquoted text before the first and after the last quoted
+        # (or escaped) part is stripped
+        quoted = [i for i, (_, is_quoted) in enumerate(parts) if is_quoted]
+        if not quoted:
+            self._add("".join(text for text, _ in parts).strip(), names)
+            return
+        first, last = quoted[0], quoted[-1] + 1
+        self._add(
+            "".join(text for text, _ in parts[:first]).lstrip()
+            + "".join(text for text, _ in parts[first:last])
+            + "".join(text for text, _ in parts[last:]).rstrip(),
+            names,
+        )
+
+    def feed(self, chunk: Union[str, bytes, memoryview]) -> List[str]:
+        """Parse the next chunk (str or bytes-like) and return the names it completed"""
+        text = chunk if isinstance(chunk, str) else self._decoder.decode(chunk)
+        names: List[str] = []
+        position, size = 0, len(text)
+
+        while position < size and self._state != "after":
+            if self._escape:
+                self._parts.append((text[position], True))
+                self._escape = False
+                position += 1
+                continue
+
+            if self._state == "before":
+                start = text.find("{", position)
+                if start == -1:
+                    break
+                self._state = "unquoted"
+                position = start + 1
+                continue
+
+            quoted = self._state == "quoted"
+            match = (self._QUOTED if quoted else self._UNQUOTED).search(text, position)
+            end = match.start() if match else size
+            if quoted:
+                self._parts.append((text[position:end], True))
+            elif end > position:
+                # Plain names up to the next special character are split in bulk
+                first, *rest = text[position:end].split(",")
+                self._parts.append((first, False))
+                if rest:
+                    self._emit(names)
+                    for name in rest[:-1]:
+                        self._add(name.strip(), names)
+                    self._parts.append((rest[-1], False))
+            if match is None:
+                break
+
+            position = match.end()
+            char = match.group()
+            if char == "\\":
+                self._escape = True
+            elif char == '"':
+                self._state = "unquoted" if quoted else "quoted"
+            else:
+                self._emit(names)
+                self._state = "after"
+        return names
+
+    def close(self) -> List[str]:
+        """
+        Finish parsing.
+
+        Raises:
+            ValueError if the braces were missing or a name was left open
+        """
+        names = self.feed(self._decoder.decode(b"", final=True))
+        if self._state == "before":
+            raise ValueError("No opening '{' found")
+        if self._state != "after":
+            raise ValueError(f"Unterminated competitions list ({self._state} name)")
+        return names
+
+
+def iter_competitions(
+    chunks: Iterable[Union[str, bytes]],
+    tokenizer: Optional[CompetitionsTokenizer] = None,
+) -> Iterator[str]:
+    """
+    Yield competition names from text or bytes chunks as they are parsed.
+
+    Args:
+        chunks: e.g. response.iter_content(chunk_size=8192)
+        tokenizer: Tokenizer to use, e.g. to read its counts afterwards
+    """
+    tokenizer = tokenizer or CompetitionsTokenizer()
+    for chunk in chunks:
+        yield from tokenizer.feed(chunk)
+    yield from tokenizer.close()
+
+
 def parse_competitions_string(response_text: str) -> List[str]:
     """
     Parse competitions from string format: "{comp1,comp2,comp3}"
@@ -23,10 +176,9 @@ def parse_competitions_string(response_text: str) -> List[str]:
     Returns:
         List of competition names
     """
-    if response_text.startswith("{") and response_text.endswith("}"):
-        competitions_str = response_text.strip("{}")
-        return competitions_str.split(",")
-    else:
+    try:
+        return list(iter_competitions([response_text]))
+    except ValueError:
         raise ValueError(f"Invalid competitions string format: {response_text[:100]}")
 
 
@@ -231,40 +383,216 @@ class ErrorResponse(BaseModel):
 # ============================================
 # Schema Validation Helper Functions
 # ============================================
-def validate_response_schema(response_data: dict, schema: BaseModel) -> bool:
+@lru_cache(maxsize=None)
+def get_type_adapter(schema: Any) -> TypeAdapter:
+    """
+    Get the cached TypeAdapter for a schema (a model class or a type such
+    as List[Match]), so its validator is built only once per process
+    """
+    return TypeAdapter(schema)
+
+
+class ValidationResult:
+    """
+    Outcome of a single validation pass.
+
+    Attributes:
+        value: Validated model instance, or None if validation failed
+        errors: Structured errors with "path", "loc", "msg" and "type" keys
+    """
+
+    __slots__ = ("value", "errors")
+
+    def __init__(self, value: Any = None, errors: Optional[List[Dict]] = None):
+        self.value = value
+        self.errors = errors or []
+
+    @property
+    def valid(self) -> bool:
+        return not self.errors
+
+    def messages(self) -> List[str]:
+        """Errors formatted as "path: message" strings"""
+        return [f"{error['path']}: {error['msg']}" for error in self.errors]
+
+
+def _structured_errors(error: ValidationError) -> List[Dict]:
+    return [
+        {
+            "path": ".".join(str(part) for part in item["loc"]) or "<root>",
+            "loc": item["loc"],
+            "msg": item["msg"],
+            "type": item["type"],
+        }
+        for item in error.errors(include_url=False, include_input=False)
+    ]
+
+
+def validate_payload(
+    payload: Union[bytes, bytearray, str, Dict, List], schema: Any
+) -> ValidationResult:
+    """
+    Validate a response against a schema in one pass.
+
+    Raw bytes or text (e.g. response.content) are parsed and validated
+    together by pydantic-core, without building an intermediate dict.
+
+    Args:
+        payload: Raw JSON bytes/text or already parsed data
+        schema: Pydantic BaseModel schema class or any type TypeAdapter accepts
+
+    Returns:
+        ValidationResult with the model instance or structured errors
+    """
+    adapter = get_type_adapter(schema)
+    try:
+        if isinstance(payload, (bytes, bytearray, str)):
+            return ValidationResult(value=adapter.validate_json(payload))
+        return ValidationResult(value=adapter.validate_python(payload))
+    except ValidationError as e:
+        return ValidationResult(errors=_structured_errors(e))
+
+
+def validate_response_schema(response_data: Any, schema: BaseModel) -> bool:
     """
     Validate response data against a Pydantic schema
 
     Args:
-        response_data: Dictionary containing API response
+        response_data: Dictionary containing API response, or its raw JSON bytes
         schema: Pydantic BaseModel schema class
 
     Returns:
         True if validation passes
 
     Raises:
-        ValidationError if validation fails
+        ValueError if validation fails
     """
-    try:
-        schema(**response_data)
-        return True
-    except Exception as e:
-        raise ValueError(f"Schema validation failed: {str(e)}")
+    result = validate_payload(response_data, schema)
+    if not result.valid:
+        raise ValueError(f"Schema validation failed: {'; '.join(result.messages())}")
+    return True
 
 
-def get_validation_errors(response_data: dict, schema: BaseModel) -> List[str]:
+def get_validation_errors(response_data: Any, schema: BaseModel) -> List[str]:
     """
     Get list of validation errors without raising exception
 
     Args:
-        response_data: Dictionary containing API response
+        response_data: Dictionary containing API response, or its raw JSON bytes
         schema: Pydantic BaseModel schema class
 
     Returns:
         List of validation error messages
     """
+    return validate_payload(response_data, schema).messages()
+
+
+# ============================================
+# Bulk Validation
+# ============================================
+class BulkValidationReport:
+    """
+    Aggregated result of validating many records against one schema.
+
+    Attributes:
+        total: Number of records validated
+        errors: Structured errors, each with the failing record "index"
+    """
+
+    def __init__(self, total: int, errors: List[Dict]):
+        self.total = total
+        self.errors = sorted(errors, key=lambda error: error["index"])
+
+    @property
+    def valid(self) -> bool:
+        return not self.errors
+
+    @property
+    def invalid_indices(self) -> List[int]:
+        return sorted({error["index"] for error in self.errors})
+
+    def summary(self, limit: int = 20) -> str:
+        """Counts followed by the first few errors"""
+        lines = [
+            f"Records: {self.total}, invalid: {len(self.invalid_indices)}, "
+            f"errors: {len(self.errors)}"
+        ]
+        for error in self.errors[:limit]:
+            lines.append(f"[{error['index']}] {error['path']}: {error['msg']}")
+        if len(self.errors) > limit:
+            lines.append(f"... {len(self.errors) - limit} more")
+        return "\n".join(lines)
+
+
+def _validate_chunk(schema: Any, start: int, payload: bytes) -> List[Dict]:
+    """
+    Worker: validate a JSON array of records, returning only plain error
+    dicts so no model instances cross processes
+    """
     try:
-        schema(**response_data)
+        get_type_adapter(List[schema]).validate_json(payload)
         return []
-    except Exception as e:
-        return [str(e)]
+    except ValidationError as e:
+        errors = []
+        for error in _structured_errors(e):
+            offset, *loc = error["loc"]
+            errors.append(
+                {
+                    "index": start + offset,
+                    "path": ".".join(str(part) for part in loc) or "<root>",
+                    "loc": tuple(loc),
+                    "msg": error["msg"],
+                    "type": error["type"],
+                }
+            )
+        return errors
+
+
+def validate_many(
+    records: Sequence[Dict],
+    schema: Any,
+    workers: Optional[int] = None,
+    chunk_size: int = 10_000,
+) -> BulkValidationReport:
+    """
+    Validate a large list of records (e.g. a season of Match or
+    TeamStanding dicts) across a process pool.
+
+    Records are sent to workers as JSON chunks and validated with
+    validate_json; only errors come back to the parent.
+
+    Args:
+        records: Parsed records to validate
+        schema: Pydantic BaseModel schema class for a single record
+        workers: Worker processes (defaults to the CPU count, 1 runs inline)
+        chunk_size: Records per task
+
+    Returns:
+        BulkValidationReport with errors keyed by record index
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+
+    workers = workers or os.cpu_count() or 1
+    starts = range(0, len(records), chunk_size)
+    # Serialized one at a time as they are submitted, so the parent's
+    # json.dumps overlaps with validation already running in the workers
+    chunks = (
+        (start, json.dumps(records[start : start + chunk_size]).encode())
+        for start in starts
+    )
+
+    if workers == 1 or len(starts) <= 1:
+        results = [_validate_chunk(schema, start, payload) for start, payload in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(starts))) as executor:
+            futures = [
+                executor.submit(_validate_chunk, schema, start, payload)
+                for start, payload in chunks
+            ]
+            results = [future.result() for future in futures]
+
+    return BulkValidationReport(
+        total=len(records),
+        errors=[error for errors in results for error in errors],
+    )
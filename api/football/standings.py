@@ -0,0 +1,296 @@
+"""
+League tables recomputed from match results.
+
+LeagueTable keeps running totals per team in NumPy arrays and folds in
+FINISHED matches from a MatchTable. Matches already applied are
+skipped, so calling update() after each matchday only processes the
+new results. The computed table can be ranked with the competition's
+tie-break rules and diffed against the standings returned by the API.
+
+Usage:
+    league = LeagueTable(tie_breaks_for(2021))
+    league.update(MatchTable.from_payload(matches_response.json()))
+    diffs = league.diff(StandingsTable.from_payload(standings_response.json()))
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from api.football.model import MISSING, MatchTable, StandingsTable, StringTable
+from config.constants import STANDINGS_TIE_BREAKS, TEST_COMPETITIONS
+
+TIE_BREAKS = (
+    "points",
+    "goal_difference",
+    "goals_for",
+    "won",
+    "head_to_head_points",
+    "head_to_head_goal_difference",
+)
+
+# Columns compared between the recomputed and the API table
+DIFF_FIELDS = (
+    "played_games",
+    "won",
+    "draw",
+    "lost",
+    "points",
+    "goals_for",
+    "goals_against",
+    "goal_difference",
+    "position",
+)
+
+
+def tie_breaks_for(competition_id: int) -> Tuple[str, ...]:
+    """Tie-break order for a competition ID (see STANDINGS_TIE_BREAKS)"""
+    for name, known_id in TEST_COMPETITIONS.items():
+        if known_id == competition_id and name in STANDINGS_TIE_BREAKS:
+            return STANDINGS_TIE_BREAKS[name]
+    return STANDINGS_TIE_BREAKS["default"]
+
+
+class StandingDiff:
+    """One value that differs between the recomputed and the API table"""
+
+    __slots__ = ("team_id", "team", "field", "expected", "actual")
+
+    def __init__(self, team_id, team, field, expected, actual):
+        self.team_id = team_id
+        self.team = team
+        self.field = field
+        self.expected = expected
+        self.actual = actual
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.team} ({self.team_id}) {self.field}: "
+            f"recomputed {self.expected}, API {self.actual}"
+        )
+
+
+class LeagueTable:
+    """
+    Incrementally maintained league table.
+
+    Args:
+        tie_breaks: Ranking keys after which teams are ordered by name
+        strings: String table shared with the MatchTable/StandingsTable inputs
+    """
+
+    def __init__(
+        self,
+        tie_breaks: Sequence[str] = STANDINGS_TIE_BREAKS["default"],
+        strings: Optional[StringTable] = None,
+    ):
+        unknown = [key for key in tie_breaks if key not in TIE_BREAKS]
+        if unknown:
+            raise ValueError(f"Unknown tie-break rules: {unknown}")
+        self.tie_breaks = tuple(tie_breaks)
+        self.strings = strings if strings is not None else StringTable()
+
+        self.team_ids = np.zeros(0, dtype=np.int64)
+        self.team_names = np.zeros(0, dtype=np.int32)
+        self.won = np.zeros(0, dtype=np.int32)
+        self.draw = np.zeros(0, dtype=np.int32)
+        self.lost = np.zeros(0, dtype=np.int32)
+        self.goals_for = np.zeros(0, dtype=np.int32)
+        self.goals_against = np.zeros(0, dtype=np.int32)
+        # Points and goal difference earned by row team against column team
+        self.h2h_points = np.zeros((0, 0), dtype=np.int32)
+        self.h2h_goal_difference = np.zeros((0, 0), dtype=np.int32)
+        self._applied = np.zeros(0, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.team_ids)
+
+    @property
+    def played_games(self) -> np.ndarray:
+        return self.won + self.draw + self.lost
+
+    @property
+    def points(self) -> np.ndarray:
+        return 3 * self.won + self.draw
+
+    @property
+    def goal_difference(self) -> np.ndarray:
+        return self.goals_for - self.goals_against
+
+    @property
+    def matches_applied(self) -> int:
+        return len(self._applied)
+
+    def _team_indices(self, ids: np.ndarray, names: np.ndarray) -> np.ndarray:
+        """Dense row index for each team ID, registering unseen teams"""
+        unique, first = np.unique(ids, return_index=True)
+        new = ~np.isin(unique, self.team_ids)
+        if new.any():
+            count = int(new.sum())
+            self.team_ids = np.r_[self.team_ids, unique[new]]
+            self.team_names = np.r_[self.team_names, names[first[new]]]
+            for name in ("won", "draw", "lost", "goals_for", "goals_against"):
+                setattr(
+                    self, name, np.r_[getattr(self, name), np.zeros(count, np.int32)]
+                )
+            for name in ("h2h_points", "h2h_goal_difference"):
+                setattr(self, name, np.pad(getattr(self, name), (0, count)))
+
+        order = np.argsort(self.team_ids)
+        return order[np.searchsorted(self.team_ids, ids, sorter=order)]
+
+    def update(self, matches: MatchTable) -> int:
+        """
+        Apply FINISHED matches that have not been applied yet.
+
+        Returns:
+            Number of newly applied matches
+        """
+        finished = (matches.status == matches.code_of("FINISHED")) & (
+            matches.home_goals != MISSING
+        )
+        new = finished & ~np.isin(matches.id, self._applied)
+        if not new.any():
+            return 0
+
+        if matches.strings is not self.strings:
+            names = np.array(
+                [self.strings.code(name) for name in self._names(matches, new)],
+                dtype=np.int32,
+            ).reshape(2, -1)
+        else:
+            names = np.vstack([matches.home_team[new], matches.away_team[new]])
+
+        home_goals = matches.home_goals[new].astype(np.int32)
+        away_goals = matches.away_goals[new].astype(np.int32)
+        ids = np.r_[matches.home_team_id[new], matches.away_team_id[new]]
+        index = self._team_indices(ids, np.r_[names[0], names[1]])
+        home, away = np.split(index, 2)
+        size = len(self)
+
+        def count(rows, weights):
+            return np.bincount(rows, weights, minlength=size).astype(np.int32)
+
+        home_won = home_goals > away_goals
+        drawn = home_goals == away_goals
+        away_won = home_goals < away_goals
+        self.won += count(home, home_won) + count(away, away_won)
+        self.draw += count(home, drawn) + count(away, drawn)
+        self.lost += count(home, away_won) + count(away, home_won)
+        self.goals_for += count(home, home_goals) + count(away, away_goals)
+        self.goals_against += count(home, away_goals) + count(away, home_goals)
+
+        home_points = 3 * home_won + drawn
+        away_points = 3 * away_won + drawn
+        np.add.at(self.h2h_points, (home, away), home_points)
+        np.add.at(self.h2h_points, (away, home), away_points)
+        np.add.at(self.h2h_goal_difference, (home, away), home_goals - away_goals)
+        np.add.at(self.h2h_goal_difference, (away, home), away_goals - home_goals)
+
+        self._applied = np.r_[self._applied, matches.id[new]]
+        return int(new.sum())
+
+    @staticmethod
+    def _names(matches: MatchTable, mask: np.ndarray) -> List[str]:
+        decode = matches.strings.value
+        return [decode(int(code)) for code in matches.home_team[mask]] + [
+            decode(int(code)) for code in matches.away_team[mask]
+        ]
+
+    def _rank_keys(self) -> Dict[str, np.ndarray]:
+        keys = {
+            "points": self.points,
+            "goal_difference": self.goal_difference,
+            "goals_for": self.goals_for,
+            "won": self.won,
+        }
+        if any(key.startswith("head_to_head") for key in self.tie_breaks):
+            # Mini-league between the teams level on points
+            level = self.points[:, None] == self.points[None, :]
+            keys["head_to_head_points"] = (self.h2h_points * level).sum(axis=1)
+            keys["head_to_head_goal_difference"] = (
+                self.h2h_goal_difference * level
+            ).sum(axis=1)
+        return keys
+
+    def ranking(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Row order of the table and a flag for rows whose position is only
+        decided by name (every tie-break level with a neighbour)
+        """
+        keys = self._rank_keys()
+        ranked = [-keys[key] for key in self.tie_breaks]
+        names = np.array(
+            [self.strings.value(int(code)) or "" for code in self.team_names]
+        )
+        order = np.lexsort([names] + ranked[::-1])
+
+        stacked = np.stack([key[order] for key in ranked]) if ranked else None
+        level = np.zeros(len(order), dtype=bool)
+        if stacked is not None and len(order) > 1:
+            same = (stacked[:, 1:] == stacked[:, :-1]).all(axis=0)
+            level[1:] |= same
+            level[:-1] |= same
+        return order, level
+
+    def to_standings(self) -> StandingsTable:
+        """Ranked table as a single TOTAL standings block"""
+        order, _ = self.ranking()
+        size = len(order)
+        code = self.strings.code
+        return StandingsTable(
+            {
+                "group_index": np.zeros(size),
+                "stage": np.full(size, code("REGULAR_SEASON")),
+                "type": np.full(size, code("TOTAL")),
+                "group": np.full(size, MISSING),
+                "position": np.arange(1, size + 1),
+                "team_id": self.team_ids[order],
+                "team": self.team_names[order],
+                "played_games": self.played_games[order],
+                "won": self.won[order],
+                "draw": self.draw[order],
+                "lost": self.lost[order],
+                "points": self.points[order],
+                "goals_for": self.goals_for[order],
+                "goals_against": self.goals_against[order],
+                "goal_difference": self.goal_difference[order],
+            },
+            self.strings,
+        )
+
+    def diff(
+        self, standings: StandingsTable, group_index: int = 0
+    ) -> List[StandingDiff]:
+        """
+        Compare against one block of the API standings (the TOTAL table
+        by default). Positions of teams level on every tie-break are not
+        compared, since their order is not defined by the rules.
+        """
+        expected = self.to_standings()
+        _, level = self.ranking()
+        actual = standings.block(group_index)
+
+        diffs = []
+        actual_rows = {int(team_id): i for i, team_id in enumerate(actual.team_id)}
+        for i, team_id in enumerate(expected.team_id):
+            row = expected[i]
+            j = actual_rows.pop(int(team_id), None)
+            if j is None:
+                diffs.append(
+                    StandingDiff(int(team_id), row.team, "team", "present", "missing")
+                )
+                continue
+            for field in DIFF_FIELDS:
+                if field == "position" and level[i]:
+                    continue
+                want = int(getattr(expected, field)[i])
+                got = int(getattr(actual, field)[j])
+                if want != got:
+                    diffs.append(StandingDiff(int(team_id), row.team, field, want, got))
+
+        for team_id, j in actual_rows.items():
+            diffs.append(
+                StandingDiff(team_id, actual[j].team, "team", "missing", "present")
+            )
+        return diffs
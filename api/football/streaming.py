@@ -0,0 +1,166 @@
+"""
+Streaming validation of large saved API responses.
+
+Files are memory-mapped and split into one record at a time, either
+line by line (NDJSON exports) or by walking the structure of a JSON
+document to the array of records (e.g. the "matches" array of a saved
+MatchesResponse). Each record is validated straight from its bytes, so
+memory use depends on the largest record, not on the file size.
+
+Usage:
+    for index, result in stream_validate("season.json", Match, key="matches"):
+        if not result.valid:
+            print(index, result.messages())
+"""
+
+import mmap
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Optional, Tuple, Union
+
+from api.football.schemas import ValidationResult, validate_payload
+
+NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+
+# Strings are matched whole so brackets inside them are never counted.
+# _TOKENS is used among top-level keys and _ELEMENT between the elements
+# of the target array; elsewhere only brackets matter, and _NEXT_BRACKET
+# lets the regex engine skip everything in between.
+_TOKENS = re.compile(rb'"(?:[^"\\]|\\.)*"|[\[\]{}:]')
+_NEXT_BRACKET = re.compile(rb'(?:"(?:[^"\\]|\\.)*"|[^"\[\]{}])*([\[\]{}])')
+# One element of the array being read: a string (1), the opening bracket
+# of a nested value (2), the end of the array (3) or a bare literal (4)
+_ELEMENT = re.compile(rb'[\s,]*(?:("(?:[^"\\]|\\.)*")|([\[{])|(\])|([^\s,\[\]{}"]+))')
+
+
+@contextmanager
+def _mapped(path: Union[str, Path]):
+    with open(path, "rb") as f:
+        if f.seek(0, 2) == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def iter_ndjson(path: Union[str, Path]) -> Iterator[bytes]:
+    """Yield each non-blank line of an NDJSON file"""
+    with _mapped(path) as data:
+        start, size = 0, len(data)
+        while start < size:
+            end = data.find(b"\n", start)
+            if end == -1:
+                end = size
+            line = data[start:end].strip()
+            if line:
+                yield line
+            start = end + 1
+
+
+def iter_json_array(
+    path: Union[str, Path], key: Optional[str] = None
+) -> Iterator[bytes]:
+    """
+    Yield the raw bytes of each element of a JSON array, scalars included,
+    so the Nth record yielded is always element N.
+
+    Args:
+        path: JSON file
+        key: Top-level key holding the array (None when the document is the array)
+
+    Raises:
+        ValueError: If the document has no such array or ends inside it
+    """
+    target = None if key is None else f'"{key}"'.encode()
+    with _mapped(path) as data:
+        depth, position = 0, 0
+        array_depth = 1 if key is None else None
+        pending = current_key = None
+        start = None
+
+        while True:
+            if array_depth is not None and depth == array_depth:
+                element = _ELEMENT.match(data, position)
+                if element is None:
+                    break
+                position = element.end()
+                if element.group(3):
+                    return
+                if element.group(2):
+                    depth += 1
+                    start = element.start(2)
+                else:
+                    yield element.group(1) or element.group(4)
+                continue
+
+            if depth == 1 and array_depth is None:
+                token = _TOKENS.search(data, position)
+                if token is None:
+                    break
+                char = token.group()[:1]
+            else:
+                token = _NEXT_BRACKET.match(data, position)
+                if token is None:
+                    break
+                char = token.group(1)
+            position = token.end()
+
+            if char == b'"':
+                pending = token.group()
+            elif char == b":":
+                current_key = pending
+            elif char in b"[{":
+                depth += 1
+                if key is None and depth == 1 and char != b"[":
+                    break
+                if array_depth is None and char == b"[" and depth == 2:
+                    if current_key == target:
+                        array_depth = 2
+            else:
+                depth -= 1
+                if array_depth is not None and depth == array_depth:
+                    yield data[start:position]
+                elif depth == 0:
+                    break
+
+    where = "document" if key is None else f'"{key}" key'
+    raise ValueError(f"No complete JSON array at the {where} of {path}")
+
+
+def iter_records(
+    path: Union[str, Path], key: Optional[str] = None, ndjson: Optional[bool] = None
+) -> Iterator[bytes]:
+    """
+    Yield raw records from an NDJSON or JSON file.
+
+    Args:
+        path: File to read
+        key: Top-level key holding the records in a JSON document
+        ndjson: Force the format (detected from the .ndjson/.jsonl suffix by default)
+    """
+    if ndjson is None:
+        ndjson = Path(path).suffix.lower() in NDJSON_SUFFIXES
+    return iter_ndjson(path) if ndjson else iter_json_array(path, key)
+
+
+def stream_validate(
+    path: Union[str, Path],
+    schema: Any,
+    key: Optional[str] = None,
+    ndjson: Optional[bool] = None,
+) -> Iterator[Tuple[int, ValidationResult]]:
+    """
+    Validate every record of a file one at a time.
+
+    Args:
+        path: NDJSON export or saved JSON response
+        schema: Pydantic BaseModel schema class for a single record, e.g. Match
+        key: Top-level key holding the records, e.g. "matches" or "teams"
+        ndjson: Force the format (detected from the file suffix by default)
+
+    Yields:
+        Tuple of (record index, ValidationResult with the model or errors)
+    """
+    for index, record in enumerate(iter_records(path, key, ndjson)):
+        yield index, validate_payload(record, schema)
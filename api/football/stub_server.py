@@ -0,0 +1,719 @@
+"""
+Local in-process stub of the football98 API.
+
+Serves every path in config.constants.ENDPOINTS with deterministic
+synthetic data, including the "{comp1,comp2,...}" string format of the
+competitions endpoint. Each competition gets a simulated double
+round-robin season, so matches and standings are consistent with each
+other. Latency, error/throttle/drop rates and payload sizes are
+configurable, which makes the server suitable for offline benchmarks
+and stress tests of the client, cache and schema layers.
+
+Usage:
+    with StubFootballServer(StubConfig(latency=LatencyDistribution("fixed", ms=20))) as stub:
+        client = FootballAPIClient()
+        client.base_url = stub.base_url
+
+    python -m api.football.stub_server --port 8099 --latency lognormal:40:0.5
+    FOOTBALL_API_BASE_URL=http://127.0.0.1:8099 pytest tests/api/
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import random
+import socket
+import string
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from config.api_config import APIConfig
+from config.constants import COMPETITION_TYPES, TEST_COMPETITIONS
+
+KNOWN_COMPETITIONS = {
+    TEST_COMPETITIONS["premier_league"]: ("Premier League", "PL", "LEAGUE"),
+    TEST_COMPETITIONS["bundesliga"]: ("Bundesliga", "BL1", "LEAGUE"),
+    TEST_COMPETITIONS["la_liga"]: ("Primera Division", "PD", "LEAGUE"),
+    TEST_COMPETITIONS["serie_a"]: ("Serie A", "SA", "LEAGUE"),
+    TEST_COMPETITIONS["ligue_1"]: ("Ligue 1", "FL1", "LEAGUE"),
+    TEST_COMPETITIONS["champions_league"]: ("UEFA Champions League", "CL", "CUP"),
+    TEST_COMPETITIONS["europa_league"]: ("UEFA Europa League", "EL", "CUP"),
+    TEST_COMPETITIONS["world_cup"]: ("FIFA World Cup", "WC", "CUP"),
+}
+
+_SEASON_START = datetime(2024, 8, 16, 19, 0, tzinfo=timezone.utc)
+
+
+class LatencyDistribution:
+    """
+    Response delay model.
+
+    Kinds:
+        fixed       - ms
+        uniform     - low_ms, high_ms
+        exponential - mean_ms
+        lognormal   - median_ms, sigma
+    """
+
+    KINDS = ("fixed", "uniform", "exponential", "lognormal")
+
+    def __init__(self, kind: str = "fixed", **params):
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown latency distribution: {kind}")
+        self.kind = kind
+        self.params = params
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyDistribution":
+        """Parse "fixed:20", "uniform:10:50", "exponential:30", "lognormal:40:0.5" """
+        kind, *values = spec.split(":")
+        names = {
+            "fixed": ["ms"],
+            "uniform": ["low_ms", "high_ms"],
+            "exponential": ["mean_ms"],
+            "lognormal": ["median_ms", "sigma"],
+        }.get(kind, [])
+        if len(values) != len(names):
+            raise ValueError(f"Invalid latency spec: {spec}")
+        return cls(kind, **dict(zip(names, map(float, values))))
+
+    def sample(self, rng: random.Random) -> float:
+        """Delay in seconds"""
+        p = self.params
+        if self.kind == "fixed":
+            ms = p.get("ms", 0)
+        elif self.kind == "uniform":
+            ms = rng.uniform(p["low_ms"], p["high_ms"])
+        elif self.kind == "exponential":
+            ms = rng.expovariate(1 / p["mean_ms"]) if p["mean_ms"] > 0 else 0
+        else:
+            ms = rng.lognormvariate(math.log(p["median_ms"]), p["sigma"])
+        return max(0.0, ms) / 1000
+
+
+class StubConfig:
+    """
+    Behaviour of the stub server.
+
+    Args:
+        latency: Default response delay
+        endpoint_latency: Per ENDPOINTS key overrides of latency
+        error_rate: Fraction of requests answered with HTTP 500
+        throttle_rate: Fraction answered with HTTP 429 and Retry-After
+        retry_after: Seconds sent in the Retry-After of throttled responses
+        drop_rate: Fraction of connections closed without a response
+        competitions: Number of names in the competitions string
+        duplicate_rate: Fraction of competition names repeated in that string
+        teams: Teams per league (double round-robin season)
+        matchdays_played: Finished matchdays (None plays the whole season)
+        padding_bytes: Extra filler added to every JSON payload
+        quota: Requests allowed per quota window (reported in X-RateLimit-*)
+        quota_window: Quota window length in seconds
+        seed: Seed for all generated data
+    """
+
+    def __init__(
+        self,
+        latency: Optional[LatencyDistribution] = None,
+        endpoint_latency: Optional[Dict[str, LatencyDistribution]] = None,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: int = 1,
+        drop_rate: float = 0.0,
+        competitions: int = 150,
+        duplicate_rate: float = 0.0,
+        teams: int = 20,
+        matchdays_played: Optional[int] = None,
+        padding_bytes: int = 0,
+        quota: int = 100_000,
+        quota_window: int = 86_400,
+        seed: int = 2024,
+    ):
+        self.latency = latency or LatencyDistribution("fixed", ms=0)
+        self.endpoint_latency = endpoint_latency or {}
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.drop_rate = drop_rate
+        self.competitions = competitions
+        self.duplicate_rate = duplicate_rate
+        self.teams = teams
+        self.matchdays_played = matchdays_played
+        self.padding_bytes = padding_bytes
+        self.quota = quota
+        self.quota_window = quota_window
+        self.seed = seed
+
+
+class SyntheticData:
+    """
+    Deterministic football data generated lazily per competition.
+
+    Seasons are simulated once and cached; every payload method returns
+    fresh objects, so callers may modify what they get.
+    """
+
+    def __init__(self, config: StubConfig):
+        self.config = config
+        self._seasons: Dict[int, Dict] = {}
+        self._lock = threading.Lock()
+
+    def _rng(self, *key) -> random.Random:
+        return random.Random(f"{self.config.seed}:{':'.join(map(str, key))}")
+
+    def competition_names(self) -> List[str]:
+        names = [name for name, _, _ in KNOWN_COMPETITIONS.values()]
+        index = 1
+        while len(names) < self.config.competitions:
+            names.append(f"Regional League {index}")
+            index += 1
+        names = names[: self.config.competitions]
+
+        rng = self._rng("duplicates")
+        duplicates = int(len(names) * self.config.duplicate_rate)
+        names += rng.sample(names, min(duplicates, len(names)))
+        return names
+
+    def competitions_string(self) -> str:
+        return "{" + ",".join(self.competition_names()) + "}"
+
+    def competition(self, competition_id: int) -> Dict:
+        if competition_id in KNOWN_COMPETITIONS:
+            name, code, kind = KNOWN_COMPETITIONS[competition_id]
+        else:
+            name = f"Regional League {competition_id}"
+            code = f"R{competition_id}"
+            kind = COMPETITION_TYPES["league"]
+        return {
+            "id": competition_id,
+            "name": name,
+            "code": code,
+            "type": kind,
+            "emblem": f"https://crests.example/{code}.png",
+        }
+
+    def _season_info(self, competition_id: int) -> Dict:
+        return {
+            "id": competition_id * 10 + 1,
+            "startDate": _SEASON_START.date().isoformat(),
+            "endDate": (_SEASON_START + timedelta(weeks=40)).date().isoformat(),
+            "currentMatchday": self.season(competition_id)["current_matchday"],
+        }
+
+    def _team(self, competition_id: int, index: int) -> Dict:
+        team_id = competition_id * 100 + index + 1
+        rng = self._rng("team", team_id)
+        letters = "".join(rng.choice(string.ascii_uppercase) for _ in range(3))
+        name = f"{letters.title()} FC {team_id}"
+        return {
+            "id": team_id,
+            "name": name,
+            "shortName": f"{letters.title()} FC",
+            "tla": letters,
+            "crest": f"https://crests.example/{team_id}.png",
+            "address": f"{index + 1} Stadium Road",
+            "website": f"https://{letters.lower()}{team_id}.example",
+            "founded": rng.randint(1870, 1990),
+            "clubColors": rng.choice(["Red / White", "Blue / White", "Black / Gold"]),
+            "venue": f"{letters.title()} Arena",
+        }
+
+    def season(self, competition_id: int) -> Dict:
+        """Teams, matches and standings for one competition (cached, shared)"""
+        with self._lock:
+            season = self._seasons.get(competition_id)
+            if season is None:
+                season = self._seasons[competition_id] = self._simulate(competition_id)
+            return season
+
+    def _simulate(self, competition_id: int) -> Dict:
+        rng = self._rng("season", competition_id)
+        teams = [self._team(competition_id, i) for i in range(self.config.teams)]
+        strength = {team["id"]: rng.uniform(0.6, 1.8) for team in teams}
+
+        # Circle-method double round robin
+        ids = [team["id"] for team in teams]
+        if len(ids) % 2:
+            ids.append(None)
+        rounds = []
+        rotation = list(ids)
+        for _ in range(len(ids) - 1):
+            half = len(rotation) // 2
+            pairs = list(zip(rotation[:half], reversed(rotation[half:])))
+            rounds.append([(a, b) for a, b in pairs if a and b])
+            rotation = [rotation[0], rotation[-1]] + rotation[1:-1]
+        rounds += [[(b, a) for a, b in fixtures] for fixtures in rounds]
+
+        played = self.config.matchdays_played
+        played = len(rounds) if played is None else min(played, len(rounds))
+        by_id = {team["id"]: team for team in teams}
+
+        matches = []
+        for matchday, fixtures in enumerate(rounds, start=1):
+            kickoff = _SEASON_START + timedelta(weeks=matchday - 1)
+            for home, away in fixtures:
+                match_id = competition_id * 10_000 + len(matches) + 1
+                match = {
+                    "id": match_id,
+                    "utcDate": kickoff.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    "status": "SCHEDULED",
+                    "matchday": matchday,
+                    "stage": "REGULAR_SEASON",
+                    "competition": {"id": competition_id},
+                    "homeTeam": {"id": home, "name": by_id[home]["name"]},
+                    "awayTeam": {"id": away, "name": by_id[away]["name"]},
+                    "score": {
+                        "winner": None,
+                        "duration": "REGULAR",
+                        "fullTime": {"home": None, "away": None},
+                        "halfTime": {"home": None, "away": None},
+                    },
+                }
+                if matchday <= played:
+                    home_goals = _poisson(rng, 1.45 * strength[home] / strength[away])
+                    away_goals = _poisson(rng, 1.15 * strength[away] / strength[home])
+                    match["status"] = "FINISHED"
+                    match["score"] = {
+                        "winner": (
+                            "HOME_TEAM"
+                            if home_goals > away_goals
+                            else "AWAY_TEAM" if away_goals > home_goals else "DRAW"
+                        ),
+                        "duration": "REGULAR",
+                        "fullTime": {"home": home_goals, "away": away_goals},
+                        "halfTime": {
+                            "home": rng.randint(0, home_goals),
+                            "away": rng.randint(0, away_goals),
+                        },
+                    }
+                matches.append(match)
+
+        return {
+            "teams": teams,
+            "matches": matches,
+            "table": _league_table(teams, matches),
+            "current_matchday": min(played + 1, len(rounds)),
+        }
+
+    def teams(self, competition_id: int) -> Dict:
+        teams = _fresh(self.season(competition_id)["teams"])
+        return {
+            "count": len(teams),
+            "competition": self.competition(competition_id),
+            "season": self._season_info(competition_id),
+            "teams": teams,
+        }
+
+    def standings(self, competition_id: int) -> Dict:
+        return {
+            "competition": self.competition(competition_id),
+            "season": self._season_info(competition_id),
+            "standings": [
+                {
+                    "stage": "REGULAR_SEASON",
+                    "type": "TOTAL",
+                    "group": None,
+                    "table": _fresh(self.season(competition_id)["table"]),
+                }
+            ],
+        }
+
+    def matches(self, competition_ids: List[int], status: Optional[str]) -> Dict:
+        matches = [
+            _fresh(match)
+            for competition_id in competition_ids
+            for match in self.season(competition_id)["matches"]
+            if status is None or match["status"] == status
+        ]
+        return {"count": len(matches), "matches": matches}
+
+    def match(self, match_id: int) -> Optional[Dict]:
+        competition_id, index = divmod(match_id, 10_000)
+        matches = self.season(competition_id)["matches"]
+        if not 0 < index <= len(matches):
+            return None
+        return _fresh(matches[index - 1])
+
+    def team(self, team_id: int) -> Dict:
+        competition_id, index = divmod(team_id, 100)
+        team = dict(self._team(competition_id, index - 1))
+        team["squad"] = self.players(team_id)
+        return team
+
+    def players(self, team_id: int) -> List[Dict]:
+        rng = self._rng("players", team_id)
+        positions = ["Goalkeeper", "Defence", "Midfield", "Offence"]
+        return [
+            {
+                "id": team_id * 100 + number,
+                "name": f"Player {team_id}-{number}",
+                "position": positions[min(3, number // 6)],
+                "shirtNumber": number,
+                "nationality": rng.choice(["England", "Spain", "Brazil", "France"]),
+            }
+            for number in range(1, 24)
+        ]
+
+    def scorers(self, competition_id: int) -> Dict:
+        rng = self._rng("scorers", competition_id)
+        teams = self.season(competition_id)["teams"]
+        scorers = sorted(
+            (
+                {
+                    "player": {
+                        "id": team["id"] * 100 + 9,
+                        "name": f"Striker {team['id']}",
+                    },
+                    "team": {"id": team["id"], "name": team["name"]},
+                    "goals": rng.randint(3, 30),
+                }
+                for team in teams
+            ),
+            key=lambda scorer: -scorer["goals"],
+        )[:10]
+        return {
+            "count": len(scorers),
+            "competition": self.competition(competition_id),
+            "season": self._season_info(competition_id),
+            "scorers": scorers,
+        }
+
+    def head_to_head(self, match_id: int) -> Optional[Dict]:
+        match = self.match(match_id)
+        if match is None:
+            return None
+        competition_id = match_id // 10_000
+        pair = {match["homeTeam"]["id"], match["awayTeam"]["id"]}
+        meetings = [
+            _fresh(other)
+            for other in self.season(competition_id)["matches"]
+            if {other["homeTeam"]["id"], other["awayTeam"]["id"]} == pair
+        ]
+        return {"count": len(meetings), "matches": meetings}
+
+
+def _fresh(value):
+    """Deep copy of JSON-like data, faster than copy.deepcopy"""
+    if isinstance(value, dict):
+        return {key: _fresh(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_fresh(item) for item in value]
+    return value
+
+
+def _poisson(rng: random.Random, mean: float) -> int:
+    limit, k, p = math.exp(-mean), 0, 1.0
+    while True:
+        p *= rng.random()
+        if p <= limit:
+            return k
+        k += 1
+
+
+def _league_table(teams: List[Dict], matches: List[Dict]) -> List[Dict]:
+    rows = {
+        team["id"]: {
+            "team": {"id": team["id"], "name": team["name"]},
+            "playedGames": 0,
+            "won": 0,
+            "draw": 0,
+            "lost": 0,
+            "points": 0,
+            "goalsFor": 0,
+            "goalsAgainst": 0,
+        }
+        for team in teams
+    }
+    for match in matches:
+        if match["status"] != "FINISHED":
+            continue
+        goals = match["score"]["fullTime"]
+        sides = (
+            (match["homeTeam"]["id"], goals["home"], goals["away"]),
+            (match["awayTeam"]["id"], goals["away"], goals["home"]),
+        )
+        for team_id, scored, conceded in sides:
+            row = rows[team_id]
+            row["playedGames"] += 1
+            row["goalsFor"] += scored
+            row["goalsAgainst"] += conceded
+            if scored > conceded:
+                row["won"] += 1
+                row["points"] += 3
+            elif scored == conceded:
+                row["draw"] += 1
+                row["points"] += 1
+            else:
+                row["lost"] += 1
+
+    table = sorted(
+        rows.values(),
+        key=lambda row: (
+            -row["points"],
+            -(row["goalsFor"] - row["goalsAgainst"]),
+            -row["goalsFor"],
+            row["team"]["name"],
+        ),
+    )
+    return [
+        {
+            "position": position,
+            **row,
+            "goalDifference": row["goalsFor"] - row["goalsAgainst"],
+        }
+        for position, row in enumerate(table, start=1)
+    ]
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "_StubHTTPServer"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.server.stub.handle(self)
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    stub: "StubFootballServer"
+
+
+class StubFootballServer:
+    """
+    Threaded HTTP server serving synthetic football98 responses.
+
+    Args:
+        config: Data and fault injection settings
+        host: Interface to bind
+        port: Port to bind (0 picks a free one)
+        sleep: Called with each sampled response delay (time.sleep); tests
+            can pass a barrier or recorder instead of waiting in real time
+        clock: Time source of the quota window (time.time)
+    """
+
+    def __init__(
+        self,
+        config: Optional[StubConfig] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.config = config or StubConfig()
+        self._sleep = sleep
+        self._clock = clock
+        self.data = SyntheticData(self.config)
+        self.requests: Counter = Counter()
+        self._requests_lock = threading.Lock()  # handlers run on their own threads
+        self._rng = random.Random(self.config.seed)
+        self._rng_lock = threading.Lock()
+        self._quota_started = clock()
+        self._quota_used = 0
+        self._httpd = _StubHTTPServer((host, port), _StubHandler)
+        self._httpd.stub = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubFootballServer":
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="football-stub", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "StubFootballServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def _random(self) -> float:
+        with self._rng_lock:
+            return self._rng.random()
+
+    def _payload(self, key: str, ids: Dict[str, str], query: Dict) -> Optional[object]:
+        def number(name):
+            return int(ids[name])
+
+        if key == "competitions":
+            return self.data.competitions_string()
+        if key == "competition_details":
+            return self.data.competition(number("id"))
+        if key == "teams":
+            return self.data.teams(number("competition_id"))
+        if key == "team_details":
+            return self.data.team(number("id"))
+        if key == "team_players":
+            return {"players": self.data.players(number("id"))}
+        if key == "player_details":
+            player_id = number("id")
+            players = self.data.players(player_id // 100)
+            return next((p for p in players if p["id"] == player_id), None)
+        if key == "standings":
+            return self.data.standings(number("competition_id"))
+        if key == "competition_scorers":
+            return self.data.scorers(number("id"))
+        if key == "matches":
+            requested = query.get("competitions", [""])[0]
+            ids_ = [int(i) for i in requested.split(",") if i] or [
+                TEST_COMPETITIONS["premier_league"]
+            ]
+            return self.data.matches(ids_, query.get("status", [None])[0])
+        if key == "match_details":
+            return self.data.match(number("id"))
+        if key == "head_to_head":
+            return self.data.head_to_head(int(query.get("matchId", ["0"])[0]))
+        return None
+
+    def handle(self, handler: BaseHTTPRequestHandler) -> None:
+        parts = urlsplit(handler.path)
+        key, ids = APIConfig.match_endpoint(parts.path)
+        with self._requests_lock:
+            self.requests[key or parts.path] += 1
+
+        latency = self.config.endpoint_latency.get(key, self.config.latency)
+        with self._rng_lock:
+            delay = latency.sample(self._rng)
+        self._sleep(delay)
+
+        roll = self._random()
+        if roll < self.config.drop_rate:
+            handler.close_connection = True
+            handler.connection.shutdown(socket.SHUT_RDWR)
+            return
+        roll -= self.config.drop_rate
+        if roll < self.config.throttle_rate:
+            self._send(
+                handler,
+                HTTPStatus.TOO_MANY_REQUESTS,
+                {"message": "Too many requests"},
+                {"Retry-After": str(self.config.retry_after)},
+            )
+            return
+        roll -= self.config.throttle_rate
+        if roll < self.config.error_rate:
+            self._send(
+                handler,
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                {"message": "Injected failure"},
+            )
+            return
+
+        try:
+            payload = self._payload(key, ids, parse_qs(parts.query)) if key else None
+        except ValueError:
+            payload = None
+        if payload is None:
+            self._send(
+                handler,
+                HTTPStatus.NOT_FOUND,
+                {"message": f"Not found: {parts.path}", "errorCode": 404},
+            )
+            return
+
+        self._send(handler, HTTPStatus.OK, payload)
+
+    def _quota_headers(self) -> Dict[str, str]:
+        with self._rng_lock:
+            now = self._clock()
+            if now - self._quota_started >= self.config.quota_window:
+                self._quota_started, self._quota_used = now, 0
+            self._quota_used += 1
+            remaining = max(0, self.config.quota - self._quota_used)
+            reset = self.config.quota_window - (now - self._quota_started)
+        return {
+            "X-RateLimit-Requests-Limit": str(self.config.quota),
+            "X-RateLimit-Requests-Remaining": str(remaining),
+            "X-RateLimit-Requests-Reset": str(int(reset)),
+        }
+
+    def _send(
+        self,
+        handler: BaseHTTPRequestHandler,
+        status: HTTPStatus,
+        payload,
+        extra_headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        if isinstance(payload, str):
+            body = payload.encode()
+        else:
+            if self.config.padding_bytes and isinstance(payload, dict):
+                payload = {**payload, "padding": "x" * self.config.padding_bytes}
+            body = json.dumps(payload, separators=(",", ":")).encode()
+
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        if status == HTTPStatus.OK and handler.headers.get("If-None-Match") == etag:
+            status, body = HTTPStatus.NOT_MODIFIED, b""
+
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(body)))
+        handler.send_header("ETag", etag)
+        for name, value in {**self._quota_headers(), **(extra_headers or {})}.items():
+            handler.send_header(name, value)
+        handler.end_headers()
+        handler.wfile.write(body)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Local football98 API stub server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument(
+        "--latency",
+        type=LatencyDistribution.parse,
+        default=LatencyDistribution("fixed", ms=0),
+        help='e.g. "fixed:20", "uniform:10:50", "exponential:30", "lognormal:40:0.5"',
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    parser.add_argument("--competitions", type=int, default=150)
+    parser.add_argument("--teams", type=int, default=20)
+    parser.add_argument("--padding-bytes", type=int, default=0)
+    parser.add_argument("--seed", type=int, default=2024)
+    args = parser.parse_args(argv)
+
+    config = StubConfig(
+        latency=args.latency,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        drop_rate=args.drop_rate,
+        competitions=args.competitions,
+        teams=args.teams,
+        padding_bytes=args.padding_bytes,
+        seed=args.seed,
+    )
+    server = StubFootballServer(config, host=args.host, port=args.port).start()
+    print(f"Football API stub listening on {server.base_url} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
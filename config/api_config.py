@@ -3,13 +3,29 @@ API configuration for Football API tests.
 """
 
 import os
+import re
+import string
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Optional, Tuple
 from dotenv import load_dotenv
 from config.constants import (
     FOOTBALL_API_BASE_URL,
     RAPIDAPI_HOST,
     ENDPOINTS,
     API_TIMEOUT,
+    API_MAX_CONCURRENCY,
+    API_CACHE_MAX_BYTES,
+    API_CACHE_DEFAULT_TTL,
+    API_CACHE_TTLS,
+    API_ATTACHMENT_MAX_BYTES,
+    API_RATE_LIMIT_PER_SECOND,
+    API_RATE_LIMIT_MIN_PER_SECOND,
+    API_RATE_LIMIT_BURST,
+    API_MAX_RETRIES,
+    API_BACKOFF_BASE,
+    API_BACKOFF_MAX,
 )
 
 # Load .env file if it exists (for local development)
@@ -17,20 +33,54 @@ env_path = Path(__file__).parent.parent / ".env"
 if env_path.exists():
     load_dotenv(env_path)
 
-# Get API key from environment
-RAPIDAPI_KEY = os.getenv("RAPIDAPI_KEY")
 
-if not RAPIDAPI_KEY:
-    raise ValueError(
-        "RAPIDAPI_KEY environment variable is not set. "
-        "Please create a .env file with RAPIDAPI_KEY or set it as an environment variable."
-    )
+def _require_api_key() -> str:
+    """
+    Reads RAPIDAPI_KEY from the environment, raising only when the key is
+    actually needed so UI-only runs can import this module without it.
+    """
+    key = os.getenv("RAPIDAPI_KEY")
+    if not key:
+        raise ValueError(
+            "RAPIDAPI_KEY environment variable is not set. "
+            "Please create a .env file with RAPIDAPI_KEY or set it as an environment variable."
+        )
+    return key
+
+
+def _build_headers() -> dict:
+    return {
+        "X-RapidAPI-Key": _require_api_key(),
+        "X-RapidAPI-Host": RAPIDAPI_HOST,
+    }
+
+
+def __getattr__(name):
+    # Module-level RAPIDAPI_KEY / FOOTBALL_API_HEADERS, resolved on access
+    if name == "RAPIDAPI_KEY":
+        return _require_api_key()
+    if name == "FOOTBALL_API_HEADERS":
+        return _build_headers()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _Resolved:
+    """
+    Class attribute computed from the environment on first access and
+    memoized once that succeeds; a failed resolve is retried next time.
+    """
+
+    def __init__(self, resolve):
+        self.resolve = resolve
+        self.value = None
 
-# Build headers with the API key from environment
-FOOTBALL_API_HEADERS = {
-    "X-RapidAPI-Key": RAPIDAPI_KEY,
-    "X-RapidAPI-Host": RAPIDAPI_HOST,
-}
+    def __get__(self, instance, owner=None):
+        if self.value is None:
+            self.value = self.resolve()
+        return self.value
+
+    def reset(self) -> None:
+        self.value = None
 
 
 class APIConfig:
@@ -38,12 +88,67 @@ class APIConfig:
     Configuration class for Football API settings.
     """
 
-    FOOTBALL_API_BASE_URL = FOOTBALL_API_BASE_URL
-    RAPIDAPI_KEY = RAPIDAPI_KEY
+    # Overridable to point the client at a local stub (api/football/stub_server.py)
+    FOOTBALL_API_BASE_URL = os.getenv("FOOTBALL_API_BASE_URL", FOOTBALL_API_BASE_URL)
+    # Read from the environment on first access; a missing key raises ValueError then
+    RAPIDAPI_KEY = _Resolved(_require_api_key)
     RAPIDAPI_HOST = RAPIDAPI_HOST
-    HEADERS = FOOTBALL_API_HEADERS
+    HEADERS = _Resolved(lambda: MappingProxyType(_build_headers()))
     ENDPOINTS = ENDPOINTS
     TIMEOUT = API_TIMEOUT
+    MAX_CONCURRENCY = API_MAX_CONCURRENCY
+
+    # Opt-in persistent response cache
+    CACHE_ENABLED = os.getenv("API_CACHE", "false").lower() == "true"
+    CACHE_DIR = Path(
+        os.getenv("API_CACHE_DIR", Path(__file__).parent.parent / ".cache" / "api")
+    )
+    CACHE_MAX_BYTES = int(os.getenv("API_CACHE_MAX_BYTES", API_CACHE_MAX_BYTES))
+    CACHE_DEFAULT_TTL = API_CACHE_DEFAULT_TTL
+    CACHE_TTLS = API_CACHE_TTLS
+
+    # Record/replay cassettes: "off", "record" or "replay"
+    CASSETTE_MODE = os.getenv("API_CASSETTE_MODE", "off").lower()
+    CASSETTE_PATH = Path(
+        os.getenv(
+            "API_CASSETTE_PATH",
+            Path(__file__).parent.parent / "tests" / "cassettes" / "football_api.json",
+        )
+    )
+    CASSETTE_MATCH = os.getenv("API_CASSETTE_MATCH", "exact").lower()
+    CASSETTE_STRICT = os.getenv("API_CASSETTE_STRICT", "false").lower() == "true"
+
+    # Client-side throttling (0 disables) shared through RATE_LIMIT_STATE_FILE
+    RATE_LIMIT_PER_SECOND = float(
+        os.getenv("API_RATE_LIMIT_PER_SECOND", API_RATE_LIMIT_PER_SECOND)
+    )
+    RATE_LIMIT_MIN_PER_SECOND = API_RATE_LIMIT_MIN_PER_SECOND
+    RATE_LIMIT_BURST = float(os.getenv("API_RATE_LIMIT_BURST", API_RATE_LIMIT_BURST))
+    RATE_LIMIT_STATE_FILE = Path(
+        os.getenv(
+            "API_RATE_LIMIT_STATE_FILE",
+            Path(__file__).parent.parent / ".cache" / "api" / "rate_limit.json",
+        )
+    )
+    MAX_RETRIES = int(os.getenv("API_MAX_RETRIES", API_MAX_RETRIES))
+    BACKOFF_BASE = API_BACKOFF_BASE
+    BACKOFF_MAX = API_BACKOFF_MAX
+
+    # Allure response attachments: off, headers, truncated, full, on_failure
+    ATTACHMENT_MODE = os.getenv("API_ATTACHMENTS", "full").lower()
+    ATTACHMENT_MAX_BYTES = int(
+        os.getenv("API_ATTACHMENT_MAX_BYTES", API_ATTACHMENT_MAX_BYTES)
+    )
+
+    @classmethod
+    def reset_credentials(cls) -> None:
+        """
+        Forget the memoized RAPIDAPI_KEY and HEADERS, so the next access
+        reads the environment again (e.g. after a test changes it).
+        """
+        for attribute in vars(cls).values():
+            if isinstance(attribute, _Resolved):
+                attribute.reset()
 
     @classmethod
     def get_endpoint_url(cls, endpoint: str, **kwargs) -> str:
@@ -54,3 +159,70 @@ class APIConfig:
         if kwargs:
             path = path.format(**kwargs)
         return f"{cls.FOOTBALL_API_BASE_URL}{path}"
+
+    @classmethod
+    def endpoint_fields(cls, endpoint: str) -> Tuple[str, ...]:
+        """
+        Placeholder names of an endpoint path, e.g. "standings" -> ("competition_id",).
+        """
+        if endpoint not in cls.ENDPOINTS:
+            raise ValueError(f"Unknown endpoint: {endpoint}")
+        return _template_fields(cls.ENDPOINTS[endpoint])
+
+    @classmethod
+    def endpoint_path(cls, endpoint: str, item_id: Any) -> str:
+        """
+        Formats an endpoint path that has exactly one placeholder,
+        e.g. endpoint_path("standings", 2021).
+        """
+        fields = cls.endpoint_fields(endpoint)
+        if len(fields) != 1:
+            raise ValueError(
+                f"Endpoint '{endpoint}' must have exactly one placeholder, got {list(fields)}"
+            )
+        return cls.ENDPOINTS[endpoint].format(**{fields[0]: item_id})
+
+    @classmethod
+    def match_endpoint(cls, path: str) -> Tuple[Optional[str], Dict[str, str]]:
+        """
+        Resolves a request path to its endpoint key and placeholder values, e.g.
+        "/competitions/2021/standings" -> ("standings", {"competition_id": "2021"}).
+        """
+        path = path.split("?", 1)[0]
+        for key, pattern in _endpoint_patterns(tuple(cls.ENDPOINTS.items())):
+            match = pattern.fullmatch(path)
+            if match:
+                return key, match.groupdict()
+        return None, {}
+
+    @classmethod
+    def resolve_endpoint(cls, path: str) -> Optional[str]:
+        """
+        Resolves a request path back to its endpoint key, e.g.
+        "/competitions/2021/standings" -> "standings".
+        """
+        return cls.match_endpoint(path)[0]
+
+
+@lru_cache(maxsize=None)
+def _template_fields(template: str) -> Tuple[str, ...]:
+    return tuple(name for _, name, _, _ in string.Formatter().parse(template) if name)
+
+
+@lru_cache(maxsize=None)
+def _endpoint_patterns(endpoints):
+    """
+    Compiles endpoint templates to regexes with one named group per
+    placeholder, literal paths first so that "/matches/head2head" wins
+    over "/matches/{id}".
+    """
+    patterns = []
+    for key, template in endpoints:
+        regex = ""
+        for literal, field, _, _ in string.Formatter().parse(template):
+            regex += re.escape(literal)
+            if field:
+                regex += f"(?P<{field}>[^/]+)"
+        patterns.append((len(_template_fields(template)), key, re.compile(regex)))
+    patterns.sort(key=lambda item: item[0])
+    return [(key, pattern) for _, key, pattern in patterns]
@@ -1,10 +1,97 @@
 """
 Configuration management for test framework.
+
+Settings are layered, later layers winning:
+    defaults (Config.DEFAULTS) -> config/env.json section -> environment
+    variables -> CLI options (--test-env, --browser, --device-type, --headless)
+
+Config.resolve() memoizes each combination, so env.json is parsed once
+per file change and every fixture asking for the same settings gets the
+same object. Config.matrix() expands comma-separated values into one
+Settings per combination, which tests/e2e/conftest.py parametrizes over
+to cover several environments or device types in one session:
+    pytest tests/e2e --device-type desktop,mobile
 """
 
 import os
 import json
+import itertools
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+# Environment variable read for each setting
+_ENV_VARS = {
+    "base_url": "BASE_URL",
+    "browser": "BROWSER",
+    "device_type": "DEVICE_TYPE",
+    "headless": "HEADLESS",
+    "page_load_timeout": "PAGE_LOAD_TIMEOUT",
+    "chromedriver_path": "CHROMEDRIVER_PATH",
+    "driver_offline": "DRIVER_OFFLINE",
+}
+
+
+def _as_bool(value) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "on")
+    return bool(value)
+
+
+class Settings:
+    """
+    Resolved configuration for one environment/browser/device combination.
+    Instances are shared between callers and must not be modified. Two
+    instances are equal when their resolved attributes are, however the
+    inputs were spelled (e.g. headless="false" and headless=False).
+    """
+
+    __slots__ = (
+        "env",
+        "base_url",
+        "browser",
+        "device_type",
+        "headless",
+        "page_load_timeout",
+        "chromedriver_path",
+        "driver_offline",
+        "values",
+    )
+
+    def __init__(self, env: str, values: Mapping):
+        self.env = env
+        self.base_url = values["base_url"]
+        self.browser = values["browser"].lower()
+        self.device_type = values["device_type"].lower()
+        self.headless = _as_bool(values["headless"])
+        self.page_load_timeout = int(values["page_load_timeout"])
+        # Pinned chromedriver binary; offline forbids downloading one
+        self.chromedriver_path = values["chromedriver_path"] or None
+        self.driver_offline = _as_bool(values["driver_offline"])
+        # Every merged key, including env.json entries without an attribute
+        self.values = MappingProxyType(dict(values))
+
+    @property
+    def id(self) -> str:
+        """Short label used as pytest parameter ID, e.g. "e2e-chrome-mobile" """
+        headless = "-headless" if self.headless else ""
+        return f"{self.env}-{self.browser}-{self.device_type}{headless}"
+
+    def _key(self) -> Tuple:
+        # Resolved attributes; values holds the raw inputs they came from
+        return tuple(getattr(self, name) for name in self.__slots__ if name != "values")
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Settings):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        return f"Settings({self.id}, base_url={self.base_url!r})"
 
 
 class Config:
@@ -13,24 +100,109 @@ class Config:
     """
 
     BASE_DIR = Path(__file__).resolve().parent.parent
+    ENV_FILE = BASE_DIR / "config" / "env.json"
 
-    ENV = os.getenv("TEST_ENV", "e2e")
-
-    BROWSER = os.getenv("BROWSER", "chrome")
-    HEADLESS = os.getenv("HEADLESS", "false").lower() == "true"
-    DEVICE_TYPE = os.getenv("DEVICE_TYPE", "desktop")
+    DEFAULT_ENV = "e2e"
+    DEFAULTS = {
+        "base_url": "",
+        "browser": "chrome",
+        "device_type": "desktop",
+        "headless": False,
+        "page_load_timeout": 10,
+        "chromedriver_path": "",
+        "driver_offline": False,
+    }
 
-    PAGE_LOAD_TIMEOUT = 10
+    PAGE_LOAD_TIMEOUT = DEFAULTS["page_load_timeout"]
 
     REPORTS_DIR = BASE_DIR / "reports"
     ALLURE_RESULTS_DIR = REPORTS_DIR / "allure-results"
 
     @classmethod
-    def load_environment_config(cls):
+    def load_environment_config(cls, env: Optional[str] = None) -> Dict:
         """
         Loads environment-specific configuration from env.json file.
+        The file is parsed once and re-read only when it changes.
+
+        Raises:
+            FileNotFoundError: If env.json does not exist
         """
-        env_file = cls.BASE_DIR / "config" / "env.json"
-        with open(env_file) as f:
-            environments = json.load(f)
-        return environments.get(cls.ENV, {})
+        env = env or os.getenv("TEST_ENV", cls.DEFAULT_ENV)
+        return dict(_environments(cls.ENV_FILE, _mtime(cls.ENV_FILE)).get(env, {}))
+
+    @classmethod
+    def resolve(cls, env: Optional[str] = None, **overrides) -> Settings:
+        """
+        Settings for one environment, memoized per combination of inputs.
+
+        Args:
+            env: Section of env.json (TEST_ENV or DEFAULT_ENV if None)
+            overrides: CLI-level values (e.g. device_type="mobile"); None is ignored
+
+        Raises:
+            FileNotFoundError: If env.json does not exist
+            ValueError: If no layer provides a base_url for env
+        """
+        env = env or os.getenv("TEST_ENV", cls.DEFAULT_ENV)
+        return _resolve(
+            cls.ENV_FILE,
+            _mtime(cls.ENV_FILE),
+            env,
+            tuple(sorted((k, v) for k, v in overrides.items() if v is not None)),
+            tuple(os.getenv(name) for name in _ENV_VARS.values()),
+        )
+
+    @classmethod
+    def matrix(
+        cls,
+        envs: Optional[Iterable[str]] = None,
+        browsers: Optional[Iterable[str]] = None,
+        device_types: Optional[Iterable[str]] = None,
+        headless: Optional[Iterable[bool]] = None,
+    ) -> List[Settings]:
+        """
+        Settings for every combination of the given values. A None axis
+        falls back to the lower layers (a single value).
+        """
+        axes = [
+            list(values) if values else [None]
+            for values in (envs, browsers, device_types, headless)
+        ]
+        return [
+            cls.resolve(env, browser=browser, device_type=device, headless=mode)
+            for env, browser, device, mode in itertools.product(*axes)
+        ]
+
+
+def _mtime(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Environment config not found: {path}") from None
+
+
+@lru_cache(maxsize=8)
+def _environments(path: Path, mtime: float) -> Mapping:
+    with open(path) as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=64)
+def _resolve(
+    path: Path,
+    mtime: float,
+    env: str,
+    overrides: Tuple[Tuple[str, object], ...],
+    env_values: Tuple[Optional[str], ...],
+) -> Settings:
+    values = dict(Config.DEFAULTS)
+    values.update(_environments(path, mtime).get(env, {}))
+    values.update(
+        (key, value) for key, value in zip(_ENV_VARS, env_values) if value is not None
+    )
+    values.update(overrides)
+    if not values["base_url"]:
+        raise ValueError(
+            f"No base_url for environment '{env}': add it to {path} or set BASE_URL"
+        )
+    return Settings(env, values)
@@ -1,5 +1,11 @@
 # E2E Configuration
 E2E_BASE_URL = "https://m.twitch.tv/"
+# Browsers are reused across tests and replaced after this many uses
+DRIVER_POOL_MAX_USES = 25
+# Browsers started in the background per settings combination before tests run
+DRIVER_POOL_PREWARM = 1
+# Resolved chromedriver binaries per Chrome major version
+DRIVER_MANIFEST_PATH = ".cache/webdriver/chromedriver.json"
 
 # Football API Configuration
 FOOTBALL_API_BASE_URL = "https://football98.p.rapidapi.com"
@@ -44,3 +50,68 @@ COMPETITION_TYPES = {"league": "LEAGUE", "cup": "CUP"}
 
 # Timeouts
 API_TIMEOUT = 30
+
+# Concurrency
+API_MAX_CONCURRENCY = 8
+
+# Response cache (opt-in, seconds per endpoint key)
+API_CACHE_MAX_BYTES = 50 * 1024 * 1024
+API_CACHE_DEFAULT_TTL = 60 * 60
+API_CACHE_TTLS = {
+    "competitions": 24 * 60 * 60,
+    "competition_details": 24 * 60 * 60,
+    "teams": 24 * 60 * 60,
+    "team_details": 24 * 60 * 60,
+    "standings": 60 * 60,
+    "competition_scorers": 60 * 60,
+    "matches": 5 * 60,
+    "match_details": 5 * 60,
+    "head_to_head": 60 * 60,
+}
+
+# Rate limiting and retries
+API_RATE_LIMIT_PER_SECOND = 5
+API_RATE_LIMIT_MIN_PER_SECOND = 0.1
+API_RATE_LIMIT_BURST = 5
+API_MAX_RETRIES = 3
+API_BACKOFF_BASE = 0.5
+API_BACKOFF_MAX = 30
+
+# Latency SLA sampling (@pytest.mark.latency)
+LATENCY_WARMUP = 2
+LATENCY_OUTLIER_K = 3.0
+
+# Allure response attachments
+API_ATTACHMENT_MAX_BYTES = 64 * 1024
+
+# Standings tie-break order per competition (keys in TEST_COMPETITIONS)
+STANDINGS_TIE_BREAKS = {
+    "default": ("points", "goal_difference", "goals_for"),
+    "la_liga": (
+        "points",
+        "head_to_head_points",
+        "head_to_head_goal_difference",
+        "goal_difference",
+        "goals_for",
+    ),
+    "serie_a": (
+        "points",
+        "head_to_head_points",
+        "head_to_head_goal_difference",
+        "goal_difference",
+        "goals_for",
+    ),
+}
+
+# Collection startup budget (tests/test_startup.py, python -X importtime)
+STARTUP_IMPORT_BUDGET_MS = 1500
+# Modules that collecting the UI suite must not import
+STARTUP_DEFERRED_MODULES = (
+    "requests",
+    "pydantic",
+    "numpy",
+    "selenium",
+    "webdriver_manager",
+    "api.football",
+    "config.api_config",
+)
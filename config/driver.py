@@ -1,35 +1,203 @@
 """
 WebDriver Factory for creating browser driver instances.
+
+DriverPool keeps warm browsers per worker and resets their state between
+tests instead of starting a new browser for every test. Pools are shared
+per settings combination through DriverFactory.pool(), and
+DriverFactory.prewarm() starts browsers on background threads so one is
+ready before the first test asks for it.
+
+ChromeDriverResolver finds the chromedriver binary without the network
+once it has been resolved: a pinned path, a manifest of previously
+resolved binaries per Chrome major version, or a matching chromedriver
+on PATH. Downloading is the last resort and can be disabled.
 """
 
+import json
+import os
+import re
+import shutil
+import subprocess
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
 from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
-from config.config import Config
+from config.config import Config, Settings
+from config.constants import (
+    DRIVER_MANIFEST_PATH,
+    DRIVER_POOL_MAX_USES,
+    DRIVER_POOL_PREWARM,
+)
+from utils.stats import percentile
+
+_VERSION = re.compile(r"(\d+)\.\d+\.\d+(?:\.\d+)?")
+
+
+def _major(version: Optional[str]) -> Optional[str]:
+    match = _VERSION.search(version or "")
+    return match.group(1) if match else None
+
+
+class ChromeDriverResolver:
+    """
+    Locates a chromedriver binary matching the local Chrome.
+
+    Resolution order:
+        1. pinned path (CHROMEDRIVER_PATH / env.json "chromedriver_path")
+        2. manifest entry for the Chrome major version, if the file still exists
+        3. chromedriver on PATH whose major version matches Chrome
+        4. download through webdriver_manager, unless offline
+    Steps 3 and 4 record their result in the manifest, so later sessions
+    resolve at step 2 without running anything.
+
+    Args:
+        manifest_path: JSON manifest of resolved binaries (DRIVER_MANIFEST_PATH)
+        pinned_path: Binary to use as is
+        offline: Raise instead of downloading
+        chrome_version: Local Chrome version (detected if None)
+        downloader: Callable returning a downloaded binary path
+    """
+
+    def __init__(
+        self,
+        manifest_path: Optional[Path] = None,
+        pinned_path: Optional[str] = None,
+        offline: bool = False,
+        chrome_version: Optional[str] = None,
+        downloader: Optional[Callable[[], str]] = None,
+    ):
+        self.manifest_path = Path(
+            manifest_path
+            or os.getenv("DRIVER_MANIFEST_PATH", Config.BASE_DIR / DRIVER_MANIFEST_PATH)
+        )
+        self.pinned_path = pinned_path
+        self.offline = offline
+        self._chrome_version = chrome_version
+        self.downloader = downloader or self._download
+
+    @property
+    def chrome_version(self) -> Optional[str]:
+        """Version of the installed Chrome, read from the OS (no network)"""
+        if self._chrome_version is None:
+            from webdriver_manager.core.os_manager import (
+                ChromeType,
+                OperationSystemManager,
+            )
+
+            self._chrome_version = (
+                OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+                or ""
+            )
+        return self._chrome_version or None
+
+    def resolve(self) -> str:
+        """Path to a chromedriver binary for the local Chrome"""
+        if self.pinned_path:
+            if not os.path.isfile(self.pinned_path):
+                raise FileNotFoundError(
+                    f"Pinned chromedriver not found: {self.pinned_path}"
+                )
+            return self.pinned_path
+
+        key = _major(self.chrome_version) or "unknown"
+        manifest = self._read_manifest()
+        entry = manifest.get(key)
+        if entry and os.path.isfile(entry["path"]):
+            return entry["path"]
+
+        on_path = shutil.which("chromedriver")
+        if on_path:
+            driver_version = self.driver_version(on_path)
+            if key == "unknown" or _major(driver_version) == key:
+                return self._record(manifest, key, on_path, driver_version, "path")
+
+        if self.offline:
+            raise RuntimeError(
+                f"No chromedriver for Chrome {self.chrome_version or '(not found)'} "
+                f"in {self.manifest_path} or on PATH, and downloads are disabled "
+                "(DRIVER_OFFLINE). Set CHROMEDRIVER_PATH or put a matching "
+                "chromedriver on PATH."
+            )
+        path = self.downloader()
+        return self._record(manifest, key, path, self.driver_version(path), "download")
+
+    @staticmethod
+    def driver_version(path: str) -> Optional[str]:
+        """Version reported by `chromedriver --version`, None if it cannot run"""
+        try:
+            output = subprocess.run(
+                [path, "--version"], capture_output=True, text=True, timeout=10
+            ).stdout
+        except (OSError, subprocess.SubprocessError):
+            return None
+        match = _VERSION.search(output)
+        return match.group(0) if match else None
+
+    def _read_manifest(self) -> Dict:
+        try:
+            return json.loads(self.manifest_path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _record(self, manifest: Dict, key: str, path: str, version, source) -> str:
+        manifest[key] = {
+            "path": str(path),
+            "driver_version": version,
+            "chrome_version": self.chrome_version,
+            "source": source,
+        }
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(manifest, indent=2))
+        os.replace(tmp_path, self.manifest_path)
+        return str(path)
+
+    @staticmethod
+    def _download() -> str:
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        return ChromeDriverManager().install()
+
+
+_resolve_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _chromedriver_path(pinned_path: Optional[str], offline: bool) -> str:
+    # Resolved once per process; every driver start reuses the path
+    return ChromeDriverResolver(pinned_path=pinned_path, offline=offline).resolve()
 
 
 class DriverFactory:
     @staticmethod
-    def get_driver():
+    def get_driver(settings: Settings = None):
         """
         Creates and returns WebDriver instance based on configuration.
+
+        Args:
+            settings: Resolved settings (Config.resolve() if None)
         """
-        browser = Config.BROWSER.lower()
-        device_type = Config.DEVICE_TYPE.lower()
+        settings = settings or Config.resolve()
 
-        if browser == "chrome":
-            return DriverFactory._get_chrome_driver(device_type)
+        if settings.browser == "chrome":
+            return DriverFactory._get_chrome_driver(settings)
         else:
-            raise ValueError(f"Unsupported browser: {browser}")
+            raise ValueError(f"Unsupported browser: {settings.browser}")
 
     @staticmethod
-    def _get_chrome_driver(device_type):
+    def _get_chrome_driver(settings: Settings):
         """
         Creates Chrome WebDriver with specified device type (desktop/mobile).
         """
+        device_type = settings.device_type
         options = webdriver.ChromeOptions()
 
-        if Config.HEADLESS:
+        if settings.headless:
             options.add_argument("--headless=new")
             options.add_argument("--disable-gpu")
 
@@ -38,12 +206,344 @@ class DriverFactory:
             options.add_experimental_option("mobileEmulation", mobile_emulation)
 
         driver = webdriver.Chrome(
-            service=ChromeService(ChromeDriverManager().install()), options=options
+            service=ChromeService(DriverFactory.chromedriver_path(settings)),
+            options=options,
         )
 
         if device_type == "desktop":
             driver.maximize_window()
 
-        driver.set_page_load_timeout(Config.PAGE_LOAD_TIMEOUT)
+        driver.set_page_load_timeout(settings.page_load_timeout)
 
         return driver
+
+    @staticmethod
+    def chromedriver_path(settings: Settings = None) -> str:
+        """
+        Local chromedriver binary for settings, resolved once per process
+        without network access after the first resolution (see ChromeDriverResolver)
+        """
+        settings = settings or Config.resolve()
+        # Pre-warm threads start browsers concurrently; resolve (and download) once
+        with _resolve_lock:
+            return _chromedriver_path(
+                settings.chromedriver_path, settings.driver_offline
+            )
+
+    # Shared pools, one per settings combination
+    _pools: Dict[Settings, "DriverPool"] = {}
+    _pools_lock = threading.Lock()
+
+    @classmethod
+    def pool(cls, settings: Settings = None) -> "DriverPool":
+        """Pool shared by everything using the same settings"""
+        settings = settings or Config.resolve()
+        with cls._pools_lock:
+            pool = cls._pools.get(settings)
+            if pool is None:
+                pool = cls._pools[settings] = DriverPool(settings)
+            return pool
+
+    @classmethod
+    def prewarm(cls, settings: Settings = None, count: Optional[int] = None):
+        """
+        Start browsers for settings on background threads and return the
+        pool they will be waiting in.
+
+        Args:
+            count: Browsers to start (DRIVER_POOL_PREWARM env var or constant)
+        """
+        if count is None:
+            count = int(os.getenv("DRIVER_POOL_PREWARM", DRIVER_POOL_PREWARM))
+        pool = cls.pool(settings)
+        pool.prewarm(count)
+        return pool
+
+    @classmethod
+    def stop_replenishing(cls) -> None:
+        """Stop every shared pool from replacing recycled browsers"""
+        with cls._pools_lock:
+            pools = list(cls._pools.values())
+        for pool in pools:
+            pool.stop_replenishing()
+
+    @classmethod
+    def close_pool(cls, settings: Settings) -> None:
+        with cls._pools_lock:
+            pool = cls._pools.pop(settings, None)
+        if pool is not None:
+            pool.close()
+
+    @classmethod
+    def close_pools(cls) -> None:
+        """Quit the browsers of every shared pool"""
+        with cls._pools_lock:
+            pools, cls._pools = list(cls._pools.values()), {}
+        for pool in pools:
+            pool.close()
+
+
+class DriverPool:
+    """
+    Reusable browsers for one settings combination.
+
+    acquire() hands out an idle browser, waits for one being pre-warmed,
+    or starts one. release() resets it for the next test: extra tabs
+    closed, cookies and local/session storage cleared, navigated to
+    about:blank. A browser is quit instead of reused after max_uses
+    tests, when its session no longer responds, or when the reset fails.
+    Once prewarm() has been called, recycled browsers are replaced in the
+    background until stop_replenishing() or close().
+
+    Wait time per acquire() and time-weighted occupancy (share of the
+    pool's browsers leased to tests) are available from stats().
+
+    Args:
+        settings: Settings every browser in the pool is created with
+        max_uses: Tests per browser before it is replaced (DRIVER_POOL_MAX_USES)
+        factory: Callable creating a driver from settings (DriverFactory.get_driver)
+    """
+
+    def __init__(
+        self,
+        settings: Optional[Settings] = None,
+        max_uses: Optional[int] = None,
+        factory: Optional[Callable] = None,
+    ):
+        self.settings = settings or Config.resolve()
+        self.max_uses = max_uses or int(
+            os.getenv("DRIVER_POOL_MAX_USES", DRIVER_POOL_MAX_USES)
+        )
+        self.factory = factory or DriverFactory.get_driver
+        self._condition = threading.Condition()
+        self._idle: List = []
+        self._uses: Dict[int, int] = {}
+        self._leased: Dict[int, object] = {}
+        self._starting = 0
+        self._replenish = False
+        self._closed = False
+        self.created = 0
+        self.prewarmed = 0
+        self.recycled = 0
+        self.warm_errors: List[Exception] = []
+
+        # Metrics
+        self.waits: List[float] = []
+        self.peak_leased = 0
+        self._leased_time = 0.0
+        self._pool_time = 0.0
+        self._changed_at = time.monotonic()
+
+    def _account(self) -> None:
+        """Integrate leased/total browser counts up to now (lock held)"""
+        now = time.monotonic()
+        elapsed = now - self._changed_at
+        self._leased_time += len(self._leased) * elapsed
+        self._pool_time += (len(self._leased) + len(self._idle)) * elapsed
+        self._changed_at = now
+
+    def prewarm(self, count: int) -> None:
+        """
+        Start count browsers on background threads and replace recycled
+        browsers from now on, until stop_replenishing() or close()
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._replenish = True
+        self._start(count)
+
+    def stop_replenishing(self) -> None:
+        """Stop replacing recycled browsers, e.g. once the last test is done"""
+        with self._condition:
+            self._replenish = False
+
+    def _start(self, count: int) -> None:
+        with self._condition:
+            if self._closed or count <= 0:
+                return
+            self._starting += count
+        for _ in range(count):
+            threading.Thread(
+                target=self._warm_one, name="driver-prewarm", daemon=True
+            ).start()
+
+    def _warm_one(self) -> None:
+        try:
+            driver = self.factory(self.settings)
+        except Exception as e:  # surfaced again by the synchronous start in acquire()
+            with self._condition:
+                self._starting -= 1
+                self.warm_errors.append(e)
+                self._condition.notify_all()
+            return
+
+        with self._condition:
+            if not self._closed:
+                self._starting -= 1
+                self._account()
+                self.created += 1
+                self.prewarmed += 1
+                self._uses[id(driver)] = 0
+                self._idle.append(driver)
+                self._condition.notify_all()
+                return
+        # Quit before counting the start as done, so close() waits for it
+        self._quit(driver)
+        with self._condition:
+            self._starting -= 1
+            self._condition.notify_all()
+
+    def acquire(self):
+        """A browser ready for a test, reusing an idle one when it responds"""
+        started = time.monotonic()
+        while True:
+            with self._condition:
+                while not self._idle and self._starting:
+                    self._condition.wait()
+                driver = self._idle.pop() if self._idle else None
+                if driver is not None:
+                    self._account()
+                    self._leased[id(driver)] = driver
+            if driver is None:
+                driver = self.factory(self.settings)
+                with self._condition:
+                    self._account()
+                    self.created += 1
+                    self._uses[id(driver)] = 0
+                    self._leased[id(driver)] = driver
+            elif not self._alive(driver):
+                self._discard(driver)
+                continue
+
+            with self._condition:
+                self.waits.append(time.monotonic() - started)
+                self.peak_leased = max(self.peak_leased, len(self._leased))
+            return driver
+
+    def release(self, driver, broken: bool = False) -> None:
+        """
+        Return a browser after a test. broken=True (e.g. the test lost the
+        session) quits it instead of resetting it.
+        """
+        with self._condition:
+            uses = self._uses.get(id(driver), 0) + 1
+            self._uses[id(driver)] = uses
+        if broken or uses >= self.max_uses or not self._reset(driver):
+            self._discard(driver)
+            return
+        with self._condition:
+            self._account()
+            self._leased.pop(id(driver), None)
+            self._idle.append(driver)
+            self._condition.notify_all()
+
+    def close(self) -> None:
+        """Quit every browser the pool started, waiting for those still starting"""
+        with self._condition:
+            self._closed = True
+            self._replenish = False
+            while self._starting:
+                self._condition.wait()
+            self._account()
+            drivers = self._idle + list(self._leased.values())
+            self._idle, self._leased = [], {}
+        for driver in drivers:
+            self._quit(driver)
+
+    @property
+    def idle(self) -> int:
+        return len(self._idle)
+
+    def stats(self) -> Dict:
+        """Acquire wait times (ms) and occupancy of the pool so far"""
+        with self._condition:
+            self._account()
+            waits = sorted(self.waits)
+            occupancy = self._leased_time / self._pool_time if self._pool_time else 0.0
+            return {
+                "settings": self.settings.id,
+                "acquired": len(waits),
+                "created": self.created,
+                "prewarmed": self.prewarmed,
+                "recycled": self.recycled,
+                "peak_leased": self.peak_leased,
+                "occupancy": round(occupancy, 3),
+                "wait_ms": {
+                    "p50": (percentile(waits, 50) or 0.0) * 1000,
+                    "p95": (percentile(waits, 95) or 0.0) * 1000,
+                    "max": (waits[-1] if waits else 0.0) * 1000,
+                    "total": sum(waits) * 1000,
+                },
+            }
+
+    def summary(self) -> str:
+        stats = self.stats()
+        wait = stats["wait_ms"]
+        return (
+            f"Driver pool {stats['settings']}: {stats['acquired']} acquired, "
+            f"{stats['created']} started ({stats['prewarmed']} pre-warmed), "
+            f"{stats['recycled']} recycled\n"
+            f"Occupancy {stats['occupancy']:.0%}, peak {stats['peak_leased']} in use\n"
+            f"Wait p50 {wait['p50']:.0f} ms, p95 {wait['p95']:.0f} ms, "
+            f"max {wait['max']:.0f} ms, total {wait['total']:.0f} ms"
+        )
+
+    def export_json(self, path: Path) -> Path:
+        """Write stats() to path as JSON"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.stats(), indent=2))
+        return path
+
+    @staticmethod
+    def _alive(driver) -> bool:
+        try:
+            driver.window_handles
+            return True
+        except WebDriverException:
+            return False
+
+    @staticmethod
+    def _reset(driver) -> bool:
+        """Bring a browser back to a blank state, False if it failed"""
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            # Storage is per origin, so clear it before leaving the page
+            try:
+                driver.execute_script(
+                    "window.localStorage.clear(); window.sessionStorage.clear();"
+                )
+            except WebDriverException:
+                pass  # about:blank and data: pages have no storage
+            if hasattr(driver, "execute_cdp_cmd"):
+                # Cookies of every domain, not only the current page's
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+            return True
+        except WebDriverException:
+            return False
+
+    def _discard(self, driver) -> None:
+        with self._condition:
+            self._account()
+            self._leased.pop(id(driver), None)
+            self._uses.pop(id(driver), None)
+            self.recycled += 1
+            replenish = self._replenish and not self._closed
+        self._quit(driver)
+        if replenish:
+            self._start(1)
+
+    @staticmethod
+    def _quit(driver) -> None:
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass  # Browser already gone
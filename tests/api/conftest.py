@@ -0,0 +1,191 @@
+"""
+API fixtures and hooks: Football API client, local stub server, shared
+response snapshots, latency budgets and Allure response attachments.
+
+Loaded by pytest only when tests under tests/api are collected, so UI
+runs never import requests, pydantic or the API client stack.
+"""
+
+import os
+import allure
+import pytest
+
+from config.config import Config
+from api.football import attachments
+from api.football.client import FootballAPIClient
+from api.football.metrics import latency_recorder
+from config.api_config import APIConfig
+from config.constants import TEST_COMPETITIONS
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """
+    Attaches buffered API response bodies when a test fails
+    (API_ATTACHMENTS=on_failure) and resets per-test attachment state.
+    """
+    outcome = yield
+    report = outcome.get_result()
+
+    if report.failed:
+        item._api_failed = True
+    if report.when == "call" and report.failed:
+        attachments.flush_pending()
+    if report.when == "teardown":
+        attachments.end_test(failed=getattr(item, "_api_failed", False))
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_call(item):
+    """
+    Samples the endpoint of @pytest.mark.latency(...) tests before the test
+    body runs and fails the test if a latency budget is exceeded.
+    The result is available to the test as request.node.latency_result.
+    """
+    marker = item.get_closest_marker("latency")
+    if marker is None:
+        return
+
+    from api.football.latency import sample_endpoint
+
+    options = dict(marker.kwargs)
+    budgets = {
+        name: options.pop(name)
+        for name in list(options)
+        if name == "max_ms" or (name.startswith("p") and name.endswith("_ms"))
+    }
+    max_error_rate = options.pop("max_error_rate", 0.0)
+
+    with allure.step(f"Sample latency of '{options.get('endpoint')}'"):
+        result = sample_endpoint(**options)
+        allure.attach(
+            result.summary(),
+            name="Latency Samples",
+            attachment_type=allure.attachment_type.TEXT,
+        )
+    item.latency_result = result
+
+    violations = result.violations(budgets, max_error_rate)
+    if violations:
+        pytest.fail(
+            "Latency budget exceeded:\n  "
+            + "\n  ".join(violations)
+            + f"\n\n{result.summary()}"
+        )
+
+
+@pytest.fixture(scope="session")
+def api_client():
+    """
+    Provides Football API client for making API requests.
+    Single instance shared across all tests.
+    Exports per-endpoint latency percentiles when the session ends.
+    """
+    client = FootballAPIClient()
+    yield client
+
+    if not latency_recorder.summary():
+        return
+
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    report_name = f"api-latency-{worker}.json" if worker else "api-latency.json"
+    report_path = latency_recorder.export_json(Config.REPORTS_DIR / report_name)
+
+    with allure.step("API latency summary"):
+        allure.attach(
+            latency_recorder.format_table(),
+            name="API Latency Percentiles",
+            attachment_type=allure.attachment_type.TEXT,
+        )
+        allure.attach.file(
+            str(report_path),
+            name="API Latency Histograms",
+            attachment_type=allure.attachment_type.JSON,
+        )
+
+
+@pytest.fixture(scope="session")
+def shared_api_data(tmp_path_factory, worker_id):
+    """
+    Provides a run-wide cache of raw API bodies shared by xdist workers.
+    The first worker to request a key fetches it under a file lock; every
+    worker then reads the same read-only memory-mapped snapshot.
+    """
+    from utils.shared_cache import SharedSnapshotCache
+
+    base = tmp_path_factory.getbasetemp()
+    if worker_id != "master":
+        base = base.parent
+    cache = SharedSnapshotCache(base / "api-snapshots")
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def synthetic_data():
+    """
+    Provides a factory of stub data generators, e.g. synthetic_data(teams=10).
+    Each call builds a new SyntheticData, so no two tests share payloads.
+    """
+    from api.football.stub_server import StubConfig, SyntheticData
+
+    def build(**config):
+        return SyntheticData(StubConfig(**config))
+
+    return build
+
+
+@pytest.fixture(scope="session")
+def stub_server():
+    """
+    Provides a local football98 API stub with synthetic data.
+    Started once per session on a free port.
+    """
+    from api.football.stub_server import StubFootballServer
+
+    with StubFootballServer() as server:
+        yield server
+
+
+@pytest.fixture
+def stub_credentials(monkeypatch):
+    """
+    Sets a placeholder RAPIDAPI_KEY when none is configured, for clients
+    that only talk to the local stub server.
+    """
+    if os.getenv("RAPIDAPI_KEY"):
+        yield
+        return
+    monkeypatch.setenv("RAPIDAPI_KEY", "stub")
+    APIConfig.reset_credentials()
+    yield
+    APIConfig.reset_credentials()
+
+
+@pytest.fixture
+def stub_api_client(stub_server, stub_credentials):
+    """
+    Provides a Football API client pointed at the local stub server.
+    Client-side throttling is disabled since no RapidAPI quota is spent.
+    """
+    client = FootballAPIClient()
+    client.base_url = stub_server.base_url
+    client.rate_limiter = None
+    yield client
+    client.session.close()
+
+
+@pytest.fixture(scope="session")
+def api_config():
+    """
+    Provides API configuration settings.
+    """
+    return APIConfig
+
+
+@pytest.fixture
+def competitions():
+    """
+    Provides test data dictionary with competition IDs.
+    """
+    return TEST_COMPETITIONS
@@ -0,0 +1,79 @@
+import asyncio
+
+import allure
+import pytest
+from http import HTTPStatus
+
+from api.football.async_client import AsyncFootballAPIClient
+from config.constants import TEST_COMPETITIONS
+
+
+@allure.feature("Football API Async Client")
+class TestAsyncClient:
+    """Offline checks of the asyncio front-end against the local stub."""
+
+    @allure.title("TC-A01: Concurrency below 1 is rejected, including 0")
+    @pytest.mark.parametrize("max_concurrency", [0, -1])
+    def test_invalid_concurrency(self, stub_api_client, max_concurrency):
+        with pytest.raises(ValueError, match="max_concurrency"):
+            AsyncFootballAPIClient(max_concurrency, client=stub_api_client)
+
+    @allure.title("TC-A02: A caller's client keeps its adapters and session")
+    def test_caller_client_untouched(self, stub_api_client):
+        adapter = stub_api_client.session.get_adapter(stub_api_client.base_url)
+
+        async def fetch():
+            async with AsyncFootballAPIClient(2, client=stub_api_client) as c:
+                return await c.get_competitions()
+
+        response = asyncio.run(fetch())
+
+        assert response.status_code == HTTPStatus.OK
+        assert stub_api_client.session.get_adapter(stub_api_client.base_url) is adapter
+        # Session still usable after the async client closed
+        assert stub_api_client.get_competitions().status_code == HTTPStatus.OK
+
+    @allure.title("TC-A03: close() does not block the event loop")
+    def test_close_does_not_block_loop(self, stub_api_client):
+        async def run():
+            c = AsyncFootballAPIClient(1, client=stub_api_client)
+            release = asyncio.Event()
+            loop = asyncio.get_running_loop()
+            # Occupy the only worker until the loop sets the event
+            busy = loop.run_in_executor(
+                c._executor,
+                lambda: asyncio.run_coroutine_threadsafe(release.wait(), loop).result(),
+            )
+            closing = asyncio.ensure_future(c.close())
+            await asyncio.sleep(0)
+            release.set()  # only reachable while close() is awaiting
+            await asyncio.wait_for(closing, timeout=5)
+            await busy
+            return closing.done()
+
+        assert asyncio.run(run())
+
+    @allure.title("TC-A04: gather_many maps every ID and can return errors")
+    def test_gather_many(self, stub_api_client, monkeypatch):
+        ids = list(TEST_COMPETITIONS.values())
+        failing = f"/competitions/{ids[0]}/standings"
+        make_request = stub_api_client._make_request
+
+        def flaky(method, endpoint, **kwargs):
+            if endpoint == failing:
+                raise ConnectionError("injected")
+            return make_request(method, endpoint, **kwargs)
+
+        monkeypatch.setattr(stub_api_client, "_make_request", flaky)
+
+        async def gather(**kwargs):
+            async with AsyncFootballAPIClient(4, client=stub_api_client) as c:
+                return await c.gather_many("standings", ids, **kwargs)
+
+        results = asyncio.run(gather(return_exceptions=True))
+
+        assert list(results) == ids
+        assert isinstance(results[ids[0]], ConnectionError)
+        assert all(r.status_code == HTTPStatus.OK for r in list(results.values())[1:])
+        with pytest.raises(ConnectionError):
+            asyncio.run(gather())
@@ -0,0 +1,89 @@
+import allure
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from api.football import attachments
+from api.football.attachments import ResponseAttacher
+
+
+def _response(body: bytes, content_type="application/json"):
+    response = requests.Response()
+    response.status_code = 200
+    response.headers = CaseInsensitiveDict({"Content-Type": content_type})
+    response._content = body
+    return response
+
+
+@pytest.fixture
+def attached(monkeypatch):
+    """(name, body) of every allure.attach() call, with clean per-test state"""
+    calls = []
+    monkeypatch.setattr(
+        attachments.allure,
+        "attach",
+        lambda body, name=None, attachment_type=None: calls.append((name, body)),
+    )
+    attachments.end_test(failed=False)
+    yield calls
+    attachments.end_test(failed=False)
+
+
+@allure.feature("Football API Attachments")
+class TestResponseAttacher:
+    """Offline checks of the response attachment modes."""
+
+    @allure.title("TC-AT01: Truncated mode cuts the body and marks the cut")
+    def test_truncated(self, attached):
+        body = b'{"standings": "' + b"x" * 100 + b'"}'
+
+        ResponseAttacher("truncated", max_bytes=16).attach(_response(body))
+        ResponseAttacher("truncated", max_bytes=1024).attach(_response(b"{}"))
+
+        (name, cut), (_, small) = attached
+        assert name == "Response Body (truncated)"
+        assert cut.startswith(body[:16] + b"\n")
+        assert cut.endswith(f"... truncated ({len(body)} bytes total)".encode())
+        assert small == b"{}"
+
+    @allure.title("TC-AT02: Headers and off modes attach no body")
+    def test_headers_and_off(self, attached):
+        response = _response(b'{"teams": []}')
+
+        ResponseAttacher("off").attach(response)
+        assert attached == []
+
+        ResponseAttacher("headers").attach(response)
+        assert attached == [
+            ("Response Headers", '{\n  "Content-Type": "application/json"\n}')
+        ]
+
+    @allure.title("TC-AT03: On-failure mode attaches bodies only for failed tests")
+    def test_on_failure(self, attached):
+        attacher = ResponseAttacher("on_failure")
+
+        attacher.attach(_response(b'{"passed": true}'))
+        assert attached == []
+        attachments.end_test(failed=False)
+        assert attached == []
+
+        attacher.attach(_response(b'{"failed": true}'))
+        attachments.end_test(failed=True)
+        assert attached == [("Response Body", b'{"failed": true}')]
+
+        attachments.flush_pending()  # buffer was emptied by end_test()
+        assert len(attached) == 1
+
+    @allure.title("TC-AT04: Identical bodies are attached once per test")
+    def test_duplicate_bodies(self, attached):
+        attacher = ResponseAttacher("full")
+        body = b'{"matches": []}'
+
+        attacher.attach(_response(body))
+        attacher.attach(_response(body))
+        attachments.end_test(failed=False)
+        attacher.attach(_response(body))  # next test attaches it again
+
+        first, duplicate, next_test = attached
+        assert first == next_test == ("Response Body", body)
+        assert duplicate[1].startswith("Identical to an earlier response body")
@@ -0,0 +1,87 @@
+import os
+import time
+
+import allure
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from api.football.cache import ResponseCache
+
+
+def _response(body=b'{"ok": true}', status=200, **headers):
+    response = requests.Response()
+    response.status_code = status
+    response.headers = CaseInsensitiveDict(headers)
+    response.url = "https://api.test/competitions"
+    response._content = body
+    return response
+
+
+@allure.feature("Football API Response Cache")
+class TestResponseCache:
+    """Offline checks of the on-disk response cache."""
+
+    @allure.title("TC-RC01: Entries round-trip without transport headers")
+    def test_round_trip(self, tmp_path):
+        cache = ResponseCache(tmp_path, max_bytes=1 << 20, ttls={}, default_ttl=60)
+        cache.put(
+            "k",
+            _response(ETag='"v1"', **{"Content-Encoding": "gzip"}),
+            ttl=60,
+        )
+
+        entry = cache.get("k")
+        assert entry.is_fresh
+        assert entry.body == b'{"ok": true}'
+        assert "Content-Encoding" not in entry.headers
+        assert entry.validators == {"If-None-Match": '"v1"'}
+        assert entry.to_response().json() == {"ok": True}
+
+    @allure.title("TC-RC02: Size is tracked incrementally and LRU entries evicted")
+    def test_running_total_and_eviction(self, tmp_path, monkeypatch):
+        cache = ResponseCache(tmp_path, max_bytes=10_000, ttls={}, default_ttl=60)
+        scans = []
+        scan = cache._scan
+        monkeypatch.setattr(cache, "_scan", lambda: scans.append(1) or scan())
+
+        body = os.urandom(3000)  # incompressible
+        now = time.time()
+        for age, key in ((300, "a"), (200, "b"), (100, "c")):
+            cache.put(key, _response(body), ttl=60)
+            os.utime(cache._path(key), (now, now - age))
+        assert not scans  # under the cap: no directory scan
+        assert cache._size == sum(p.stat().st_size for p in tmp_path.iterdir())
+
+        cache.put("d", _response(body), ttl=60)
+
+        assert scans == [1]
+        assert cache.get("a") is None
+        assert cache.get("d") is not None
+        assert cache._size <= cache.max_bytes
+
+    @allure.title("TC-RC03: A 304 refreshes the entry and merges its headers")
+    def test_not_modified_merges_headers(self, tmp_path):
+        cache = ResponseCache(tmp_path, max_bytes=1 << 20, ttls={}, default_ttl=60)
+        cache.put("k", _response(ETag='"v1"', **{"Cache-Control": "max-age=1"}), 60)
+        stale = cache.get("k")
+        stale.stored_at -= 120
+        assert not stale.is_fresh
+
+        cache.touch(
+            "k",
+            stale,
+            _response(
+                b"",
+                304,
+                ETag='"v2"',
+                Date="Mon, 01 Jan 2024 00:00:00 GMT",
+                **{"Cache-Control": "max-age=60"},
+            ),
+        )
+
+        entry = cache.get("k")
+        assert entry.is_fresh
+        assert entry.body == b'{"ok": true}'
+        assert entry.headers["ETag"] == '"v2"'
+        assert entry.headers["Cache-Control"] == "max-age=60"
+        assert entry.headers["Date"] == "Mon, 01 Jan 2024 00:00:00 GMT"
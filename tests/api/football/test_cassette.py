@@ -0,0 +1,68 @@
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+import allure
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from api.football.cassette import Cassette
+from api.football.client import FootballAPIClient
+from config.api_config import APIConfig
+
+
+def _response(body: bytes, url: str) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.headers = CaseInsensitiveDict(
+        {"Content-Type": "application/json", "Content-Length": str(len(body))}
+    )
+    response.url = url
+    response._content = body
+    return response
+
+
+def _record_in_worker(path, worker):
+    """One simulated xdist worker recording into the shared cassette"""
+    cassette = Cassette(path, mode="record")
+    for i in range(5):
+        url = f"https://api.test/items/{worker}-{i}"
+        cassette.record("GET", url, None, None, _response(b"{}", url))
+    cassette.flush()
+
+
+@allure.feature("Football API Cassettes")
+class TestCassette:
+    """Offline checks of cassette recording and replay."""
+
+    @allure.title("TC-CS01: Workers recording in parallel keep every interaction")
+    def test_parallel_recording_merges(self, tmp_path):
+        path = tmp_path / "cassette.json"
+        with ProcessPoolExecutor(max_workers=4) as pool:
+            list(pool.map(_record_in_worker, [path] * 4, range(4)))
+
+        interactions = json.loads(path.read_text())["interactions"]
+        assert len(interactions) == 20
+        assert not list(tmp_path.glob("*.jsonl"))  # journals merged and removed
+        headers = interactions[0]["response"]["headers"]
+        assert "Content-Length" not in headers
+
+    @allure.title("TC-CS02: Replay works without RAPIDAPI_KEY")
+    def test_replay_without_api_key(self, tmp_path, monkeypatch):
+        path = tmp_path / "cassette.json"
+        recorder = Cassette(path, mode="record")
+        url = "https://api.test/competitions"
+        recorder.record("GET", url, None, None, _response(b'{"ok": 1}', url))
+        recorder.flush()
+
+        monkeypatch.delenv("RAPIDAPI_KEY", raising=False)
+        APIConfig.reset_credentials()
+        client = FootballAPIClient(cassette=Cassette(path, mode="replay", strict=True))
+        client.base_url = "https://api.test"
+        client.rate_limiter = None
+
+        assert "X-RapidAPI-Key" not in client.session.headers
+        assert client.get_competitions().json() == {"ok": 1}
+
+        with pytest.raises(ValueError, match="RAPIDAPI_KEY"):
+            FootballAPIClient(cassette=Cassette(path, mode="record"))
@@ -0,0 +1,184 @@
+import threading
+from http import HTTPStatus
+
+import allure
+import pytest
+
+from api.football import single_flight
+from api.football.client import FootballAPIClient
+from api.football.metrics import LatencyRecorder
+from api.football.single_flight import SingleFlight
+from api.football.stub_server import StubFootballServer
+from config.api_config import APIConfig
+from config.constants import TEST_COMPETITIONS
+
+
+@pytest.fixture
+def followers(monkeypatch):
+    """
+    Semaphore released each time a caller starts waiting on another
+    caller's in-flight call, so a leader can hold until all have joined.
+    """
+    joined = threading.Semaphore(0)
+
+    class WatchedEvent(threading.Event):
+        def wait(self, timeout=None):
+            joined.release()
+            return super().wait(timeout)
+
+    class WatchedCall(single_flight._Call):
+        __slots__ = ()
+
+        def __init__(self):
+            super().__init__()
+            self.done = WatchedEvent()
+
+    monkeypatch.setattr(single_flight, "_Call", WatchedCall)
+    return joined
+
+
+def _join(joined, count):
+    """Wait until count callers wait on the leader (False on timeout)"""
+    return all(joined.acquire(timeout=5) for _ in range(count))
+
+
+@allure.feature("Football API Client")
+class TestClient:
+    """Offline checks of the synchronous client against the local stub."""
+
+    @allure.title("TC-FC01: Endpoint paths are formatted and matched back")
+    def test_endpoint_helpers(self):
+        path = APIConfig.endpoint_path("standings", 2021)
+
+        assert path == "/competitions/2021/standings"
+        assert APIConfig.match_endpoint(path + "?season=2024") == (
+            "standings",
+            {"competition_id": "2021"},
+        )
+        assert APIConfig.resolve_endpoint("/matches/head2head") == "head_to_head"
+        assert APIConfig.match_endpoint("/nowhere") == (None, {})
+        with pytest.raises(ValueError, match="exactly one placeholder"):
+            APIConfig.endpoint_path("competitions", 1)
+
+    @allure.title("TC-FC02: Coalesced callers each get their own Response")
+    def test_shared_response_is_copied(self, stub_api_client, monkeypatch):
+        leader = stub_api_client.get_competitions()
+        monkeypatch.setattr(
+            stub_api_client._in_flight, "do", lambda key, fn: (leader, True)
+        )
+
+        follower = stub_api_client.get_competitions()
+
+        assert follower is not leader
+        assert follower.headers is not leader.headers
+        assert follower.status_code == leader.status_code
+        assert follower.content == leader.content
+
+    @allure.title("TC-FC03: get_many maps every ID and can return errors")
+    def test_get_many_return_exceptions(self, stub_api_client, monkeypatch):
+        ids = list(TEST_COMPETITIONS.values())
+        failing = APIConfig.endpoint_path("standings", ids[0])
+        make_request = stub_api_client._make_request
+
+        def flaky(method, endpoint, **kwargs):
+            if endpoint == failing:
+                raise ConnectionError("injected")
+            return make_request(method, endpoint, **kwargs)
+
+        monkeypatch.setattr(stub_api_client, "_make_request", flaky)
+
+        results = stub_api_client.get_many("standings", ids, return_exceptions=True)
+
+        assert list(results) == ids
+        assert isinstance(results[ids[0]], ConnectionError)
+        assert all(r.status_code == HTTPStatus.OK for r in list(results.values())[1:])
+        with pytest.raises(ConnectionError):
+            stub_api_client.get_many("standings", ids)
+
+    @allure.title("TC-FC04: Each response.json() call records one parse sample")
+    def test_parse_timed_once(self, stub_api_client, monkeypatch):
+        recorder = LatencyRecorder()
+        monkeypatch.setattr(stub_api_client, "metrics", recorder)
+
+        competition_id = TEST_COMPETITIONS["premier_league"]
+        response = stub_api_client.get_standings(competition_id)
+        stub_api_client._timed_json("standings", response)
+        response.json()
+
+        assert recorder.histogram("standings", "parse").count == 1
+
+    @allure.title("TC-FC05: Credentials are memoized once resolved")
+    def test_credentials_memoized(self, monkeypatch):
+        monkeypatch.setenv("RAPIDAPI_KEY", "first")
+        APIConfig.reset_credentials()
+        headers = APIConfig.HEADERS
+
+        monkeypatch.setenv("RAPIDAPI_KEY", "second")
+        assert APIConfig.HEADERS is headers
+        assert APIConfig.RAPIDAPI_KEY == "second"  # first read after the change
+
+        APIConfig.reset_credentials()
+        assert APIConfig.HEADERS["X-RapidAPI-Key"] == "second"
+        monkeypatch.delenv("RAPIDAPI_KEY")
+        APIConfig.reset_credentials()
+        with pytest.raises(ValueError, match="RAPIDAPI_KEY"):
+            APIConfig.HEADERS
+        monkeypatch.setenv("RAPIDAPI_KEY", "third")
+        assert APIConfig.HEADERS["X-RapidAPI-Key"] == "third"  # failure not memoized
+        APIConfig.reset_credentials()
+
+    @allure.title("TC-FC06: Concurrent identical GETs reach the API once")
+    @pytest.mark.usefixtures("stub_credentials")
+    def test_concurrent_gets_coalesced(self, followers):
+        callers = 5
+        competition_id = TEST_COMPETITIONS["premier_league"]
+        # The stub answers the first request once every other caller is waiting
+        server = StubFootballServer(sleep=lambda _: _join(followers, callers - 1))
+        responses = []
+
+        with server:
+            client = FootballAPIClient()
+            client.base_url = server.base_url
+            client.rate_limiter = None
+
+            def get():
+                responses.append(client.get_standings(competition_id))
+
+            threads = [threading.Thread(target=get) for _ in range(callers)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            client.session.close()
+
+        assert server.requests["standings"] == 1
+        assert len({id(response) for response in responses}) == callers
+        assert len({response.content for response in responses}) == 1
+        assert all(r.status_code == HTTPStatus.OK for r in responses)
+
+    @allure.title("TC-FC07: A leader's exception reaches every waiter")
+    def test_single_flight_error_shared(self, followers):
+        flight = SingleFlight()
+        callers = 4
+        error = RuntimeError("upstream down")
+        raised = []
+
+        def fail():
+            _join(followers, callers - 1)
+            raise error
+
+        def call():
+            try:
+                flight.do("standings", fail)
+            except RuntimeError as e:
+                raised.append(e)
+
+        threads = [threading.Thread(target=call) for _ in range(callers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert raised == [error] * callers
+        assert flight.in_flight() == 0
+        assert flight.do("standings", lambda: "fresh") == ("fresh", False)
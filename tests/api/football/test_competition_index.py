@@ -0,0 +1,78 @@
+import allure
+
+from api.football.competition_index import AhoCorasick, CompetitionIndex, TrigramIndex
+from api.football.stub_server import StubConfig, SyntheticData
+
+
+@allure.feature("Football API Competitions Index")
+class TestCompetitionIndex:
+    """Offline checks of alias matching over the competitions catalog."""
+
+    @allure.title("TC-C01: Automaton finds overlapping patterns")
+    def test_overlapping_patterns(self):
+        automaton = AhoCorasick(["he", "she", "his", "hers"])
+
+        found = sorted(
+            (end, automaton.patterns[i]) for end, i in automaton.search("ushers")
+        )
+
+        assert found == [(3, "he"), (3, "she"), (5, "hers")]
+
+    @allure.title("TC-C02: First alias in list order wins, then catalog order")
+    def test_resolve_priority(self):
+        index = CompetitionIndex(
+            ["Liga Portugal", "Primera Division", "La Liga 2", "Serie A"]
+        )
+
+        found, missing = index.resolve(
+            {
+                "la_liga": ["laliga", "primeradivision"],
+                "serie_a": ["seriea"],
+                "ligue_1": ["ligue1"],
+            }
+        )
+
+        assert found["la_liga"]["actual_name"] == "La Liga 2"
+        assert found["la_liga"]["matched_pattern"] == "laliga"
+        assert found["serie_a"]["id"] == 2019
+        assert missing == ["ligue_1"]
+
+    @allure.title("TC-C03: Aliases resolve over a large catalog")
+    def test_large_catalog(self):
+        names = SyntheticData(StubConfig(competitions=5000)).competition_names()
+        index = CompetitionIndex(names)
+
+        matches = index.find(["regionalleague4992", "uefachampionsleague", "nba"])
+
+        assert matches == {
+            "regionalleague4992": "Regional League 4992",
+            "uefachampionsleague": "UEFA Champions League",
+        }
+
+    @allure.title("TC-C04: Fuzzy search ranks candidates by similarity")
+    def test_fuzzy_top_k(self):
+        index = CompetitionIndex(
+            ["FIFA World Cup", "UEFA Europa League", "Europa Conference League"]
+        )
+
+        candidates = index.fuzzy("uefa europa leage", k=2)
+
+        assert [name for name, _ in candidates] == [
+            "UEFA Europa League",
+            "Europa Conference League",
+        ]
+        assert 1 >= candidates[0][1] > candidates[1][1] > 0
+        assert index.fuzzy("zzzz") == []
+
+    @allure.title("TC-C05: Trigram index is cached on disk with its catalog")
+    def test_trigram_cache(self, tmp_path):
+        CompetitionIndex(["Old Catalog"], cache_dir=tmp_path).trigram_index
+        names = ["Premier League", "Primera Division", "Serie A"]
+        CompetitionIndex(names, cache_dir=tmp_path).trigram_index
+
+        (cached,) = tmp_path.glob("*.trigrams")
+        loaded = TrigramIndex.load(cached)
+
+        assert loaded.strings == ["premierleague", "primeradivision", "seriea"]
+        assert loaded.search("primeradivison", k=1)[0][0] == 1
+        assert len(list(tmp_path.iterdir())) == 1  # old catalog's index evicted
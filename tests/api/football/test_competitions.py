@@ -1,6 +1,10 @@
 import allure
 import pytest
 from http import HTTPStatus
+from types import MappingProxyType
+from api.football.competition_index import CompetitionIndex
+from api.football.schemas import CompetitionsTokenizer
+from config.api_config import APIConfig
 from config.constants import TEST_COMPETITIONS, COMPETITION_TYPES
 
 
@@ -13,104 +17,67 @@ class TestCompetitions:
     _competition_mapping = None
 
     @classmethod
-    def _fetch_and_parse_competitions(cls, api_client):
+    def _fetch_and_parse_competitions(cls, api_client, shared_api_data):
         """
         Helper method to fetch and parse competitions.
-        Results are cached at class level to avoid repeated API calls.
+        The response body is fetched once per run and shared by all xdist
+        workers as a read-only snapshot; the parsed result is cached at
+        class level and must not be modified by tests.
         """
         if cls._competitions_data is not None:
             return cls._competitions_data
 
-        # Fetch competitions
-        response = api_client.get_competitions()
-        assert (
-            response.status_code == HTTPStatus.OK
-        ), f"Expected {HTTPStatus.OK}, got {response.status_code}"
-
-        # Parse response
-        response_text = response.text.strip()
+        def fetch():
+            response = api_client.get_competitions()
+            assert (
+                response.status_code == HTTPStatus.OK
+            ), f"Expected {HTTPStatus.OK}, got {response.status_code}"
+            return response.content
 
-        # Remove the enclosing braces
-        if "{" not in response_text or "}" not in response_text:
-            pytest.fail(f"Response doesn't contain curly braces: {response_text[:200]}")
+        body = shared_api_data.get("competitions", fetch)
+        head = bytes(body[:1000])
 
-        start_idx = response_text.find("{")
-        end_idx = response_text.rfind("}")
-        competitions_str = response_text[start_idx + 1 : end_idx]
+        # Parse the snapshot in a single pass over zero-copy slices
+        tokenizer = CompetitionsTokenizer()
+        competitions = []
+        for start in range(0, len(body), 8192):
+            competitions.extend(tokenizer.feed(body[start : start + 8192]))
 
-        # Split by comma and clean up
-        competitions = [
-            comp.strip() for comp in competitions_str.split(",") if comp.strip()
-        ]
+        try:
+            competitions.extend(tokenizer.close())
+        except ValueError as e:
+            pytest.fail(f"Invalid competitions response ({e}): {head[:200]!r}")
 
         # Cache the data
-        cls._competitions_data = {
-            "raw_list": competitions,
-            "response_text": response_text[:1000]
-            if len(response_text) > 1000
-            else response_text,
-            "count": len(competitions),
-        }
+        counts = tokenizer.counts
+        cls._competitions_data = MappingProxyType(
+            {
+                "raw_list": tuple(competitions),
+                "unique": tuple(counts),
+                "response_text": head.decode("utf-8", errors="replace"),
+                "count": len(competitions),
+                "counts": MappingProxyType(counts),
+                # Normalized once, shared by every alias lookup in this class;
+                # the trigram index goes to disk only when API_CACHE is on
+                "index": CompetitionIndex(
+                    competitions,
+                    cache_dir=APIConfig.CACHE_DIR if APIConfig.CACHE_ENABLED else None,
+                ),
+            }
+        )
 
         return cls._competitions_data
 
-    @classmethod
-    def _normalize_competitions(cls, competitions):
-        """
-        Normalize competition names for matching.
-        Returns a dictionary of the original names.
-        """
-        competitions_normalized = {}
-        for comp in competitions:
-            normalized = comp.lower().replace("_", "").replace(" ", "").replace("-", "")
-            competitions_normalized[normalized] = comp
-        return competitions_normalized
-
-    @classmethod
-    def _find_competitions_by_patterns(cls, competitions_normalized, patterns_dict):
-        """
-        Find competitions matching given patterns.
-
-        Args:
-            competitions_normalized: normalized original names
-            patterns_dict: list of patterns to search
-
-        Returns:
-            Tuple of (found_dict, missing_list)
-        """
-        found = {}
-        missing = []
-
-        for key, patterns in patterns_dict.items():
-            matched = False
-            for pattern in patterns:
-                for normalized, original in competitions_normalized.items():
-                    if pattern in normalized:
-                        found[key] = {
-                            "id": TEST_COMPETITIONS.get(key),
-                            "actual_name": original,
-                            "matched_pattern": pattern,
-                        }
-                        matched = True
-                        break
-                if matched:
-                    break
-
-            if not matched:
-                missing.append(key)
-
-        return found, missing
-
     @allure.story("Competitions")
     @allure.title("Retrieve and validate competitions list structure")
     @allure.severity(allure.severity_level.CRITICAL)
-    def test_get_competitions_list(self, api_client):
+    def test_get_competitions_list(self, api_client, shared_api_data):
         """
         Test retrieving all available competitions and validating structure.
         This test focuses on API response structure and data quality.
         """
         with allure.step("Fetch and parse competitions"):
-            data = self._fetch_and_parse_competitions(api_client)
+            data = self._fetch_and_parse_competitions(api_client, shared_api_data)
             competitions = data["raw_list"]
 
             allure.attach(
@@ -158,10 +125,8 @@ class TestCompetitions:
             )
 
         with allure.step("Check for duplicates"):
-            # Find all duplicates
-            from collections import Counter
-
-            competition_counts = Counter(competitions)
+            # Occurrences were counted while parsing
+            competition_counts = data["counts"]
             duplicates = {
                 comp: count for comp, count in competition_counts.items() if count > 1
             }
@@ -191,11 +156,8 @@ class TestCompetitions:
                     duplicate_percentage < 10
                 ), f"Too many duplicates: {duplicate_percentage:.1f}% of competitions are duplicates (threshold: 10%)"
 
-                # Store unique list for further processing
-                competitions = list(competition_counts.keys())
-                self._competitions_data["raw_list"] = competitions
-                self._competitions_data["has_duplicates"] = True
-                self._competitions_data["duplicate_count"] = len(duplicates)
+                # Continue with the unique list
+                competitions = data["unique"]
             else:
                 allure.attach(
                     f"✅ No duplicates found in {len(competitions)} competitions",
@@ -216,9 +178,6 @@ class TestCompetitions:
 
         with allure.step("Create initial competition mapping"):
             # Quick check for major competitions and create basic mapping
-            competitions_normalized = self._normalize_competitions(competitions)
-
-            # Store basic mapping for use in next test
             quick_patterns = {
                 "premierleague": TEST_COMPETITIONS.get("premier_league"),
                 "bundesliga": TEST_COMPETITIONS.get("bundesliga"),
@@ -226,12 +185,12 @@ class TestCompetitions:
                 "seriea": TEST_COMPETITIONS.get("serie_a"),
             }
 
-            quick_mapping = {}
-            for pattern, comp_id in quick_patterns.items():
-                for normalized, original in competitions_normalized.items():
-                    if pattern in normalized:
-                        quick_mapping[original] = comp_id
-                        break
+            # Store basic mapping for use in next test
+            matches = data["index"].find(quick_patterns)
+            quick_mapping = {
+                original: quick_patterns[pattern]
+                for pattern, original in matches.items()
+            }
 
             # Store in class variable for next test
             self.__class__._competition_mapping = quick_mapping
@@ -245,14 +204,14 @@ class TestCompetitions:
     @allure.story("Competitions")
     @allure.title("Verify major competitions presence and coverage")
     @allure.severity(allure.severity_level.NORMAL)
-    def test_verify_major_competitions(self, api_client):
+    def test_verify_major_competitions(self, api_client, shared_api_data):
         """
         Test that all expected major competitions from constants are present.
         This test focuses on business logic validation and data completeness.
         """
         with allure.step("Retrieve competitions (from cache if available)"):
-            data = self._fetch_and_parse_competitions(api_client)
-            competitions = data["raw_list"]
+            data = self._fetch_and_parse_competitions(api_client, shared_api_data)
+            competitions = data["unique"]
 
             allure.attach(
                 f"Using {'cached' if self._competitions_data else 'fresh'} competitions data",
@@ -261,7 +220,7 @@ class TestCompetitions:
             )
 
         with allure.step("Prepare competition data for matching"):
-            competitions_normalized = self._normalize_competitions(competitions)
+            competition_index = data["index"]
 
         with allure.step("Validate major leagues presence"):
             major_leagues = {
@@ -272,9 +231,7 @@ class TestCompetitions:
                 "ligue_1": ["ligue1", "frenchleague", "championnatdefrance"],
             }
 
-            found_leagues, missing_leagues = self._find_competitions_by_patterns(
-                competitions_normalized, major_leagues
-            )
+            found_leagues, missing_leagues = competition_index.resolve(major_leagues)
 
             # All major leagues should be present
             assert (
@@ -298,11 +255,8 @@ class TestCompetitions:
                 "world_cup": ["worldcup", "fifaworldcup", "wc"],
             }
 
-            (
-                found_tournaments,
-                missing_tournaments,
-            ) = self._find_competitions_by_patterns(
-                competitions_normalized, tournaments
+            found_tournaments, missing_tournaments = competition_index.resolve(
+                tournaments
             )
 
             # At least 2 out of 3 tournaments should be present
@@ -323,13 +277,32 @@ class TestCompetitions:
                 attachment_type=allure.attachment_type.TEXT,
             )
 
+        with allure.step("Fuzzy-match competitions missed by alias patterns"):
+            # Longest alias of each unmatched key as the query
+            unmatched = {
+                key: max(patterns, key=len)
+                for key, patterns in {**major_leagues, **tournaments}.items()
+                if key not in found_leagues and key not in found_tournaments
+            }
+            fuzzy_found = competition_index.resolve_fuzzy(unmatched, min_score=0.6)
+
+            allure.attach(
+                "\n".join(
+                    f"- {key}: '{data['actual_name']}' (score {data['score']:.2f})"
+                    for key, data in fuzzy_found.items()
+                )
+                or "No fuzzy matches needed",
+                name="Fuzzy Matches",
+                attachment_type=allure.attachment_type.TEXT,
+            )
+
         with allure.step("Create comprehensive competition ID mapping"):
             # Combine all found competitions for mapping
             all_found_competitions = {**found_leagues, **found_tournaments}
 
             # Create a comprehensive mapping
             competition_id_mapping = {}
-            for key, data in all_found_competitions.items():
+            for key, data in {**fuzzy_found, **all_found_competitions}.items():
                 if data["id"]:  # Only add if ID exists in constants
                     competition_id_mapping[data["actual_name"]] = data["id"]
 
@@ -424,3 +397,18 @@ class TestCompetitions:
                 name="Query Parameter Result",
                 attachment_type=allure.attachment_type.TEXT,
             )
+
+    @allure.story("Competitions")
+    @allure.title("Competitions endpoint meets its latency budget")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.latency(endpoint="competitions", p95_ms=800, samples=20, concurrency=4)
+    def test_competitions_latency(self, request):
+        """
+        Test that the competitions endpoint responds within the agreed budget.
+        Sampling and the p95 check are done by the latency marker.
+        """
+        result = request.node.latency_result
+
+        assert (
+            result.kept
+        ), f"No successful latency samples collected:\n{result.summary()}"
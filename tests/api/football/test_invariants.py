@@ -0,0 +1,64 @@
+import copy
+
+import allure
+
+from api.football.invariants import check_standings
+from api.football.model import StandingsTable, StringTable
+from config.constants import TEST_COMPETITIONS
+
+
+@allure.feature("Football API Data Model")
+class TestStandingsInvariants:
+    """Offline checks of the vectorized standings invariants."""
+
+    def _tables(self, data, corrupt=None):
+        strings = StringTable()
+        tables = {}
+        for competition_id in TEST_COMPETITIONS.values():
+            payload = data.standings(competition_id)
+            if corrupt and competition_id in corrupt:
+                payload = copy.deepcopy(payload)
+                corrupt[competition_id](payload["standings"][0]["table"])
+            tables[competition_id] = StandingsTable.from_payload(payload, strings)
+        return tables
+
+    @allure.title("TC-I01: Consistent standings for every league pass")
+    def test_all_leagues_valid(self, synthetic_data):
+        report = check_standings(self._tables(synthetic_data(teams=10)))
+
+        assert report.valid, report.summary()
+        assert report.rows == 10 * len(TEST_COMPETITIONS)
+
+    @allure.title("TC-I02: Arithmetic violations are reported per row")
+    def test_arithmetic_violations(self, synthetic_data):
+        def corrupt(table):
+            table[2]["points"] -= 1
+            table[4]["lost"] += 1
+
+        serie_a = TEST_COMPETITIONS["serie_a"]
+        report = check_standings(
+            self._tables(synthetic_data(teams=10), {serie_a: corrupt})
+        )
+
+        found = {(v.source, v.row, v.invariant) for v in report.violations}
+        assert found == {(serie_a, 2, "points"), (serie_a, 4, "played_games")}
+
+    @allure.title("TC-I03: Position gaps and ordering are detected")
+    def test_order_violations(self, synthetic_data):
+        def corrupt(table):
+            table[0], table[5] = table[5], table[0]
+            table[0]["position"], table[5]["position"] = 1, 6
+            table[9]["position"] = 11
+
+        report = check_standings(
+            self._tables(
+                synthetic_data(teams=10), {TEST_COMPETITIONS["ligue_1"]: corrupt}
+            ),
+            invariants=["positions", "sort_order"],
+        )
+
+        assert [(v.invariant, v.row) for v in report.violations] == [
+            ("positions", 9),
+            ("sort_order", 1),
+            ("sort_order", 5),
+        ]
@@ -0,0 +1,54 @@
+import allure
+import pytest
+import requests
+
+from api.football.latency import discard_outliers, percentile, sample_endpoint
+
+
+@allure.feature("Football API Latency Budgets")
+class TestLatencySampling:
+    """Offline checks of the latency sampling statistics."""
+
+    @allure.title("TC-L01: Nearest-rank percentiles")
+    @pytest.mark.parametrize(
+        "percent, expected", [(0, 1), (25, 3), (50, 5), (90, 9), (95, 10), (100, 10)]
+    )
+    def test_percentile(self, percent, expected):
+        values = [7, 3, 10, 1, 5, 9, 2, 8, 4, 6]
+
+        assert percentile(values, percent) == expected
+        assert percentile([], percent) is None
+
+    @allure.title("TC-L02: Only slow values beyond the Tukey fence are discarded")
+    def test_discard_outliers(self):
+        values = [10, 11, 12, 13, 14, 15, 16, 17, 1, 90]
+
+        kept, outliers = discard_outliers(values, k=1.5)
+
+        # Q1 = 11, Q3 = 15, fence = 15 + 1.5 * 4 = 21
+        assert outliers == [90]
+        assert kept == [10, 11, 12, 13, 14, 15, 16, 17, 1]
+        assert discard_outliers(values, k=None) == (values, [])
+        assert discard_outliers([1, 100, 1000], k=1.5) == ([1, 100, 1000], [])
+
+    @allure.title("TC-L03: Failed warm-ups count towards the error rate")
+    def test_warmup_errors_counted(self, stub_api_client, monkeypatch):
+        attempt = stub_api_client._attempt
+        calls = []
+
+        def first_fails(*args, **kwargs):
+            calls.append(args)
+            if len(calls) == 1:
+                raise requests.exceptions.ConnectionError("injected")
+            return attempt(*args, **kwargs)
+
+        monkeypatch.setattr(stub_api_client, "_attempt", first_fails)
+
+        result = sample_endpoint(
+            "competitions", samples=3, warmup=1, client=stub_api_client
+        )
+
+        assert len(calls) == 4  # one attempt per request, never retried
+        assert result.warmup_errors == ["ConnectionError: injected"]
+        assert result.error_rate == pytest.approx(0.25)
+        assert result.violations({}, max_error_rate=0.1)
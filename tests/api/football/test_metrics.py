@@ -0,0 +1,43 @@
+import allure
+import pytest
+
+from api.football.metrics import LatencyHistogram, LatencyRecorder
+
+
+@allure.feature("Football API Latency Metrics")
+class TestLatencyMetrics:
+    """Offline checks of the latency histograms and their export."""
+
+    @allure.title("TC-LM01: Percentiles stay within the histogram precision")
+    def test_percentiles(self):
+        histogram = LatencyHistogram()
+        for ms in range(1, 1001):
+            histogram.record(ms / 1000)
+
+        assert histogram.count == 1000
+        assert histogram.percentile(50) == pytest.approx(500, rel=0.01)
+        assert histogram.percentile(99) == pytest.approx(990, rel=0.01)
+        assert histogram.percentile(100) == 1000
+
+    @allure.title("TC-LM02: Per-worker exports merge into exact run-wide histograms")
+    def test_exports_merge(self, tmp_path):
+        workers, combined = [LatencyRecorder(), LatencyRecorder()], LatencyRecorder()
+        for i in range(200):
+            seconds = (i % 37 + 1) / 100
+            workers[i % 2].record("/competitions", "total", seconds)
+            combined.record("/competitions", "total", seconds)
+        paths = [
+            worker.export_json(tmp_path / f"api-latency-gw{n}.json")
+            for n, worker in enumerate(workers)
+        ]
+
+        merged = LatencyRecorder.load_json(paths)
+
+        assert merged.summary() == combined.summary()
+        expected = combined.histogram("competitions").to_dict()
+        assert merged.histogram("competitions").to_dict() == expected
+
+    @allure.title("TC-LM03: Histograms of different precision are not merged")
+    def test_merge_precision_mismatch(self):
+        with pytest.raises(ValueError, match="precision"):
+            LatencyHistogram(8).merge(LatencyHistogram(6))
@@ -0,0 +1,52 @@
+import allure
+import numpy as np
+
+from api.football.model import MatchTable, StandingsTable, StringTable
+from api.football.schemas import MatchesResponse
+from config.constants import TEST_COMPETITIONS
+
+
+@allure.feature("Football API Data Model")
+class TestColumnarModel:
+    """Offline checks of the columnar match and standings tables."""
+
+    @allure.title("TC-M01: Match rows round-trip through the columns")
+    def test_match_table_rows(self, synthetic_data):
+        data = synthetic_data(teams=8, matchdays_played=10)
+        payload = data.matches([TEST_COMPETITIONS["serie_a"]], None)
+
+        table = MatchTable.from_payload(payload)
+
+        assert len(table) == payload["count"]
+        for row, match in zip(table, payload["matches"]):
+            assert row.id == match["id"]
+            assert row.status == match["status"]
+            assert row.home_team == match["homeTeam"]["name"]
+            assert row.home_goals == match["score"]["fullTime"]["home"]
+        assert table[-1].home_goals is None
+
+    @allure.title("TC-M02: Tables built from models share interned strings")
+    def test_shared_strings(self, synthetic_data):
+        data = synthetic_data(teams=8, matchdays_played=10)
+        competition_id = TEST_COMPETITIONS["bundesliga"]
+        payload = data.matches([competition_id], None)
+        strings = StringTable()
+
+        matches = MatchTable.from_payload(MatchesResponse(**payload), strings)
+        standings = StandingsTable.from_payload(data.standings(competition_id), strings)
+
+        assert len(strings) < len(matches)
+        assert np.isin(standings.team, matches.home_team).all()
+
+    @allure.title("TC-M03: Filtering by a string column")
+    def test_filter_finished(self, synthetic_data):
+        data = synthetic_data(teams=8, matchdays_played=10)
+        table = MatchTable.from_payload(
+            data.matches([TEST_COMPETITIONS["ligue_1"]], None)
+        )
+
+        finished = table.filter(table.status == table.code_of("FINISHED"))
+
+        assert len(finished) == 10 * 4
+        assert (finished.home_goals >= 0).all()
+        assert finished.nbytes < table.nbytes
@@ -0,0 +1,135 @@
+import json
+import time
+from email.utils import formatdate
+
+import allure
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from api.football import rate_limit
+from api.football.rate_limit import RetryPolicy, TokenBucket
+
+
+class FakeClock:
+    """Injected clock and sleeper; sleeping advances the clock."""
+
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def _bucket(clock, **kwargs):
+    return TokenBucket(clock=clock.time, sleep=clock.sleep, **kwargs)
+
+
+def _response(status=200, **headers):
+    response = requests.Response()
+    response.status_code = status
+    response.headers = CaseInsensitiveDict(headers)
+    return response
+
+
+@allure.feature("Football API Rate Limiting")
+class TestTokenBucket:
+    """Offline checks of the token bucket with a fake clock."""
+
+    @allure.title("TC-RL01: Burst is served at once, then paced at the rate")
+    def test_burst_then_paced(self, clock):
+        bucket = _bucket(clock, rate=2, capacity=3)
+
+        assert [bucket.acquire() for _ in range(3)] == [0, 0, 0]
+        assert bucket.acquire() == pytest.approx(0.5)
+        assert clock.sleeps == [pytest.approx(0.5)]
+
+    @allure.title("TC-RL02: Exhausted quota blocks, a low quota lowers the rate")
+    def test_update_from_headers(self, clock):
+        bucket = _bucket(clock, rate=10, capacity=1)
+
+        bucket.update_from_headers(
+            {"X-RateLimit-Requests-Remaining": "30", "X-RateLimit-Requests-Reset": "60"}
+        )
+        assert bucket._state["rate"] == pytest.approx(0.5)
+
+        bucket.update_from_headers(
+            {"X-RateLimit-Requests-Remaining": "0", "X-RateLimit-Requests-Reset": "7"}
+        )
+        assert bucket.acquire() == pytest.approx(7)
+
+    @allure.title("TC-RL03: State file is shared within a run, reset across runs")
+    def test_state_file_scoped_to_run(self, clock, tmp_path):
+        state_file = tmp_path / "bucket.json"
+        first = _bucket(
+            clock, rate=10, capacity=1, state_file=state_file, run_id="run-1"
+        )
+        first.block_for(300)
+        first.update_from_headers(
+            {"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "100"}
+        )
+
+        same_run = _bucket(
+            clock, rate=10, capacity=1, state_file=state_file, run_id="run-1"
+        )
+        assert same_run.acquire() == pytest.approx(300)
+
+        next_run = _bucket(
+            clock, rate=10, capacity=1, state_file=state_file, run_id="run-2"
+        )
+        assert next_run.acquire() == 0
+        state = json.loads(state_file.read_text())
+        assert state["run"] == "run-2"
+        assert state["blocked_until"] == 0
+        assert state["rate"] == 10
+
+
+@allure.feature("Football API Rate Limiting")
+class TestRetryPolicy:
+    """Offline checks of retry decisions and delays."""
+
+    @allure.title("TC-RL04: Retry-After is honored as seconds or HTTP date, capped")
+    def test_retry_after(self):
+        policy = RetryPolicy(max_retries=3, backoff_base=1, backoff_max=30)
+
+        assert policy.delay(0, _response(429, **{"Retry-After": "4"})) == 4
+        assert policy.delay(0, _response(429, **{"Retry-After": "120"})) == 30
+        http_date = formatdate(time.time() + 10, usegmt=True)
+        delay = policy.delay(0, _response(503, **{"Retry-After": http_date}))
+        assert 8 <= delay <= 10  # HTTP dates have whole-second precision
+
+    @allure.title("TC-RL05: Backoff grows exponentially up to backoff_max")
+    def test_backoff_ceiling(self, monkeypatch):
+        monkeypatch.setattr(rate_limit.random, "uniform", lambda low, high: high)
+        policy = RetryPolicy(max_retries=10, backoff_base=0.5, backoff_max=5)
+
+        assert [policy.delay(attempt) for attempt in range(6)] == [
+            0.5,
+            1,
+            2,
+            4,
+            5,
+            5,
+        ]
+
+    @allure.title("TC-RL06: Only idempotent methods are retried, up to max_retries")
+    def test_retry_decisions(self):
+        policy = RetryPolicy(max_retries=2, backoff_base=0, backoff_max=0)
+        unavailable = _response(503)
+
+        assert policy.should_retry(0, unavailable, "GET")
+        assert policy.should_retry(1, unavailable, "delete")
+        assert not policy.should_retry(2, unavailable, "GET")
+        assert not policy.should_retry(0, _response(404), "GET")
+        assert not policy.should_retry(0, unavailable, "POST")
+        assert not policy.can_retry(0, "PATCH")
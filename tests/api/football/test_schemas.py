@@ -0,0 +1,108 @@
+import copy
+import json
+
+import allure
+import pytest
+
+from api.football.schemas import (
+    CompetitionsTokenizer,
+    Match,
+    MatchesResponse,
+    StandingsResponse,
+    get_type_adapter,
+    get_validation_errors,
+    iter_competitions,
+    parse_competitions_string,
+    validate_many,
+    validate_payload,
+)
+from config.constants import TEST_COMPETITIONS
+
+
+@allure.feature("Football API Schemas")
+class TestSchemaValidation:
+    """Offline checks of the schema validation helpers."""
+
+    @allure.title("TC-V01: Raw JSON bytes validate in a single pass")
+    def test_validate_raw_bytes(self, synthetic_data):
+        payload = synthetic_data(teams=10).matches(
+            [TEST_COMPETITIONS["premier_league"]], None
+        )
+
+        result = validate_payload(json.dumps(payload).encode(), MatchesResponse)
+
+        assert result.valid, result.messages()
+        assert isinstance(result.value, MatchesResponse)
+        assert len(result.value.matches) == payload["count"]
+
+    @allure.title("TC-V02: Errors are reported with their location")
+    def test_structured_errors(self, synthetic_data):
+        data = synthetic_data(teams=10)
+        payload = copy.deepcopy(data.standings(TEST_COMPETITIONS["bundesliga"]))
+        payload["standings"][0]["table"][2]["goalDifference"] += 1
+
+        result = validate_payload(json.dumps(payload), StandingsResponse)
+
+        assert not result.valid
+        assert result.errors[0]["path"] == "standings.0.table.2.goalDifference"
+        assert result.errors[0]["type"] == "value_error"
+        assert get_validation_errors(payload, StandingsResponse) == result.messages()
+
+    @allure.title("TC-V03: TypeAdapters are built once per schema")
+    def test_type_adapter_is_cached(self):
+        assert get_type_adapter(MatchesResponse) is get_type_adapter(MatchesResponse)
+
+    @allure.title("TC-V04: Bulk validation reports failing record indices")
+    def test_validate_many(self, synthetic_data):
+        data = synthetic_data(teams=10)
+        competition_ids = list(TEST_COMPETITIONS.values())
+        matches = data.matches(competition_ids, None)["matches"]
+        matches[7]["status"] = "UNKNOWN"
+        del matches[-1]["utcDate"]
+
+        report = validate_many(matches, Match, workers=2, chunk_size=100)
+
+        assert report.total == len(matches)
+        assert report.invalid_indices == [7, len(matches) - 1]
+        assert report.errors[0]["path"] == "status"
+        assert report.errors[1]["type"] == "missing"
+        # The payload was a fresh copy: the generated season is unchanged
+        fresh = data.matches(competition_ids, None)["matches"]
+        assert fresh[7]["status"] != "UNKNOWN"
+        assert "utcDate" in fresh[-1]
+
+
+@allure.feature("Football API Schemas")
+class TestCompetitionsTokenizer:
+    """Offline checks of the competitions string tokenizer."""
+
+    @allure.title("TC-V08: Quoted names and escaped commas are single names")
+    def test_quotes_and_escapes(self):
+        text = '{Premier League , "Copa, Liga",Copa\\, Rey,,"  Padded "}'
+
+        assert parse_competitions_string(text) == [
+            "Premier League",
+            "Copa, Liga",
+            "Copa, Rey",
+            "  Padded ",
+        ]
+
+    @allure.title("TC-V09: Chunked bytes parse like the whole string")
+    def test_chunked_bytes_with_dedupe(self):
+        body = '{"Ligue 1",Série A,Bundesliga,Série A,"Ligue 1",Série A}'.encode()
+        tokenizer = CompetitionsTokenizer(dedupe=True)
+
+        names = list(
+            iter_competitions(
+                (body[i : i + 3] for i in range(0, len(body), 3)), tokenizer
+            )
+        )
+
+        assert names == ["Ligue 1", "Série A", "Bundesliga"]
+        assert tokenizer.duplicates == {"Ligue 1": 2, "Série A": 3}
+        assert tokenizer.total == 6
+
+    @allure.title("TC-V10: Unterminated lists are rejected")
+    def test_unterminated(self):
+        with pytest.raises(ValueError, match="Invalid competitions string format"):
+            parse_competitions_string('{Premier League,"Bundesliga}')
@@ -0,0 +1,79 @@
+import allure
+import pytest
+from http import HTTPStatus
+
+from api.football.model import MatchTable, StandingsTable, StringTable
+from api.football.standings import LeagueTable, tie_breaks_for
+from config.constants import STANDINGS_TIE_BREAKS, TEST_COMPETITIONS
+
+
+def _finished(home, away, home_goals, away_goals, match_id):
+    return {
+        "id": match_id,
+        "utcDate": "2024-08-16T19:00:00Z",
+        "status": "FINISHED",
+        "homeTeam": {"id": home, "name": f"Team {home}"},
+        "awayTeam": {"id": away, "name": f"Team {away}"},
+        "score": {"fullTime": {"home": home_goals, "away": away_goals}},
+    }
+
+
+@allure.feature("Football API Data Model")
+class TestStandingsRecomputation:
+    """Cross-check of API standings against tables recomputed from matches."""
+
+    @allure.title("TC-R01: Recomputed standings match the API for every competition")
+    @pytest.mark.parametrize("competition_id", TEST_COMPETITIONS.values())
+    def test_standings_match_results(self, stub_api_client, competition_id):
+        matches = stub_api_client._make_request(
+            "GET", "/matches", params={"competitions": competition_id}
+        )
+        standings = stub_api_client.get_standings(competition_id)
+        assert matches.status_code == standings.status_code == HTTPStatus.OK
+
+        strings = StringTable()
+        league = LeagueTable(STANDINGS_TIE_BREAKS["default"], strings)
+        league.update(MatchTable.from_payload(matches.json(), strings))
+        diffs = league.diff(StandingsTable.from_payload(standings.json(), strings))
+
+        assert not diffs, "\n".join(map(repr, diffs))
+
+    @allure.title("TC-R02: Matchday updates only apply new results")
+    def test_incremental_updates(self, stub_server):
+        payload = stub_server.data.matches([TEST_COMPETITIONS["serie_a"]], None)
+        matches = MatchTable.from_payload(payload)
+        full = LeagueTable()
+        full.update(matches)
+
+        incremental = LeagueTable(strings=matches.strings)
+        applied = [
+            incremental.update(matches.filter(matches.matchday <= matchday))
+            for matchday in range(1, int(matches.matchday.max()) + 1)
+        ]
+
+        assert applied == [10] * len(applied)
+        assert incremental.update(matches) == 0
+        assert not incremental.diff(full.to_standings())
+
+    @allure.title("TC-R03: Head-to-head tie-break orders teams level on points")
+    def test_head_to_head_tie_break(self):
+        # 1 and 2 both finish on 3 points; 2 has the better goal
+        # difference but lost the direct meeting
+        matches = MatchTable.from_payload(
+            {
+                "matches": [
+                    _finished(1, 2, 1, 0, 1),
+                    _finished(2, 3, 5, 0, 2),
+                    _finished(1, 4, 0, 1, 3),
+                    _finished(2, 4, 0, 1, 4),
+                ]
+            }
+        )
+
+        def ranked(tie_breaks):
+            league = LeagueTable(tie_breaks)
+            league.update(matches)
+            return [row.team_id for row in league.to_standings()]
+
+        assert ranked(STANDINGS_TIE_BREAKS["default"]) == [4, 2, 1, 3]
+        assert ranked(tie_breaks_for(TEST_COMPETITIONS["la_liga"])) == [4, 1, 2, 3]
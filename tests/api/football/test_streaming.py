@@ -0,0 +1,77 @@
+import copy
+import json
+
+import allure
+import pytest
+
+from api.football.schemas import Match, Team
+from api.football.streaming import iter_json_array, stream_validate
+from config.constants import TEST_COMPETITIONS
+
+
+@allure.feature("Football API Schemas")
+class TestStreamingValidation:
+    """Offline checks of record-by-record validation of saved responses."""
+
+    @allure.title("TC-V05: Saved MatchesResponse is validated record by record")
+    def test_stream_json_document(self, tmp_path, synthetic_data):
+        data = synthetic_data(teams=6)
+        payload = copy.deepcopy(data.matches([TEST_COMPETITIONS["ligue_1"]], None))
+        payload["matches"][4]["status"] = "UNKNOWN"
+        path = tmp_path / "matches.json"
+        path.write_text(json.dumps({"note": "[matches]", **payload}, indent=2))
+
+        results = list(stream_validate(path, Match, key="matches"))
+
+        assert len(results) == payload["count"]
+        assert [index for index, result in results if not result.valid] == [4]
+        assert results[0][1].value.id == payload["matches"][0]["id"]
+
+    @allure.title("TC-V06: NDJSON exports are validated line by line")
+    def test_stream_ndjson(self, tmp_path, synthetic_data):
+        teams = synthetic_data(teams=6).teams(TEST_COMPETITIONS["la_liga"])["teams"]
+        path = tmp_path / "teams.ndjson"
+        path.write_text("\n".join(json.dumps(team) for team in teams) + "\n\n")
+
+        results = list(stream_validate(path, Team))
+
+        assert len(results) == len(teams)
+        assert all(result.valid for _, result in results)
+
+    @allure.title("TC-V07: Brackets inside strings do not split records")
+    def test_brackets_in_strings(self, tmp_path):
+        path = tmp_path / "array.json"
+        path.write_text(json.dumps([{"name": "}{]["}, [1, {"a": 'say "]" \\'}], 3]))
+
+        records = [json.loads(record) for record in iter_json_array(path)]
+
+        assert records == [{"name": "}{]["}, [1, {"a": 'say "]" \\'}], 3]
+
+    @allure.title("TC-V11: Scalar elements keep their array indices")
+    def test_scalar_elements(self, tmp_path):
+        path = tmp_path / "mixed.json"
+        elements = [{"id": 1}, None, "a, ]b", -2.5e3, [], True, {"id": 2}]
+        path.write_text(json.dumps({"meta": [0], "items": elements}, indent=2))
+
+        records = [json.loads(record) for record in iter_json_array(path, "items")]
+        results = list(stream_validate(path, Team, key="items"))
+
+        assert records == elements
+        assert [index for index, result in results if result.valid] == []
+        assert [index for index, _ in results] == list(range(len(elements)))
+
+    @allure.title("TC-V12: A missing or unterminated array is an error")
+    def test_missing_array(self, tmp_path):
+        path = tmp_path / "response.json"
+        path.write_text(json.dumps({"count": 0, "teams": None, "nested": {"x": []}}))
+        truncated = tmp_path / "truncated.json"
+        truncated.write_text('{"teams": [{"id": 1}, {"id"')
+
+        with pytest.raises(ValueError, match='"matches" key'):
+            list(iter_json_array(path, "matches"))
+        with pytest.raises(ValueError, match='"teams" key'):
+            list(iter_json_array(path, "teams"))
+        with pytest.raises(ValueError, match="document"):
+            list(iter_json_array(path))
+        with pytest.raises(ValueError, match='"teams" key'):
+            list(iter_json_array(truncated, "teams"))
@@ -0,0 +1,210 @@
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import allure
+import pytest
+import requests
+from http import HTTPStatus
+
+from api.football.async_client import AsyncFootballAPIClient
+from api.football.client import FootballAPIClient
+from api.football.load import LoadReport, OpenLoopRunner, Scenario
+from api.football.rate_limit import RetryPolicy
+from api.football.schemas import (
+    MatchesResponse,
+    StandingsResponse,
+    TeamsResponse,
+    parse_competitions_string,
+    validate_response_schema,
+)
+from api.football.stub_server import (
+    LatencyDistribution,
+    StubConfig,
+    StubFootballServer,
+)
+from config.constants import TEST_COMPETITIONS
+from utils.shared_cache import SharedSnapshotCache
+
+
+def _read_shared_competitions(base_url, directory):
+    """One simulated xdist worker reading the competitions snapshot"""
+    cache = SharedSnapshotCache(directory)
+    try:
+        body = cache.get(
+            "competitions", lambda: requests.get(f"{base_url}/competitions").content
+        )
+        return len(body), body.readonly
+    finally:
+        cache.close()
+
+
+@allure.feature("Football API Stub Server")
+@pytest.mark.usefixtures("stub_credentials")
+class TestStubServer:
+    """Offline checks of the client layers against the local API stub."""
+
+    @allure.title("TC-S01: Stub serves the competitions string format")
+    def test_competitions_string(self, stub_api_client):
+        response = stub_api_client.get_competitions()
+
+        assert response.status_code == HTTPStatus.OK
+        competitions = parse_competitions_string(response.text)
+        assert "Premier League" in competitions
+        assert len(competitions) == 150
+
+    @allure.title("TC-S02: Stub JSON payloads match the response schemas")
+    @pytest.mark.parametrize(
+        "getter, schema",
+        [("get_teams", TeamsResponse), ("get_standings", StandingsResponse)],
+    )
+    def test_payloads_match_schemas(self, stub_api_client, getter, schema):
+        response = getattr(stub_api_client, getter)(TEST_COMPETITIONS["bundesliga"])
+
+        assert response.status_code == HTTPStatus.OK
+        assert validate_response_schema(response.json(), schema)
+
+    @allure.title("TC-S03: Standings are consistent with finished matches")
+    def test_standings_match_results(self, stub_api_client):
+        competition_id = TEST_COMPETITIONS["serie_a"]
+        matches = stub_api_client._make_request(
+            "GET", "/matches", params={"competitions": competition_id}
+        ).json()
+        table = stub_api_client.get_standings(competition_id).json()["standings"][0][
+            "table"
+        ]
+        validate_response_schema(matches, MatchesResponse)
+
+        goals = sum(
+            match["score"]["fullTime"]["home"] + match["score"]["fullTime"]["away"]
+            for match in matches["matches"]
+            if match["status"] == "FINISHED"
+        )
+        assert sum(row["goalsFor"] for row in table) == goals
+        assert [row["position"] for row in table] == list(range(1, len(table) + 1))
+        for row in table:
+            assert row["points"] == 3 * row["won"] + row["draw"]
+            assert row["playedGames"] == row["won"] + row["draw"] + row["lost"]
+
+    @allure.title("TC-S04: Unknown paths return 404")
+    def test_unknown_path(self, stub_api_client):
+        response = stub_api_client._make_request("GET", "/unknown")
+
+        assert response.status_code == HTTPStatus.NOT_FOUND
+        assert "message" in response.json()
+
+    @allure.title("TC-S05: Concurrent requests overlap their latency")
+    def test_async_gather_overlaps_latency(self):
+        config = StubConfig(latency=LatencyDistribution("fixed", ms=200))
+        # Every request's latency phase waits for all the others to reach
+        # it: only passes if all requests are in flight at the same time
+        all_in_flight = threading.Barrier(len(TEST_COMPETITIONS), timeout=10)
+        delays = []
+
+        def sleep(seconds):
+            delays.append(seconds)
+            all_in_flight.wait()
+
+        async def gather(base_url):
+            client = FootballAPIClient()
+            client.base_url = base_url
+            client.rate_limiter = None
+            client.retry_policy = RetryPolicy(max_retries=0)
+            async with AsyncFootballAPIClient(max_concurrency=8, client=client) as c:
+                return await c.gather_many("standings", TEST_COMPETITIONS.values())
+
+        with StubFootballServer(config, sleep=sleep) as server:
+            responses = asyncio.run(gather(server.base_url))
+
+        assert all(r.status_code == HTTPStatus.OK for r in responses.values())
+        assert delays == [0.2] * len(TEST_COMPETITIONS)
+
+    @allure.title("TC-S06: Retries recover from injected throttling")
+    def test_retries_recover_from_throttling(self):
+        # Retry-After: 0 lets the client retry at once, without a real wait
+        config = StubConfig(throttle_rate=0.3, retry_after=0, seed=7)
+
+        with StubFootballServer(config) as server:
+            client = FootballAPIClient()
+            client.base_url = server.base_url
+            client.rate_limiter = None
+            responses = [
+                client.get_competition_details(competition_id)
+                for competition_id in TEST_COMPETITIONS.values()
+            ]
+            served = server.requests["competition_details"]
+
+        assert all(r.status_code == HTTPStatus.OK for r in responses)
+        assert served > len(responses)  # some were throttled and retried
+
+    @allure.title("TC-S07: Open-loop load run against the stub")
+    def test_open_loop_load(self, stub_api_client):
+        scenario = Scenario({"competitions": 1, "standings": 1})
+
+        adapter = stub_api_client.session.get_adapter(stub_api_client.base_url)
+
+        report = OpenLoopRunner(
+            scenario, rate=50, duration=1, client=stub_api_client, seed=1
+        ).run()
+
+        assert report.completed == report.sent == 50
+        assert report.error_rate == 0
+        # The caller's client keeps its own connection pool
+        assert stub_api_client.session.get_adapter(stub_api_client.base_url) is adapter
+
+    @allure.title("TC-S08: Workers share one upstream fetch through the snapshot cache")
+    def test_shared_snapshot_single_fetch(self, tmp_path):
+        with StubFootballServer(
+            StubConfig(latency=LatencyDistribution("fixed", ms=200))
+        ) as server:
+            with ProcessPoolExecutor(max_workers=4) as pool:
+                results = list(
+                    pool.map(
+                        _read_shared_competitions,
+                        [server.base_url] * 4,
+                        [tmp_path] * 4,
+                    )
+                )
+
+        assert server.requests["competitions"] == 1
+        assert len({size for size, _ in results}) == 1
+        assert all(readonly for _, readonly in results)
+
+    @allure.title("TC-S09: Load runs count throttled requests as errors, unretried")
+    def test_open_loop_load_does_not_retry(self):
+        config = StubConfig(throttle_rate=0.5, seed=3)
+
+        with StubFootballServer(config) as server:
+            client = FootballAPIClient()
+            client.base_url = server.base_url
+            report = OpenLoopRunner(
+                Scenario({"competitions": 1}), rate=40, duration=1, client=client
+            ).run()
+            served = server.requests["competitions"]
+
+        assert report.completed == report.sent == served == 40
+        assert 0 < report.error_rate < 1
+
+    @allure.title("TC-S10: Unexpected exceptions in a load run are counted as errors")
+    def test_open_loop_load_unexpected_errors(self, stub_api_client, monkeypatch):
+        def broken(*args, **kwargs):
+            raise ValueError("injected")
+
+        monkeypatch.setattr(stub_api_client, "_attempt", broken)
+        report = OpenLoopRunner(
+            Scenario({"competitions": 1}), rate=20, duration=1, client=stub_api_client
+        ).run()
+
+        assert report.completed == report.sent == 20
+        assert report.errors == {"ValueError": 20}
+
+        def failing_record(self, *args):
+            raise KeyError("window")
+
+        monkeypatch.setattr(LoadReport, "record", failing_record)
+        report = OpenLoopRunner(
+            Scenario({"competitions": 1}), rate=20, duration=1, client=stub_api_client
+        ).run()
+
+        assert report.sent == 20
+        assert report.errors == {"KeyError": 20}
@@ -1,110 +1,53 @@
 """
-Pytest Configuration File - Central Fixture Definitions
+Pytest Configuration File - Shared Setup
+
+Fixtures live next to the tests that use them and are only loaded when
+that directory is collected:
+    tests/e2e/conftest.py - WebDriver and page object fixtures
+    tests/api/conftest.py - Football API client, stub server and hooks
+Keep this file free of heavy imports; tests/test_startup.py enforces an
+import time budget for collection.
 """
 
-import pytest
 import sys
 from pathlib import Path
 
-from config.driver import DriverFactory
-from config.config import Config
-from utils.gestures import Gestures
-from utils.helpers import Helpers
-from api.football.client import FootballAPIClient
-from config.api_config import APIConfig
-from config.constants import TEST_COMPETITIONS
-
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
 
-@pytest.fixture(scope="function")
-def driver():
-    """
-    Provides WebDriver instance for UI testing.
-    Creates new driver for each test and quits after test completion.
-    """
-    driver_instance = DriverFactory.get_driver()
-    yield driver_instance
-    driver_instance.quit()
-
-
-@pytest.fixture(scope="session")
-def env_config():
-    """
-    Loads and provides environment configuration settings.
-    """
-    config = Config.load_environment_config()
-    return {
-        "base_url": config.get("base_url", ""),
-    }
-
-
-@pytest.fixture
-def gestures(driver):
-    """
-    Provides gesture utilities for mobile/touch interactions.
-    """
-    return Gestures(driver)
-
-
-@pytest.fixture
-def helpers(driver):
-    """
-    Provides general helper utilities for test operations.
-    """
-    return Helpers(driver)
-
-
-@pytest.fixture
-def home_page(driver):
-    """
-    Provides HomePage page object for home page interactions.
-    """
-    from common.pages.home_page import HomePage
-
-    return HomePage(driver)
-
-
-@pytest.fixture
-def search_page(driver):
+def pytest_addoption(parser):
     """
-    Provides SearchPage page object for search functionality.
+    CLI layer of the UI settings (see config/config.py). Comma-separated
+    values run every combination in one session, e.g. --device-type desktop,mobile
     """
-    from common.pages.search_page import SearchPage
-
-    return SearchPage(driver)
-
+    group = parser.getgroup("environment", "Test environment settings")
+    group.addoption("--test-env", help="Section(s) of config/env.json (TEST_ENV)")
+    group.addoption("--browser", help="Browser(s) to run UI tests in (BROWSER)")
+    group.addoption("--device-type", help="desktop and/or mobile (DEVICE_TYPE)")
+    group.addoption("--headless", help="true and/or false (HEADLESS)")
 
-@pytest.fixture
-def streamer_page(driver):
-    """
-    Provides StreamerPage page object for streamer profile interactions.
-    """
-    from common.pages.streamer_page import StreamerPage
 
-    return StreamerPage(driver)
+def _worker_latency_reports():
+    from config.config import Config
 
+    return sorted(Config.REPORTS_DIR.glob("api-latency-gw*.json"))
 
-@pytest.fixture(scope="session")
-def api_client():
-    """
-    Provides Football API client for making API requests.
-    Single instance shared across all tests.
-    """
-    return FootballAPIClient()
 
+def pytest_sessionstart(session):
+    # xdist controller: drop per-worker latency files left by an earlier run
+    if not hasattr(session.config, "workerinput"):
+        for path in _worker_latency_reports():
+            path.unlink(missing_ok=True)
 
-@pytest.fixture(scope="session")
-def api_config():
-    """
-    Provides API configuration settings.
-    """
-    return APIConfig
 
+def pytest_sessionfinish(session):
+    # xdist controller: merge the workers' histograms into run-wide percentiles
+    if hasattr(session.config, "workerinput"):
+        return
+    reports = _worker_latency_reports()
+    if reports:
+        from api.football.metrics import LatencyRecorder
+        from config.config import Config
 
-@pytest.fixture
-def competitions():
-    """
-    Provides test data dictionary with competition IDs.
-    """
-    return TEST_COMPETITIONS
+        merged = LatencyRecorder.load_json(reports)
+        merged.export_json(Config.REPORTS_DIR / "api-latency.json")
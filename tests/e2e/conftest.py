@@ -0,0 +1,211 @@
+"""
+UI fixtures: WebDriver, page objects and gesture/helper utilities.
+
+Loaded by pytest only when tests under tests/e2e are collected. Selenium,
+page objects and utilities are imported inside the fixtures that need
+them.
+"""
+
+import os
+import sys
+
+import allure
+import pytest
+
+from config.config import Config
+from config.constants import DRIVER_POOL_PREWARM
+
+
+def _option_values(config, name):
+    value = config.getoption(name)
+    return (
+        [part.strip() for part in value.split(",") if part.strip()] if value else None
+    )
+
+
+def _settings_matrix(config):
+    """Resolved settings for every combination of the CLI options"""
+    return Config.matrix(
+        envs=_option_values(config, "test_env"),
+        browsers=_option_values(config, "browser"),
+        device_types=_option_values(config, "device_type"),
+        headless=_option_values(config, "headless"),
+    )
+
+
+def pytest_generate_tests(metafunc):
+    """
+    Runs every UI test once per settings combination when the CLI options
+    list several values; single combinations keep the plain test IDs.
+    """
+    if "settings" not in metafunc.fixturenames:
+        return
+    matrix = _settings_matrix(metafunc.config)
+    if len(matrix) > 1:
+        metafunc.parametrize(
+            "settings",
+            matrix,
+            ids=[settings.id for settings in matrix],
+            indirect=True,
+            scope="session",
+        )
+
+
+@pytest.fixture(scope="session")
+def settings(request):
+    """
+    Provides the resolved settings (defaults, env.json, env vars, CLI)
+    for the current matrix combination.
+    """
+    if hasattr(request, "param"):
+        return request.param
+    return _settings_matrix(request.config)[0]
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(session, config, items):
+    """
+    Starts browsers in the background for every settings combination the
+    selected tests need, so they are ready before the first test runs.
+    Runs after -k/-m deselection so only tests that will run count.
+    """
+    if config.option.collectonly:
+        return
+    needed = {}
+    for item in items:
+        if "driver" in getattr(item, "fixturenames", ()):
+            callspec = getattr(item, "callspec", None)
+            settings = (
+                callspec.params["settings"]
+                if callspec and "settings" in callspec.params
+                else _settings_matrix(config)[0]
+            )
+            needed[settings] = needed.get(settings, 0) + 1
+    if not needed:
+        return
+
+    from config.driver import DriverFactory
+
+    for settings, tests in needed.items():
+        count = int(os.getenv("DRIVER_POOL_PREWARM", DRIVER_POOL_PREWARM))
+        DriverFactory.prewarm(settings, min(count, tests))
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_teardown(item, nextitem):
+    """
+    After the last test (of this worker) no browser will be acquired
+    again, so recycling one on release must not start a replacement.
+    Runs before the driver fixture's teardown releases the browser.
+    """
+    driver_module = sys.modules.get("config.driver")
+    if nextitem is None and driver_module is not None:
+        driver_module.DriverFactory.stop_replenishing()
+
+
+def pytest_sessionfinish(session):
+    """Quits browsers of pools that were never used (e.g. deselected tests)"""
+    driver_module = sys.modules.get("config.driver")
+    if driver_module is not None:
+        driver_module.DriverFactory.close_pools()
+
+
+@pytest.fixture(scope="session")
+def driver_pool(settings):
+    """
+    Provides warm browsers for the current settings combination, one pool
+    per session (per worker under xdist). Reports wait time and occupancy
+    and quits the browsers when the combination is done.
+    """
+    from config.driver import DriverFactory
+
+    pool = DriverFactory.pool(settings)
+    yield pool
+
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    report_name = f"driver-pool-{settings.id}{f'-{worker}' if worker else ''}.json"
+    report_path = pool.export_json(Config.REPORTS_DIR / report_name)
+    with allure.step("Driver pool summary"):
+        allure.attach(
+            pool.summary(),
+            name="Driver Pool",
+            attachment_type=allure.attachment_type.TEXT,
+        )
+        allure.attach.file(
+            str(report_path),
+            name="Driver Pool Metrics",
+            attachment_type=allure.attachment_type.JSON,
+        )
+    DriverFactory.close_pool(settings)
+
+
+@pytest.fixture(scope="function")
+def driver(driver_pool):
+    """
+    Provides WebDriver instance for UI testing.
+    Borrows a browser from the pool and resets it (tabs, cookies, storage,
+    about:blank) after the test; crashed browsers are replaced.
+    """
+    driver_instance = driver_pool.acquire()
+    yield driver_instance
+    driver_pool.release(driver_instance)
+
+
+@pytest.fixture(scope="session")
+def env_config(settings):
+    """
+    Provides environment configuration settings.
+    """
+    return {
+        "base_url": settings.base_url,
+    }
+
+
+@pytest.fixture
+def gestures(driver):
+    """
+    Provides gesture utilities for mobile/touch interactions.
+    """
+    from utils.gestures import Gestures
+
+    return Gestures(driver)
+
+
+@pytest.fixture
+def helpers(driver):
+    """
+    Provides general helper utilities for test operations.
+    """
+    from utils.helpers import Helpers
+
+    return Helpers(driver)
+
+
+@pytest.fixture
+def home_page(driver):
+    """
+    Provides HomePage page object for home page interactions.
+    """
+    from common.pages.home_page import HomePage
+
+    return HomePage(driver)
+
+
+@pytest.fixture
+def search_page(driver):
+    """
+    Provides SearchPage page object for search functionality.
+    """
+    from common.pages.search_page import SearchPage
+
+    return SearchPage(driver)
+
+
+@pytest.fixture
+def streamer_page(driver):
+    """
+    Provides StreamerPage page object for streamer profile interactions.
+    """
+    from common.pages.streamer_page import StreamerPage
+
+    return StreamerPage(driver)
@@ -0,0 +1,86 @@
+import json
+import os
+
+import allure
+import pytest
+
+from config.driver import ChromeDriverResolver
+
+
+def _fake_chromedriver(directory, version):
+    """Executable answering --version like chromedriver"""
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / "chromedriver"
+    path.write_text(
+        f"#!/bin/sh\necho 'ChromeDriver {version} (abc-refs/branch-heads)'\n"
+    )
+    path.chmod(0o755)
+    return str(path)
+
+
+def _no_download():
+    raise AssertionError("resolver must not download")
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    return tmp_path / "cache" / "chromedriver.json"
+
+
+@allure.feature("Test Framework")
+@pytest.mark.skipif(os.name == "nt", reason="uses a shell script as chromedriver")
+class TestChromeDriverResolver:
+    """Offline chromedriver resolution."""
+
+    @allure.title("TC-CD01: Pinned path is used as is")
+    def test_pinned_path(self, tmp_path, manifest):
+        pinned = _fake_chromedriver(tmp_path / "pinned", "99.0.1.2")
+        resolver = ChromeDriverResolver(
+            manifest,
+            pinned_path=pinned,
+            chrome_version="120.0.6099.109",
+            downloader=_no_download,
+        )
+
+        assert resolver.resolve() == pinned
+        assert not manifest.exists()
+
+    @allure.title("TC-CD02: Matching chromedriver on PATH is recorded and reused")
+    def test_path_recorded_in_manifest(self, tmp_path, manifest, monkeypatch):
+        on_path = _fake_chromedriver(tmp_path / "bin", "120.0.6099.71")
+        monkeypatch.setenv("PATH", str(tmp_path / "bin"))
+        resolver = ChromeDriverResolver(
+            manifest, chrome_version="120.0.6099.109", downloader=_no_download
+        )
+        assert resolver.resolve() == on_path
+        assert json.loads(manifest.read_text())["120"]["source"] == "path"
+
+        # Later session: PATH no longer has it, the manifest does
+        monkeypatch.setenv("PATH", str(tmp_path / "empty"))
+        resolver = ChromeDriverResolver(
+            manifest, chrome_version="120.0.6099.109", downloader=_no_download
+        )
+        assert resolver.resolve() == on_path
+
+    @allure.title("TC-CD03: Version mismatch downloads online and fails offline")
+    def test_mismatch(self, tmp_path, manifest, monkeypatch):
+        _fake_chromedriver(tmp_path / "bin", "119.0.6045.105")
+        monkeypatch.setenv("PATH", str(tmp_path / "bin"))
+
+        offline = ChromeDriverResolver(
+            manifest,
+            offline=True,
+            chrome_version="120.0.6099.109",
+            downloader=_no_download,
+        )
+        with pytest.raises(RuntimeError, match="downloads are disabled"):
+            offline.resolve()
+
+        downloaded = _fake_chromedriver(tmp_path / "wdm", "120.0.6099.109")
+        online = ChromeDriverResolver(
+            manifest, chrome_version="120.0.6099.109", downloader=lambda: downloaded
+        )
+        assert online.resolve() == downloaded
+        assert json.loads(manifest.read_text())["120"]["driver_version"] == (
+            "120.0.6099.109"
+        )
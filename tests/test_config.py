@@ -0,0 +1,88 @@
+import json
+import os
+
+import allure
+import pytest
+
+from config.config import Config
+
+
+@pytest.fixture
+def env_file(tmp_path, monkeypatch):
+    path = tmp_path / "env.json"
+    path.write_text(
+        json.dumps(
+            {
+                "e2e": {"base_url": "https://e2e.example/", "device_type": "mobile"},
+                "staging": {"base_url": "https://staging.example/"},
+            }
+        )
+    )
+    monkeypatch.setattr(Config, "ENV_FILE", path)
+    for name in ("TEST_ENV", "BASE_URL", "BROWSER", "DEVICE_TYPE", "HEADLESS"):
+        monkeypatch.delenv(name, raising=False)
+    return path
+
+
+@allure.feature("Test Framework")
+class TestConfig:
+    """Layered, memoized settings resolution."""
+
+    @allure.title("TC-CF01: Later layers override earlier ones")
+    def test_layer_precedence(self, env_file, monkeypatch):
+        settings = Config.resolve()
+        assert settings.base_url == "https://e2e.example/"
+        assert settings.device_type == "mobile"  # env.json over defaults
+        assert settings.browser == "chrome" and not settings.headless
+
+        monkeypatch.setenv("DEVICE_TYPE", "desktop")
+        monkeypatch.setenv("HEADLESS", "true")
+        assert Config.resolve().device_type == "desktop"  # env var over env.json
+        assert Config.resolve().headless
+
+        assert Config.resolve(device_type="mobile").device_type == "mobile"  # CLI
+
+    @allure.title("TC-CF02: Resolution is memoized until an input changes")
+    def test_memoized(self, env_file):
+        first = Config.resolve()
+        assert Config.resolve() is first
+
+        env_file.write_text(json.dumps({"e2e": {"base_url": "https://new.example/"}}))
+        stat = env_file.stat()
+        os.utime(env_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert Config.resolve().base_url == "https://new.example/"
+
+    @allure.title("TC-CF03: Matrix covers every combination in-process")
+    def test_matrix(self, env_file):
+        matrix = Config.matrix(
+            envs=["e2e", "staging"], device_types=["desktop", "mobile"]
+        )
+
+        assert [settings.id for settings in matrix] == [
+            "e2e-chrome-desktop",
+            "e2e-chrome-mobile",
+            "staging-chrome-desktop",
+            "staging-chrome-mobile",
+        ]
+        assert matrix[2].base_url == "https://staging.example/"
+        assert Config.matrix() == [Config.resolve()]
+
+    @allure.title("TC-CF04: Settings compare by their resolved values")
+    def test_value_equality(self, env_file):
+        explicit = Config.resolve(headless="false", browser="Chrome")
+
+        assert explicit is not Config.resolve()
+        assert explicit == Config.resolve()
+        assert len({explicit, Config.resolve()}) == 1
+        assert Config.resolve(headless=True) != Config.resolve()
+
+    @allure.title("TC-CF05: A missing env.json or base_url is an error")
+    def test_missing_environment(self, env_file, monkeypatch):
+        with pytest.raises(ValueError, match="No base_url for environment 'prod'"):
+            Config.resolve("prod")
+        monkeypatch.setenv("BASE_URL", "https://prod.example/")
+        assert Config.resolve("prod").base_url == "https://prod.example/"
+
+        monkeypatch.setattr(Config, "ENV_FILE", env_file.with_name("missing.json"))
+        with pytest.raises(FileNotFoundError, match="missing.json"):
+            Config.resolve()
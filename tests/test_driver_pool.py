@@ -0,0 +1,173 @@
+import threading
+
+import allure
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from config.config import Config
+from config.driver import DriverPool
+
+
+class FakeDriver:
+    """Records the calls DriverPool makes on a browser."""
+
+    def __init__(self):
+        self.handles = ["main"]
+        self.calls = []
+        self.crashed = False
+        self.quit_called = False
+
+    @property
+    def window_handles(self):
+        if self.crashed:
+            raise WebDriverException("session deleted")
+        return list(self.handles)
+
+    @property
+    def switch_to(self):
+        return self
+
+    def window(self, handle):
+        self.current = handle
+
+    def close(self):
+        self.handles.remove(self.current)
+
+    def execute_script(self, script):
+        self.calls.append("storage")
+
+    def delete_all_cookies(self):
+        self.calls.append("cookies")
+
+    def get(self, url):
+        self.calls.append(url)
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def pool():
+    created = []
+
+    def factory(settings):
+        created.append(FakeDriver())
+        return created[-1]
+
+    pool = DriverPool(Config.resolve(), max_uses=3, factory=factory)
+    pool.created_drivers = created
+    yield pool
+    pool.close()
+
+
+@allure.feature("Test Framework")
+class TestDriverPool:
+    """Browser reuse, reset and recycling."""
+
+    @allure.title("TC-DP01: Released browsers are reset and reused")
+    def test_reuse_and_reset(self, pool):
+        driver = pool.acquire()
+        driver.handles.append("popup")
+        pool.release(driver)
+
+        assert driver.handles == ["main"]
+        assert driver.calls == ["storage", "cookies", "about:blank"]
+        assert pool.acquire() is driver
+        assert pool.created == 1
+
+    @allure.title("TC-DP02: Browsers are recycled after max uses")
+    def test_recycle_after_max_uses(self, pool):
+        first = pool.acquire()
+        for _ in range(2):
+            pool.release(first)
+            assert pool.acquire() is first
+        pool.release(first)
+
+        assert first.quit_called
+        assert pool.acquire() is not first
+        assert pool.created == 2
+
+    @allure.title("TC-DP03: Crashed browsers are replaced")
+    def test_crashed_browser_replaced(self, pool):
+        driver = pool.acquire()
+        pool.release(driver)
+        driver.crashed = True
+
+        replacement = pool.acquire()
+        assert replacement is not driver
+        assert driver.quit_called
+
+        replacement.crashed = True
+        pool.release(replacement)
+        assert replacement.quit_called and pool.idle == 0
+
+    @allure.title("TC-DP04: Pre-warmed browsers take startup off the critical path")
+    def test_prewarm(self):
+        gate = threading.Event()
+        events = []
+
+        def gated_factory(settings):
+            gate.wait()
+            events.append("started")
+            return FakeDriver()
+
+        pool = DriverPool(Config.resolve(), factory=gated_factory)
+        pool.prewarm(2)
+        acquired = []
+
+        def acquire():
+            acquired.append(pool.acquire())
+            events.append("acquired")
+
+        waiter = threading.Thread(target=acquire)
+        waiter.start()  # blocks on the in-flight starts, starts no browser itself
+        gate.set()
+        waiter.join()
+        second = pool.acquire()
+        pool.release(acquired[0])
+        pool.release(second)
+        stats = pool.stats()
+        pool.close()
+
+        assert events[0] == "started"
+        assert sorted(events) == ["acquired", "started", "started"]
+        assert acquired[0] is not second
+        assert stats["created"] == stats["prewarmed"] == 2
+        assert stats["peak_leased"] == 2
+        assert 0 < stats["occupancy"] <= 1
+        assert "2 pre-warmed" in pool.summary()
+
+    @allure.title("TC-DP05: close() waits for browsers still starting and quits them")
+    def test_close_waits_for_starting(self):
+        gate = threading.Event()
+        started = []
+
+        def gated_factory(settings):
+            gate.wait()
+            started.append(FakeDriver())
+            return started[-1]
+
+        pool = DriverPool(Config.resolve(), factory=gated_factory)
+        pool.prewarm(1)
+        closer = threading.Thread(target=pool.close)
+        closer.start()
+        gate.set()
+        closer.join()
+
+        assert len(started) == 1 and started[0].quit_called
+        assert pool.idle == 0 and pool.prewarmed == 0
+
+    @allure.title("TC-DP06: Recycled browsers are not replaced after the last test")
+    def test_no_replenish_after_stop(self, pool):
+        pool.max_uses = 1
+        pool.prewarm(1)
+        first = pool.acquire()
+        pool.release(first)  # recycled and replaced
+        second = pool.acquire()
+        pool.stop_replenishing()
+        pool.release(second)
+        pool.close()
+
+        assert first.quit_called and second.quit_called
+        assert pool.created_drivers == [first, second]  # close() waited for any start
+        assert pool.prewarmed == pool.recycled == 2
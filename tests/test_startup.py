@@ -0,0 +1,100 @@
+"""
+Startup benchmark: collecting the UI suite must stay cheap.
+
+Runs `pytest --collect-only tests/e2e` under `python -X importtime` in a
+subprocess without RAPIDAPI_KEY and checks the total import time and
+that the API stack and Selenium are not imported during collection.
+
+Run explicitly (testpaths only covers tests/e2e):
+    pytest tests/test_startup.py
+"""
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import allure
+import pytest
+
+from config.constants import STARTUP_DEFERRED_MODULES, STARTUP_IMPORT_BUDGET_MS
+
+ROOT = Path(__file__).resolve().parent.parent
+_IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def _collect_import_times(target: str):
+    """Self and cumulative import time (us) per module while collecting target"""
+    env = {key: value for key, value in os.environ.items() if key != "RAPIDAPI_KEY"}
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-m",
+            "pytest",
+            "--collect-only",
+            "-q",
+            "-s",  # stderr capture would swallow the importtime report
+            "-p",
+            "no:cacheprovider",
+            target,
+        ],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, f"Collection failed:\n{result.stdout[-2000:]}"
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if match:
+            modules[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    return modules
+
+
+@pytest.fixture(scope="module")
+def import_times():
+    """Import times of one UI collection, shared by the checks below"""
+    return _collect_import_times("tests/e2e")
+
+
+@allure.feature("Test Framework")
+class TestStartup:
+    """Import cost of collecting the UI suite."""
+
+    @allure.title("TC-ST01: UI collection stays within the import time budget")
+    def test_import_time_budget(self, import_times):
+        budget_ms = float(
+            os.getenv("STARTUP_IMPORT_BUDGET_MS", STARTUP_IMPORT_BUDGET_MS)
+        )
+        total_ms = sum(own for own, _ in import_times.values()) / 1000
+        slowest = sorted(import_times.items(), key=lambda item: -item[1][1])[:15]
+
+        allure.attach(
+            f"Total import time: {total_ms:.1f} ms (budget {budget_ms:.0f} ms)\n\n"
+            + "\n".join(
+                f"{cumulative / 1000:8.1f} ms  {name}"
+                for name, (_, cumulative) in slowest
+            ),
+            name="Import Times",
+            attachment_type=allure.attachment_type.TEXT,
+        )
+        assert (
+            total_ms <= budget_ms
+        ), f"Collecting tests/e2e imported for {total_ms:.1f} ms (budget {budget_ms:.0f} ms)"
+
+    @allure.title("TC-ST02: UI collection defers the API stack and Selenium")
+    def test_heavy_modules_deferred(self, import_times):
+        imported = sorted(
+            name
+            for name in import_times
+            if any(
+                name == module or name.startswith(module + ".")
+                for module in STARTUP_DEFERRED_MODULES
+            )
+        )
+        assert not imported, f"Imported while collecting tests/e2e: {imported}"
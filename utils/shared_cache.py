@@ -0,0 +1,87 @@
+"""
+Run-wide snapshot cache shared by pytest-xdist workers.
+
+The first worker to ask for a key produces its bytes under an exclusive
+file lock and publishes them as an immutable snapshot file (written to
+a temporary name, then renamed). Every worker, including the producer,
+then memory-maps the snapshot read-only and gets a memoryview of it,
+so the data is fetched once per run and never copied per worker.
+"""
+
+import mmap
+import os
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict
+
+try:
+    import fcntl
+except ImportError:  # Windows: workers may each produce, publishing stays atomic
+    fcntl = None
+
+
+class SharedSnapshotCache:
+    """
+    Snapshot files in a directory shared by every worker of a run.
+
+    Args:
+        directory: Directory visible to all workers (e.g. the xdist base temp)
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._views: Dict[str, memoryview] = {}
+        self._maps: Dict[str, mmap.mmap] = {}
+
+    def _path(self, key: str, suffix: str) -> Path:
+        return self.directory / (re.sub(r"[^A-Za-z0-9_.-]", "_", key) + suffix)
+
+    @contextmanager
+    def _lock(self, key: str):
+        if fcntl is None:
+            yield
+            return
+        with open(self._path(key, ".lock"), "a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def get(self, key: str, produce: Callable[[], bytes]) -> memoryview:
+        """
+        Read-only view of the snapshot for key, producing it if no worker
+        has yet. If produce raises, nothing is published and the next
+        caller tries again.
+        """
+        view = self._views.get(key)
+        if view is not None:
+            return view
+
+        path = self._path(key, ".snapshot")
+        if not path.exists():
+            with self._lock(key):
+                if not path.exists():
+                    tmp_path = self._path(key, f".{os.getpid()}.tmp")
+                    tmp_path.write_bytes(produce())
+                    os.replace(tmp_path, path)
+
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                view = memoryview(b"")
+            else:
+                self._maps[key] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                view = memoryview(self._maps[key])
+        self._views[key] = view
+        return view
+
+    def close(self) -> None:
+        """Release the views and mappings held by this worker"""
+        for view in self._views.values():
+            view.release()
+        for mapped in self._maps.values():
+            mapped.close()
+        self._views.clear()
+        self._maps.clear()
@@ -0,0 +1,20 @@
+"""
+Nearest-rank percentiles shared by the latency sampler, the latency
+histograms and the driver pool metrics.
+"""
+
+import math
+from typing import Iterable, Optional
+
+
+def nearest_rank(percent: float, count: int) -> int:
+    """1-based rank of the value at percent among count ordered values"""
+    return max(1, math.ceil(percent / 100 * count))
+
+
+def percentile(values: Iterable[float], percent: float) -> Optional[float]:
+    """Nearest-rank percentile of values in any order, None if there are none"""
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    return ordered[nearest_rank(percent, len(ordered)) - 1]